@@ -103,9 +103,14 @@ class CircuitBreaker():
         # Returns 0 if not Open or if time_opened is unknown.
         if self.state != CircuitBreaker.OPEN_STATE or self.time_opened is None:
             return 0
-        now = int(datetime.datetime.now().timestamp())
+        now = self._now()
         return max(0, self.duration_until_half_opened - (now - self.time_opened))
 
+    def _now(self) -> int:
+        # Current wall-clock time in whole seconds, the unit of time_opened.
+        # Looked up on the instance, so tests can replace it with a fake clock.
+        return int(datetime.datetime.now().timestamp())
+
     def __get_failure_rate(self) -> float:
         # Private helper: compute current failure rate for Closed counters.
         total = self.success + self.error
@@ -132,7 +137,7 @@ class CircuitBreaker():
         
         if should_be_open:
             self.state = CircuitBreaker.OPEN_STATE
-            self.time_opened = int(datetime.datetime.now().timestamp())
+            self.time_opened = self._now()
             return False, None, RuntimeError("Circuit Breaker is in the Open State, no calls allowed.")
 
         try:
@@ -148,7 +153,7 @@ class CircuitBreaker():
         # Execute callable while in Open state.
         # - If cool-down elapsed, switch to Half-Open and delegate there.
         # - Otherwise fail fast with an Open-state error.
-        now = int(datetime.datetime.now().timestamp())
+        now = self._now()
         should_be_half_open = (now - self.time_opened) >= self.duration_until_half_opened
         
         if should_be_half_open:
@@ -176,7 +181,7 @@ class CircuitBreaker():
                 return self.__handle_closed(function, *args, **kwargs)
             else:
                 self.state = CircuitBreaker.OPEN_STATE
-                self.time_opened = int(datetime.datetime.now().timestamp())
+                self.time_opened = self._now()
                 return False, None, RuntimeError("Circuit Breaker in open state, no requests allowed.")
 
         try:
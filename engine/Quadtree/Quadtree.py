@@ -10,7 +10,7 @@ import heapq
 # - Leaves store a list of points (x, y, data) up to max_points.
 # - When a leaf is full and a new point is inserted, it subdivides into 4 quadrants
 #   (BL, BR, TL, TR) and redistributes existing points.
-# - Internal nodes do not store points themselves; only their children do.
+# - Internal nodes do not store points themselves (points is None); only their children do.
 #
 # Coordinates & Boundaries
 # - The right and top edges are exclusive: a point at (width, y) or (x, height) is out of bounds.
@@ -43,8 +43,11 @@ class Node:
         self.y = y
         self.width = width
         self.height = height
+        # Midpoint of the region, precomputed so descents don't recompute it per level
+        self.mx = x + width / 2.0
+        self.my = y + height / 2.0
         # Points stored at this node (only for leaves)
-        self.points: List[Tuple[float, float, Any]] = points or []
+        self.points: Optional[List[Tuple[float, float, Any]]] = points or []
         self.is_leaf = is_leaf
         # Children order: [BL, BR, TL, TR]
         self.children: List[Optional['Node']] = children or [None, None, None, None]  # BL, BR, TL, TR
@@ -54,13 +57,10 @@ class Node:
         return (self.x <= px < self.x + self.width) and (self.y <= py < self.y + self.height)
 
     def quadrant(self, px: float, py: float) -> int:
-        # Determine which child quadrant a point belongs to relative to this node
-        mx = self.x + self.width / 2.0
-        my = self.y + self.height / 2.0
-        if py >= my:
-            return 2 if px < mx else 3  # TL, TR
-        else:
-            return 0 if px < mx else 1  # BL, BR
+        # Determine which child quadrant a point belongs to relative to this node.
+        # Bit 0 selects right (BR/TR), bit 1 selects top (TL/TR). The tree's own
+        # insert/query/delete inline this expression instead of calling the method.
+        return (px >= self.mx) | ((py >= self.my) << 1)
 
     def subdivide(self) -> None:
         # Create four children covering equal subregions and mark this node as internal
@@ -72,6 +72,8 @@ class Node:
         tr = Node(self.x + hw,      self.y + hh,      hw, hh)
         self.children = [bl, br, tl, tr]
         self.is_leaf = False
+        # Internal nodes never hold points; the caller redistributes the old bucket
+        self.points = None
 
 class Quadtree():
     def __init__(self, width: float, height: float, max_points: int):
@@ -81,6 +83,9 @@ class Quadtree():
         self.height = float(height)
         self.max_points = max_points
         self.root = Node(x=0.0, y=0.0, width=self.width, height=self.height)
+        # Root bounds never change after construction; cache them for the inline bounds check
+        self._x_max = self.width
+        self._y_max = self.height
 
     def validate_inputs(self, width, height, max_points):
         # Enforce positive dimensions and a positive integer capacity per leaf
@@ -93,7 +98,7 @@ class Quadtree():
 
     def insert(self, x: float, y: float, data: Any = None) -> bool:
         # Insert a point into the quadtree; returns False if out of bounds
-        if not self.root.contains(x, y):
+        if not (0.0 <= x < self._x_max and 0.0 <= y < self._y_max):
             return False
 
         def dfs(node: Node, px: float, py: float, payload: Any) -> None:
@@ -101,16 +106,18 @@ class Quadtree():
                 if len(node.points) < self.max_points:
                     node.points.append((px, py, payload))
                     return
-                # Split and redistribute existing points
-                node.subdivide()
+                # Split and redistribute existing points. A full leaf holds exactly
+                # max_points, so each child bucket fits without a further split.
                 old_points = node.points
-                node.points = []
-                for ox, oy, od in old_points:
-                    idx = node.quadrant(ox, oy)
-                    dfs(node.children[idx], ox, oy, od)
+                node.subdivide()
+                mx, my = node.mx, node.my
+                buckets = [[], [], [], []]
+                for p in old_points:
+                    buckets[(p[0] >= mx) | ((p[1] >= my) << 1)].append(p)
+                for child, bucket in zip(node.children, buckets):
+                    child.points = bucket
             # Descend to the appropriate child for the new point
-            idx = node.quadrant(px, py)
-            dfs(node.children[idx], px, py, payload)
+            dfs(node.children[(px >= node.mx) | ((py >= node.my) << 1)], px, py, payload)
 
         dfs(self.root, x, y, data)
         return True
@@ -120,14 +127,14 @@ class Quadtree():
         # Returns True if any point was removed, False otherwise. Performs upward
         # condensation: if a parent's children are all leaves and their total points fit
         # in max_points, merges them into the parent leaf.
-        if not self.root.contains(x, y):
+        if not (0.0 <= x < self._x_max and 0.0 <= y < self._y_max):
             return False
 
         path = []
         node = self.root
 
         while not node.is_leaf:
-            idx = node.quadrant(x, y)
+            idx = (x >= node.mx) | ((y >= node.my) << 1)
             child = node.children[idx] if idx < len(node.children) else None
             if not child:
                 break
@@ -161,12 +168,12 @@ class Quadtree():
 
     def query(self, x: int, y: int):
         # Return the points stored in the leaf covering (x, y), or None if out of bounds.
-        if not self.root.contains(x, y):
+        if not (0.0 <= x < self._x_max and 0.0 <= y < self._y_max):
             return None
     
         node = self.root
         while not node.is_leaf:
-            idx = node.quadrant(x, y)
+            idx = (x >= node.mx) | ((y >= node.my) << 1)
             if len(node.children) <= idx or not node.children[idx]:
                 break
             node = node.children[idx]
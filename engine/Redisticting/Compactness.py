@@ -1,8 +1,10 @@
 import math
 
+_FOUR_PI = 4.0 * math.pi
+
 def polsby_popper(area: float, perimeter: float):
     assert area > 0 and perimeter > 0, "area and perimeter must be greater than 0 for polsby popper"
-    return (4 * math.pi * area) / math.pow(perimeter, 2)
+    return (_FOUR_PI * area) / (perimeter * perimeter)
 
 def reock(area: float, smallest_bounding_circle_area: float):
     if area < 0 or smallest_bounding_circle_area < 0:
@@ -13,7 +13,9 @@
 #
 # Provides:
 # - push(x, weight): add value(s) to the digest
+# - push_many(xs, weights): batched push with a single min/max update
 # - quantile(q): approximate value at quantile q ∈ [0, 1]
+# - quantiles(qs): batched quantile() for several q at once
 # - cdf(x): approximate fraction of observations ≤ x
 # - merge(other): combine another digest into this one
 # - compress(): reduce centroid count while respecting k-space constraints
@@ -21,15 +23,29 @@
 from dataclasses import dataclass
 from numbers import Number
 import math
-from typing import List, Tuple
-from itertools import accumulate
-
+import sys
+from typing import List, Optional, Tuple
+from itertools import accumulate, islice
+from bisect import bisect_left
+from operator import attrgetter
+
+_centroid_weight = attrgetter("weight")
+_centroid_mean = attrgetter("mean")
+# bisect gained key= in Python 3.10; older interpreters use the equivalent handwritten search
+_BISECT_HAS_KEY = sys.version_info >= (3, 10)
+
+# Slotted (declared by hand, since dataclass(slots=True) needs Python 3.10) so each centroid skips
+# a per-instance __dict__; digests hold alpha * compression_factor of these at a time.
 @dataclass
 class Centroid():
+    __slots__ = ("mean", "weight")
     mean: float
     weight: int
 
 class TDigest():
+    # Roughly how much more a Fenwick rebuild costs per centroid than one step of a direct prefix sum
+    _BIT_REBUILD_FACTOR = 4
+
     # Initialize the digest with accuracy/candidate selection parameters.
     # - alpha: compression/accuracy parameter used by the scaling function
     # - neighbors: how many nearby centroids to consider when attempting merges in push()
@@ -39,8 +55,25 @@ class TDigest():
         self.neighbors: int = neighbors
         self.compression_factor: int = compression_factor
         self.alpha: int = alpha
+        # constant factor of the k1 scale function k(q) = alpha / (2 * pi) * asin(2q - 1)
+        self._k_scale: float = alpha / (2 * math.pi)
         self.centroids: List[Centroid] = []
         self.total_weight, self.min_value, self.max_value = 0, float("inf"), float("-inf")
+        # running sum of mean * weight over all centroids, so summary() reports the mean in O(1).
+        # Every push adds exactly x * weight and compress() conserves it, so it never needs a rescan.
+        self._weighted_sum: float = 0.0
+        # Fenwick (binary indexed) tree over centroid weights, 1-indexed, so prefix weights are
+        # O(log N). Merges update it in place; inserts/compress/merge/reorders mark it dirty. While it is
+        # dirty, prefix queries are summed directly, and once those sums have cost about as much as a
+        # rebuild the tree is rebuilt in one O(N) pass (so insert-heavy streams never pay for it).
+        self._bit: List[int] = [0]
+        self._bit_dirty: bool = False
+        self._bit_stale_cost: int = 0
+        # Invariant: centroids are always sorted by mean. push() inserts at the bisect position and
+        # moves a merged centroid back into place, compress() and merge() emit mean-ordered lists,
+        # so no read or write path ever has to sort (checked by _means_sorted() under __debug__).
+        # (centers, means) used by quantile()/cdf(); dropped on every mutation, rebuilt on demand
+        self._query_cache: Optional[Tuple[List[float], List[float]]] = None
 
     def __repr__(self):
         return f"TDigest(alpha={self.alpha},neighbors={self.neighbors},compression_factor={self.compression_factor})"
@@ -48,45 +81,95 @@ class TDigest():
     def __len__(self):
         return len(self.centroids)
 
-    def _calculate_max_weight(self, delta_k: float) -> float:
-        # Calculate the maximum weight allowed in a k-space region based on alpha and total weight
-        return delta_k * (self.total_weight / self.alpha)
-
-    def __scaling_function(self, q: float):
-        assert 0 <= q <= 1, "q must be between 0 and 1 (inclusive) in the scaling function"
-        return (self.alpha / (2 * math.pi)) * math.asin(2 * q - 1)
-
-    def __get_centroid_merge_condidates(self, x: Number):
-        # Get merge centroid candidates using neighbors parameter around the insertion index of x
-        sum_weight = 0
-        candidates: List[Tuple[Centroid, int]] = []
-        insert_idx = self.__insert_idx(x)
-        start_idx = max(0, insert_idx - (self.neighbors // 2))
-        end_idx = min(len(self.centroids) - 1, insert_idx + (self.neighbors // 2))
-
-        # get weights up until start_idx
-        for i in range(start_idx):
-            sum_weight += self.centroids[i].weight
-
-        for i in range(start_idx, end_idx, 1):
-            candidates.append((self.centroids[i], sum_weight))
-            sum_weight += self.centroids[i].weight
-
-        return candidates
-
-    def __get_centroids_quantiles(self, candidates: List[Tuple[Centroid, int]]):
-        qs: List[float] = []
-        for cent, weight in candidates:
-            q = (weight + (cent.weight / 2)) / self.total_weight
-            qs.append(q)
-
-        return qs
+    def _bit_rebuild(self):
+        # Slot i covers centroids (i - lowbit(i), i], i.e. the difference of two prefix sums
+        prefix = [0]
+        prefix.extend(accumulate(map(_centroid_weight, self.centroids)))
+        self._bit = [prefix[i] - prefix[i - (i & -i)] for i in range(len(prefix))]
+        self._bit_dirty = False
+
+    def _bit_invalidate(self):
+        # Centroids were inserted, removed or reordered; the tree no longer matches their layout
+        self._bit_dirty = True
+        self._bit_stale_cost = 0
+
+    def _bit_update(self, idx: int, delta: int):
+        # Add delta to the weight of the centroid at (0-based) idx
+        if self._bit_dirty:
+            return
+        bit = self._bit
+        n = len(bit)
+        i = idx + 1
+        while i < n:
+            bit[i] += delta
+            i += i & -i
+
+    def _bit_prefix(self, idx: int) -> int:
+        # Sum of the weights of centroids[0:idx]
+        if self._bit_dirty:
+            # Rebuild only once direct sums have cost about as much as a rebuild would, so a
+            # stream of inserts (which dirty the tree every push) never pays for a rebuild
+            self._bit_stale_cost += idx
+            if self._bit_stale_cost < self._BIT_REBUILD_FACTOR * len(self.centroids):
+                return sum(map(_centroid_weight, islice(self.centroids, idx)))
+            self._bit_rebuild()
+        bit = self._bit
+        total = 0
+        i = idx
+        while i > 0:
+            total += bit[i]
+            i -= i & -i
+        return total
+
+    def _restore_order(self, idx: int):
+        # A merge in push() moves the centroid at idx toward x, which can carry its mean past a
+        # neighbor inside the candidate window. Swap it back into place (at most neighbors // 2
+        # steps, equal means keep their order like a stable sort) instead of re-sorting later.
+        centroids = self.centroids
+        centroid = centroids[idx]
+        mean = centroid.mean
+        pos = idx
+        while pos > 0 and centroids[pos - 1].mean > mean:
+            centroids[pos] = centroids[pos - 1]
+            pos -= 1
+        if pos == idx:
+            last = len(centroids) - 1
+            while pos < last and centroids[pos + 1].mean < mean:
+                centroids[pos] = centroids[pos + 1]
+                pos += 1
+        if pos != idx:
+            centroids[pos] = centroid
+            self._bit_invalidate()
+
+    def _means_sorted(self) -> bool:
+        # Debug check of the mean-order invariant (NaN means compare false, so they never fail it)
+        centroids = self.centroids
+        return not any(centroids[i].mean > centroids[i + 1].mean for i in range(len(centroids) - 1))
+
+    def _centers_and_means(self) -> Tuple[List[float], List[float]]:
+        # Rank of each centroid's center and its mean, in mean order. Cached until the next mutation
+        # so repeated quantile()/cdf() calls only pay for a binary search.
+        if self._query_cache is None:
+            if __debug__:
+                assert self._means_sorted(), "t-digest centroids out of mean order"
+            centers: List[float] = []
+            means: List[float] = []
+            cumulative = 0.0
+            for c in self.centroids:
+                centers.append(cumulative + c.weight / 2)
+                means.append(c.mean)
+                cumulative += c.weight
+            self._query_cache = (centers, means)
+        return self._query_cache
 
     def __insert_idx(self, x: Number):
-        # Binary search for the position where x should be inserted to keep centroids sorted by mean
-        left, right = 0, len(self.centroids) - 1
+        # Position where x should be inserted to keep centroids sorted by mean, in [0, len(centroids)]
+        if _BISECT_HAS_KEY:
+            return bisect_left(self.centroids, x, key=_centroid_mean)
+
+        left, right = 0, len(self.centroids)
         while left < right:
-            middle =  (left + right) // 2
+            middle = (left + right) // 2
             if self.centroids[middle].mean < x:
                 left = middle + 1
             else:
@@ -94,56 +177,89 @@ class TDigest():
 
         return left
 
-    def __get_centroid_quantile(self, idx: int, centroid_weight: int):
-        assert idx >= 0 and idx < len(self.centroids), "failed to __get_quantile, idx must be in range of centroids"
-        weight = 0
-        for i in range(idx):
-            weight += self.centroids[i].weight
-        
-        return (weight + (centroid_weight / 2)) / self.total_weight
-
     def push(self, x: Number, weight: int = 1):
         # Streaming insert (optionally weighted). Attempts to merge into a nearby centroid
         # if the k-space constraint allows; otherwise inserts a new centroid.
         assert isinstance(x, Number), "push failed, x must be a number"
-        # update min/max
-        # Handle NaN specially since NaN comparisons always return False
-        if math.isnan(x):
+        # update min/max. NaN is the only value unequal to itself (cheaper than a math.isnan call)
+        # and NaN comparisons always return False, so it is handled on its own branch
+        if x != x:
             self.min_value = x
             self.max_value = x
         else:
             if x < self.min_value: self.min_value = x
             if x > self.max_value: self.max_value = x
+        self.__add(x, weight)
+
+    def push_many(self, xs, weights=None):
+        # Batched push(): validates and updates min/max once for the whole batch, then feeds each
+        # value through the same merge/insert path as push(). weights defaults to 1 per value.
+        xs = list(xs)
+        weights = [1] * len(xs) if weights is None else list(weights)
+        assert len(weights) == len(xs), "push_many failed, xs and weights must have the same length"
+        if not xs:
+            return
+        assert all(isinstance(x, Number) for x in xs), "push_many failed, every x must be a number"
+        if any(x != x for x in xs):
+            self.min_value = self.max_value = float("nan")
+        else:
+            self.min_value = min(self.min_value, min(xs))
+            self.max_value = max(self.max_value, max(xs))
+        add = self.__add
+        for x, weight in zip(xs, weights):
+            add(x, weight)
+
+    def __add(self, x: Number, weight: int):
+        # Merge x into a nearby centroid if the k-space constraint allows, otherwise insert a new one.
+        # Callers have already folded x into min_value/max_value.
+        self._query_cache = None
+        self._weighted_sum += x * weight
 
         # edge case: empty centroid list
         if len(self.centroids) == 0: 
             self.centroids.append(Centroid(mean=x, weight=weight))
             self.total_weight += weight
+            self._bit_invalidate()
             return
         
-        # find merge candiates / quantiles
-        candidates = self.__get_centroid_merge_condidates(x)
-        qs = self.__get_centroids_quantiles(candidates)
-        
-        # try to merge with an existing centroid
-        for candidate_tuple, q in zip(candidates, qs):
-            centroid, _ = candidate_tuple
-            k_current = self.__scaling_function(q - centroid.weight / 2 / self.total_weight)
-            k_next = self.__scaling_function(q + centroid.weight / 2 / self.total_weight)
-            delta_k = k_next - k_current
-            max_weight = self._calculate_max_weight(delta_k)
-
-            if centroid.weight + weight <= max_weight:
-                new_mean = (centroid.mean * centroid.weight + x * weight) / (centroid.weight + weight)
-                centroid.mean = new_mean
-                centroid.weight += weight
-                self.total_weight += weight
+        # Candidate window around the insertion index of x (neighbors // 2 on each side). Candidate
+        # selection, quantile and the k-space test run in one pass with hot values bound to locals,
+        # without building intermediate candidate/quantile lists.
+        centroids = self.centroids
+        total_weight = self.total_weight
+        max_weight_factor = total_weight / self.alpha
+        k_scale = self._k_scale
+        asin = math.asin
+        insert_idx = self.__insert_idx(x)
+        start_idx = max(0, insert_idx - (self.neighbors // 2))
+        end_idx = min(len(centroids) - 1, insert_idx + (self.neighbors // 2))
+        sum_weight = self._bit_prefix(start_idx)
+
+        # try to merge with the first candidate whose k-space budget fits the new weight.
+        # k is evaluated at quantile edges (exact weight ratios, so 2q - 1 stays inside asin's
+        # domain). Adjacent candidates share an edge, so each candidate costs one asin, not two.
+        k_current = k_scale * asin(2 * (sum_weight / total_weight) - 1)
+        for idx in range(start_idx, end_idx):
+            centroid = centroids[idx]
+            centroid_weight = centroid.weight
+            next_sum_weight = sum_weight + centroid_weight
+            k_next = k_scale * asin(2 * (next_sum_weight / total_weight) - 1)
+            max_weight = (k_next - k_current) * max_weight_factor
+
+            if centroid_weight + weight <= max_weight:
+                centroid.mean = (centroid.mean * centroid_weight + x * weight) / (centroid_weight + weight)
+                centroid.weight = centroid_weight + weight
+                self.total_weight = total_weight + weight
+                self._bit_update(idx, weight)
+                self._restore_order(idx)
                 return
-        
+            sum_weight = next_sum_weight
+            k_current = k_next
+
         # no merge possible, create new centroid
-        insert_idx = self.__insert_idx(x)
-        self.centroids.insert(insert_idx, Centroid(mean=x, weight=weight))
-        self.total_weight += weight
+        centroids.insert(insert_idx, Centroid(mean=x, weight=weight))
+        self.total_weight = total_weight + weight
+        self._bit_invalidate()
 
         if len(self.centroids) > self.alpha * self.compression_factor:
             self.compress()
@@ -152,103 +268,126 @@ class TDigest():
         # Compress the centroid list by merging adjacent centroids while respecting k-space limits.
         if len(self.centroids) <= 1:
             return
-        # Ensure centroids are sorted by mean before compressing
-        self.centroids.sort(key=lambda c: c.mean)
+        # Centroids are already in mean order (class invariant), so adjacent ones can be merged directly.
+        # Single left-to-right sweep. The open output centroid is carried in local scalars and a
+        # Centroid is only allocated once it is closed, instead of copying every input centroid.
+        centroids = self.centroids
+        total_weight = self.total_weight
+        max_weight_factor = total_weight / self.alpha
+        k_scale = self._k_scale
+        asin = math.asin
         new_list: List[Centroid] = []
-        cumulative_weight = 0
-        for centroid in self.centroids:
-            if not new_list:
-                # start with the first centroid
-                new_list.append(Centroid(mean=centroid.mean, weight=centroid.weight))
-                cumulative_weight += centroid.weight
-                continue
-
-            last = new_list[-1]
-            # quantile at the center of the last centroid in the output
-            q_center_last = (cumulative_weight - last.weight / 2) / self.total_weight
-            k_current = self.__scaling_function(q_center_last - last.weight / 2 / self.total_weight)
-            k_next = self.__scaling_function(q_center_last + last.weight / 2 / self.total_weight)
-            delta_k = k_next - k_current
-            max_weight = self._calculate_max_weight(delta_k)
-
-            if last.weight + centroid.weight <= max_weight:
+        last_mean, last_weight = centroids[0].mean, centroids[0].weight
+        cumulative_weight = last_weight
+        # k at the left edge of the open centroid only moves when a new centroid is started, and
+        # then it equals the previous right edge, so each step evaluates asin once, not twice
+        k_left = k_scale * asin(-1.0)
+        for i in range(1, len(centroids)):
+            mean, weight = centroids[i].mean, centroids[i].weight
+            k_right = k_scale * asin(2 * (cumulative_weight / total_weight) - 1)
+            max_weight = (k_right - k_left) * max_weight_factor
+
+            if last_weight + weight <= max_weight:
                 # merge centroid into last
-                combined_weight = last.weight + centroid.weight
-                new_mean = (last.mean * last.weight + centroid.mean * centroid.weight) / combined_weight
-                last.mean = new_mean
-                last.weight = combined_weight
-                cumulative_weight += centroid.weight
+                combined_weight = last_weight + weight
+                last_mean = (last_mean * last_weight + mean * weight) / combined_weight
+                last_weight = combined_weight
             else:
-                # cannot merge; start a new centroid in output
-                new_list.append(Centroid(mean=centroid.mean, weight=centroid.weight))
-                cumulative_weight += centroid.weight
+                # cannot merge; close the last centroid and start a new one
+                new_list.append(Centroid(mean=last_mean, weight=last_weight))
+                last_mean, last_weight = mean, weight
+                k_left = k_right
+            cumulative_weight += weight
+        new_list.append(Centroid(mean=last_mean, weight=last_weight))
 
         # Replace old centroids with compressed list (total_weight remains unchanged)
         self.centroids = new_list
+        self._bit_invalidate()
+        self._query_cache = None
 
     def quantile(self, q: float):
         # Estimate the value at quantile q using linear interpolation between neighboring centroid centers.
-        assert 0 <= q <= 1, "failed finding quantile, q must be in between 0 and 1 (inclusive)"
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs) -> List[float]:
+        # Batched quantile(): validates once and shares one centers/means lookup across every q.
+        assert all(0 <= q <= 1 for q in qs), "failed finding quantile, q must be in between 0 and 1 (inclusive)"
         assert len(self.centroids) > 0, "failed finding quantile (no centroids / numbers in t-digest)"
+        if len(self.centroids) == 1:
+            mean = self.centroids[0].mean
+            return [self.min_value if q == 0 else self.max_value if q == 1 else mean for q in qs]
+        centers, means = self._centers_and_means()
+        return [self.__interpolate_quantile(q, centers, means) for q in qs]
 
+    def __interpolate_quantile(self, q: float, centers: List[float], means: List[float]) -> float:
         if q == 0:
             return self.min_value
         if q == 1:
             return self.max_value
-        if len(self.centroids) == 1:
-            return self.centroids[0].mean
-
-        # Ensure centroids are sorted by mean
-        self.centroids.sort(key=lambda c: c.mean)
-
         target = q * self.total_weight
-        centers: List[float] = []
-        cumulative = 0.0
-        for c in self.centroids:
-            centers.append(cumulative + c.weight / 2)
-            cumulative += c.weight
 
         # Interpolate using centroid centers
         if target <= centers[0]:
             left_rank = 0.0
             right_rank = centers[0]
             if right_rank == left_rank:
-                return self.centroids[0].mean
+                return means[0]
+            t = (target - left_rank) / (right_rank - left_rank)
+            return self.min_value + t * (means[0] - self.min_value)
+
+        # first center >= target, so centers[i - 1] < target <= centers[i]
+        i = bisect_left(centers, target)
+        if i < len(centers):
+            left_x = means[i - 1]
+            right_x = means[i]
+            left_rank = centers[i - 1]
+            right_rank = centers[i]
+            if right_rank == left_rank:
+                return left_x
             t = (target - left_rank) / (right_rank - left_rank)
-            return self.min_value + t * (self.centroids[0].mean - self.min_value)
-
-        for i in range(len(centers) - 1):
-            if centers[i] < target <= centers[i + 1]:
-                left_x = self.centroids[i].mean
-                right_x = self.centroids[i + 1].mean
-                left_rank = centers[i]
-                right_rank = centers[i + 1]
-                if right_rank == left_rank:
-                    return left_x
-                t = (target - left_rank) / (right_rank - left_rank)
-                return left_x + t * (right_x - left_x)
+            return left_x + t * (right_x - left_x)
 
         # Beyond last center, interpolate to max_value
-        last_idx = len(self.centroids) - 1
         left_rank = centers[-1]
         right_rank = float(self.total_weight)
         if right_rank == left_rank:
-            return self.centroids[last_idx].mean
+            return means[-1]
         t = (target - left_rank) / (right_rank - left_rank)
-        return self.centroids[last_idx].mean + t * (self.max_value - self.centroids[last_idx].mean)
+        return means[-1] + t * (self.max_value - means[-1])
 
     def merge(self, t_digest: 'TDigest'):
-        # Merge another digest into this one by appending its centroids and compressing if needed.
-        # Append copies of centroids to avoid aliasing between digests
-        for centroid in t_digest.centroids:
-            self.centroids.append(Centroid(mean=centroid.mean, weight=centroid.weight))
-            self.total_weight += centroid.weight
-
-        # Update bounds and sort prior to optional compression
-        if t_digest.centroids:
+        # Merge another digest into this one and compress if needed. Both centroid lists are
+        # mean-ordered, so a two-pointer pass into a preallocated list replaces append + full sort.
+        # On equal means our centroids go first, matching the previous stable sort.
+        other = t_digest.centroids
+        ours = self.centroids
+        n, m = len(ours), len(other)
+        merged: List[Centroid] = [None] * (n + m)
+        i = j = 0
+        added_weight = 0
+        added_sum = 0.0
+        for k in range(n + m):
+            if j == m or (i < n and ours[i].mean <= other[j].mean):
+                merged[k] = ours[i]
+                i += 1
+            else:
+                centroid = other[j]
+                # Copy foreign centroids to avoid aliasing between digests
+                merged[k] = Centroid(mean=centroid.mean, weight=centroid.weight)
+                added_weight += centroid.weight
+                added_sum += centroid.mean * centroid.weight
+                j += 1
+
+        self.centroids = merged
+        self.total_weight += added_weight
+        self._weighted_sum += added_sum
+        self._bit_invalidate()
+        self._query_cache = None
+
+        # Update bounds prior to optional compression
+        if other:
             self.min_value = min(self.min_value, t_digest.min_value)
             self.max_value = max(self.max_value, t_digest.max_value)
-        self.centroids.sort(key=lambda c: c.mean)
 
         if len(self.centroids) > self.alpha * self.compression_factor:
             self.compress()
@@ -264,18 +403,7 @@ class TDigest():
         if x >= self.max_value:
             return 1.0
 
-        # Ensure sorted
-        self.centroids.sort(key=lambda c: c.mean)
-
-        # Build center ranks and means
-        centers: List[float] = []
-        means: List[float] = []
-        cumulative = 0.0
-        for c in self.centroids:
-            centers.append(cumulative + c.weight / 2)
-            means.append(c.mean)
-            cumulative += c.weight
-
+        centers, means = self._centers_and_means()
         total = float(self.total_weight)
 
         # Before first mean: interpolate from min_value to first mean
@@ -291,19 +419,20 @@ class TDigest():
                 rank = left_rank + t * (right_rank - left_rank)
             return rank / total
 
-        # Between means: interpolate between adjacent centroid centers
-        for i in range(len(means) - 1):
-            if means[i] <= x <= means[i + 1]:
-                left_val = means[i]
-                right_val = means[i + 1]
-                left_rank = centers[i]
-                right_rank = centers[i + 1]
-                if right_val == left_val:
-                    # identical means — step at right centroid center
-                    return right_rank / total
-                t = (x - left_val) / (right_val - left_val)
-                rank = left_rank + t * (right_rank - left_rank)
-                return rank / total
+        # Between means: interpolate between adjacent centroid centers.
+        # First mean >= x, so means[i - 1] < x <= means[i]
+        i = bisect_left(means, x)
+        if i < len(means):
+            left_val = means[i - 1]
+            right_val = means[i]
+            left_rank = centers[i - 1]
+            right_rank = centers[i]
+            if right_val == left_val:
+                # identical means — step at right centroid center
+                return right_rank / total
+            t = (x - left_val) / (right_val - left_val)
+            rank = left_rank + t * (right_rank - left_rank)
+            return rank / total
 
         # After last mean: interpolate from last mean to max_value
         left_val = means[-1]
@@ -345,19 +474,16 @@ class TDigest():
                 "p99": None,
             }
 
-        weighted_sum = 0.0
-        for c in self.centroids:
-            weighted_sum += c.mean * c.weight
-
+        p50, p90, p95, p99 = self.quantiles((0.50, 0.90, 0.95, 0.99))
         return {
             "count": int(self.total_weight),
             "min": self.min_value,
             "max": self.max_value,
-            "mean": weighted_sum / self.total_weight,
-            "p50": self.quantile(0.50),
-            "p90": self.quantile(0.90),
-            "p95": self.quantile(0.95),
-            "p99": self.quantile(0.99),
+            "mean": self._weighted_sum / self.total_weight,
+            "p50": p50,
+            "p90": p90,
+            "p95": p95,
+            "p99": p99,
         }
 
     def min(self):
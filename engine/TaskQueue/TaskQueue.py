@@ -1,28 +1,47 @@
 # Priority-based task queue implementation for managing callable tasks.
 # Supports multiple priority levels (0 = highest priority) where tasks are dequeued
-# in priority order. Each priority level is backed by a deque for O(1) enqueue/dequeue.
+# in priority order. Each priority level is backed by a deque for O(1) enqueue/dequeue, and a
+# bitmask of non-empty levels lets dequeue find the highest priority without scanning.
 # Tasks are stored as (callable, args, kwargs) tuples, enabling flexible task definitions.
 # A separate failed queue tracks tasks that need reprocessing (currently unused in core logic).
 
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 from collections import deque
+from types import MappingProxyType
 import datetime
+import asyncio
+import time
+
+# Shared read-only kwargs for tasks enqueued without keyword arguments, so queued tasks don't each
+# keep an empty dict alive. Read-only, so sharing it between tasks is safe.
+_EMPTY_KWARGS = MappingProxyType({})
+
+# Wall-clock time paired with the monotonic clock at import, used to turn monotonic completion
+# stamps back into datetimes only when a caller actually reads them.
+_WALL_ANCHOR = time.time()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
 
 # TaskResult encapsulates the output of a completed task.
-# - completed_at: timestamp when the task finished execution
+# - completed_at_ns: time.monotonic_ns() when the task finished execution (cheap to record)
 # - result: the return value from the task callable (can be any type)
+# - completed_at: the completion time as a datetime, converted on access
+# Slotted so each stored result carries no per-instance __dict__.
 @dataclass
 class TaskResult():
-    completed_at: datetime.datetime
+    __slots__ = ("completed_at_ns", "result")
+    completed_at_ns: int
     result: Any
 
-# TaskQueue manages a priority-based queue of tasks with O(1) enqueue and O(P) dequeue
-# where P is the number of priority levels. Provides:
+    @property
+    def completed_at(self) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(_WALL_ANCHOR + (self.completed_at_ns - _MONOTONIC_ANCHOR_NS) / 1e9)
+
+# TaskQueue manages a priority-based queue of tasks with O(1) enqueue and dequeue. Provides:
 # - Multiple priority levels (0 = highest priority, configurable at init)
 # - FIFO ordering within each priority level
 # - O(1) enqueue by priority
-# - O(P) dequeue that scans priorities from highest to lowest
+# - Dequeue that picks the highest non-empty priority from a bitmask instead of scanning levels
 # - Separate failure queue for tracking failed tasks (optional use)
 class TaskQueue():
     # Initialize a task queue with the specified number of priority levels.
@@ -33,12 +52,18 @@ class TaskQueue():
         self.q = [deque([]) for i in range(priorities)]
         self.failed = deque([])
         self.priorities = priorities
+        # Bit p is set while self.q[p] holds tasks; the lowest set bit is the next priority to serve
+        self._nonempty = 0
+        # Running count of queued tasks so __len__ does not walk every priority level
+        self._size = 0
+        # Wakeup for consumers awaiting get(); created lazily on the consumer's event loop
+        self._event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._interrupted = False
 
     # Return the total number of tasks across all priority levels (excluding failed queue).
-    # This is O(P) where P is the number of priority levels.
     def __len__(self):
-        total = sum(len(queue) for queue in self.q)
-        return total
+        return self._size
 
     # Enqueue a task at the specified priority level.
     # - priority: priority level (0 = highest, must be < self.priorities)
@@ -47,22 +72,75 @@ class TaskQueue():
     # Appends (task, args, kwargs) tuple to the appropriate priority queue.
     def enqueue(self, priority: int, task: Callable, *args, **kwargs):
         assert priority < self.priorities and priority >= 0, f"priority must be greater than -1 and less than {self.priorities}"
-        self.q[priority].append((task, args, kwargs))
+        self.q[priority].append((task, args, kwargs or _EMPTY_KWARGS))
+        self._nonempty |= 1 << priority
+        self._size += 1
+        self.__wake()
 
     # Enqueue a failed task to the separate failure queue.
     # This is a utility for tracking tasks that failed execution and may need reprocessing.
     # - task: callable that failed
     # - *args, **kwargs: original arguments for the failed task
     def enqueue_failure(self, task: Callable, *args, **kwargs):
-        self.failed.append((task, args, kwargs))
+        self.failed.append((task, args, kwargs or _EMPTY_KWARGS))
 
     # Dequeue the next task from the highest-priority non-empty queue.
-    # Scans priority levels from 0 (highest) to priorities-1 (lowest) and returns
-    # the first available task as a (callable, args, kwargs) tuple.
-    # Returns None if all queues are empty.
+    # The lowest set bit of the non-empty mask is the highest non-empty priority, so no
+    # per-level scan is needed. Returns the task as a (callable, args, kwargs) tuple, or
+    # None if all queues are empty.
     def dequeue(self):
-        for i in range(self.priorities):
-            if len(self.q[i]) != 0:
-                return self.q[i].popleft()
-        
-        return None
\ No newline at end of file
+        mask = self._nonempty
+        if not mask:
+            return None
+
+        priority = (mask & -mask).bit_length() - 1
+        queue = self.q[priority]
+        task_data = queue.popleft()
+        if not queue:
+            self._nonempty = mask & ~(1 << priority)
+        self._size -= 1
+        return task_data
+
+    # Wait for the next task and dequeue it, without polling. Consumers sleep on an
+    # asyncio.Event that enqueue() sets, so an idle consumer costs nothing and a new task
+    # is picked up immediately. Returns None if interrupt() is called while waiting, so the
+    # consumer can re-check its own shutdown state.
+    async def get(self):
+        while True:
+            task_data = self.dequeue()
+            if task_data is not None:
+                return task_data
+
+            loop = asyncio.get_running_loop()
+            if self._event is None or self._loop is not loop:
+                self._event = asyncio.Event()
+                self._loop = loop
+            self._event.clear()
+            self._interrupted = False
+            await self._event.wait()
+            if self._interrupted:
+                return None
+
+    # Wake every consumer blocked in get() and make it return None.
+    def interrupt(self):
+        self._interrupted = True
+        self.__wake()
+
+    # Set the wakeup event. Producers on the consumer's loop set it directly; producers on
+    # other threads (or outside any loop) hand it to the loop with call_soon_threadsafe.
+    def __wake(self):
+        event = self._event
+        if event is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            event.set()
+            return
+        try:
+            self._loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The consumer's loop is closed, so nobody is waiting on this event
+            pass
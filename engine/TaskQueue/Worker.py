@@ -1,14 +1,17 @@
 # Asynchronous worker implementation for executing tasks from a TaskQueue.
-# The worker continuously polls the queue, executes tasks in separate threads
+# The worker awaits tasks from the queue, executes tasks in separate threads
 # (to avoid blocking the event loop), and stores results with timestamps.
 # Features automatic retry with exponential backoff on failures, task timeout handling,
 # and a bounded results deque that auto-evicts oldest results when full.
 # Designed for long-running background task processing with graceful shutdown support.
 
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from .TaskQueue import TaskQueue, TaskResult
-import datetime
 import asyncio
+import functools
+import os
+import time
 
 # Worker executes tasks asynchronously from a TaskQueue with retry and timeout handling.
 # Provides:
@@ -17,21 +20,26 @@ import asyncio
 # - Automatic retry with exponential backoff (1s, 2s, 4s, 8s, ...)
 # - Bounded result storage (oldest results auto-evicted when limit reached)
 # - Graceful shutdown via stop() method
-# - Thread-based task execution to prevent blocking the async event loop
+# - Thread-based task execution on a per-worker thread pool to prevent blocking the event loop
+# - Optional concurrency: several execution slots drain the queue in parallel
 class Worker():
     # Initialize a worker with task queue, result limits, retry policy, and timeout.
     # - task_queue: TaskQueue instance to pull tasks from (must not be None)
     # - max_results: maximum number of TaskResult objects to keep in memory (oldest evicted first)
     # - max_retries: number of retry attempts for failed tasks (with exponential backoff)
     # - timeout: seconds to wait for each task execution before timing out (default: 30)
-    # Results are stored in a deque; retries use backoff = 1 * (2 ** retry_count) seconds.
-    def __init__(self, task_queue: 'TaskQueue', max_results: int, max_retries: int, timeout: int = 30):
+    # - concurrency: number of tasks executed at once (default: 1, which keeps strict queue order)
+    # Results are stored in a deque bounded by max_results (appends evict the oldest); retries use backoff = 1 * (2 ** retry_count) seconds.
+    def __init__(self, task_queue: 'TaskQueue', max_results: int, max_retries: int, timeout: int = 30, concurrency: int = 1):
         assert task_queue is not None, "task_queue cannot be None"
         assert max_results > 0 and max_retries > 0 and timeout > 0, "max_results and max_retries and timeout must be greater than 0"
+        assert concurrency > 0, "concurrency must be greater than 0"
         self.task_queue = task_queue
+        self.concurrency = concurrency
+        self._pool = None
         self.max_results = max_results
         self.max_retries = max_retries
-        self.results = deque([])
+        self.results = deque(maxlen=max_results)
         self.timeout = timeout
         self.is_running = False
     
@@ -46,55 +54,68 @@ class Worker():
         return list(self.results)
 
     # Signal the worker to stop processing tasks.
-    # Sets is_running to False, which will cause execute_tasks() to exit its main loop.
+    # Sets is_running to False, which will cause execute_tasks() to exit its main loop, and
+    # interrupts the queue so an idle worker waiting in get() wakes up to notice.
     # This is a graceful shutdown: the current task will complete before stopping.
     def stop(self):
-        self.is_running = False 
+        self.is_running = False
+        self.task_queue.interrupt()
     
     # Main async loop: continuously dequeue and execute tasks until stop() is called.
-    # - Polls task_queue.dequeue() in a loop
-    # - Executes tasks in a separate thread via asyncio.to_thread to avoid blocking
+    # - Runs `concurrency` execution slots that share the queue
+    # - Awaits task_queue.get(), which sleeps until a task is enqueued (no polling)
+    # - Executes tasks on a thread pool owned by this run to avoid blocking the event loop
     # - Enforces timeout using asyncio.wait_for
     # - Stores successful results in self.results (auto-evicting oldest if at max_results)
     # - On timeout or exception, invokes __handle_task_failure for retry logic
-    # - Sleeps briefly (0.01s) when queue is empty to avoid busy-waiting
     async def execute_tasks(self):
         self.is_running = True
+        # Timed-out tasks keep running in their thread, so size the pool like the default
+        # executor (never below the slot count) instead of one thread per slot.
+        self._pool = ThreadPoolExecutor(max_workers=max(self.concurrency, min(32, (os.cpu_count() or 1) + 4)))
+        try:
+            await asyncio.gather(*(self.__run_slot() for _ in range(self.concurrency)))
+        finally:
+            self._pool.shutdown(wait=False)
+
+    # Submit one prepared call to the pool and wait for it, bounded by the worker timeout.
+    async def __run_task(self, call):
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(loop.run_in_executor(self._pool, call), timeout=self.timeout)
 
+    # One execution slot: pull tasks until the worker is stopped.
+    # Each task is bound into a functools.partial once, so the first run and every retry reuse it
+    # instead of re-unpacking args/kwargs; tasks enqueued without kwargs skip the ** unpack entirely.
+    async def __run_slot(self):
         while self.is_running:
-            curr_task = None
-            args = ()
-            kwargs = {}
-            
+            call = None
             try:
-                task_data = self.task_queue.dequeue()
-                if task_data == None: 
-                    await asyncio.sleep(0.01)  # Brief sleep to prevent busy-waiting on empty queue
-                    continue
-            
-                curr_task, args, kwargs = task_data
+                task_data = await self.task_queue.get()
+                if task_data is None:
+                    continue  # Interrupted while idle; re-check is_running
+
+                task, args, kwargs = task_data
+                call = functools.partial(task, *args, **kwargs) if kwargs else functools.partial(task, *args)
                 # Execute in separate thread to avoid blocking the event loop
-                res = await asyncio.wait_for(asyncio.to_thread(curr_task, *args, **kwargs), timeout=self.timeout)
-                if len(self.results) >= self.max_results: self.results.popleft()
-                self.results.append(TaskResult(completed_at=datetime.datetime.now(), result=res))
-            
+                res = await self.__run_task(call)
+                self.results.append(TaskResult(completed_at_ns=time.monotonic_ns(), result=res))
+
             except asyncio.TimeoutError:
                 print(f"Task timed out after {self.timeout} seconds. If you want to increase timeout pass timeout prop into the constructor")
-                if curr_task is not None:
-                    await self.__handle_task_failure(curr_task, args, kwargs)
+                if call is not None:
+                    await self.__handle_task_failure(call)
             except Exception as e:
-                if curr_task is not None:
-                    await self.__handle_task_failure(curr_task, args, kwargs)
-                
+                if call is not None:
+                    await self.__handle_task_failure(call)
+
     # Private retry handler with exponential backoff.
     # Attempts to re-execute a failed task up to max_retries times with increasing delays.
     # - Backoff formula: 1 * (2 ** retries) seconds (1s, 2s, 4s, 8s, 16s, ...)
     # - On successful retry, stores the result and breaks out of retry loop
     # - On continued failure, silently exhausts all retries (no final error stored)
-    # - task: the callable that failed
-    # - args, kwargs: original arguments for the task
-    async def __handle_task_failure(self, task, args, kwargs):
-        if task is None:
+    # - call: the failed task, already bound to its original arguments
+    async def __handle_task_failure(self, call):
+        if call is None:
             return
 
         retries = 0
@@ -102,9 +123,8 @@ class Worker():
             backoff = 1 * (2 ** retries)
             await asyncio.sleep(backoff)
             try:
-                res = await asyncio.wait_for(asyncio.to_thread(task, *args, **kwargs), timeout=self.timeout)
-                if len(self.results) >= self.max_results: self.results.popleft()
-                self.results.append(TaskResult(completed_at=datetime.datetime.now(), result=res))
+                res = await self.__run_task(call)
+                self.results.append(TaskResult(completed_at_ns=time.monotonic_ns(), result=res))
                 break  # Success - exit retry loop
             except Exception as e:
                 retries += 1  # Increment on failure and continue to next retry
@@ -3,13 +3,17 @@
 # - Class-based decorator `Timeout` for per-instance configuration.
 # - Function decorator `timeout` for ergonomic usage (works with or without parentheses).
 # Behavior:
-# - Bounds execution time using asyncio.wait_for with the configured seconds.
+# - Bounds execution time with a deadline scope around the awaited coroutine: asyncio.timeout on
+#   Python 3.11+, async_timeout.timeout if installed on older versions, else asyncio.wait_for.
+#   The scope runs the coroutine in the caller's task instead of wrapping it in a new one.
 # - On timeout: runs optional `fallback(*args, **kwargs)` (sync or async) and returns its result;
 #   otherwise re-raises asyncio.TimeoutError.
+# - seconds <= 0 counts as already expired: the wrapped function is not called at all.
+# - seconds=None (or math.inf) disables the timeout: the function is returned undecorated.
 # Constraints:
 # - Only supports async callables; raises TypeError for sync functions.
 # Notes:
-# - wait_for cancels the wrapped coroutine task on timeout; ensure your code tolerates CancellationError.
+# - The wrapped coroutine is cancelled on timeout; ensure your code tolerates CancelledError.
 # - Fallback executes on the event loop; avoid blocking operations.
 #
 # Example (class-based):
@@ -23,29 +27,57 @@
 from typing import Callable, Optional
 from functools import wraps
 import asyncio
+import math
+
+try:
+    from asyncio import timeout as _deadline  # Python 3.11+
+except ImportError:
+    try:
+        from async_timeout import timeout as _deadline
+    except ImportError:
+        _deadline = None
+
+# Await `coro` with a deadline of `seconds`, raising asyncio.TimeoutError when it expires.
+# The deadline scopes avoid the extra Task (and its scheduling round-trip) that wait_for creates.
+async def _run_with_deadline(coro, seconds: float):
+    if _deadline is None:
+        return await asyncio.wait_for(coro, timeout=seconds)
+    async with _deadline(seconds):
+        return await coro
 
 # Class-based decorator enforcing a timeout on async functions.
 # - Configure per-instance `seconds` and optional `fallback`.
 # - Use as `@Timeout(seconds=..., fallback=...)`.
 class Timeout:
-    def __init__(self, seconds: float = 3.0, fallback: Optional[Callable] = None):
+    def __init__(self, seconds: Optional[float] = 3.0, fallback: Optional[Callable] = None):
         # Timeout threshold in seconds and optional fallback callable.
         self.seconds = seconds
         self.fallback = fallback
+        # Decided once here rather than inspecting the fallback's result on every timeout
+        self._fallback_is_async = asyncio.iscoroutinefunction(fallback)
 
     def __call__(self, func: Callable):
         # Only allow wrapping `async def` functions.
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("Timeout can only be used on async functions")
+        # No deadline configured: hand back the function itself, so calls pay for no wrapper at all
+        if self.seconds is None or self.seconds == math.inf:
+            return func
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Execute the coroutine with a deadline; on timeout, invoke fallback if provided.
             try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=self.seconds)
+                if self.seconds is not None and self.seconds <= 0:
+                    # Already expired: go straight to the timeout path without creating the coroutine
+                    raise asyncio.TimeoutError()
+                return await _run_with_deadline(func(*args, **kwargs), self.seconds)
             except asyncio.TimeoutError:
                 if self.fallback:
                     res = self.fallback(*args, **kwargs)
+                    if self._fallback_is_async:
+                        return await res
+                    # sync callables may still hand back a coroutine (e.g. a lambda calling an async def)
                     return await res if asyncio.iscoroutine(res) else res
                 raise
 
@@ -56,20 +88,28 @@ class Timeout:
 # Parameters mirror `Timeout`:
 # - seconds: timeout in seconds (default 3.0)
 # - fallback: optional sync/async callable invoked on timeout, receiving the original args
-def timeout(_func: Optional[Callable] = None, *, seconds: float = 3.0, fallback: Optional[Callable] = None):
+def timeout(_func: Optional[Callable] = None, *, seconds: Optional[float] = 3.0, fallback: Optional[Callable] = None):
     def decorator(func: Callable):
         # Enforce async-only usage.
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("@timeout can only be used on async functions")
+        if seconds is None or seconds == math.inf:
+            return func
+        fallback_is_async = asyncio.iscoroutinefunction(fallback)
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Run with deadline; on timeout, invoke fallback if provided.
             try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
+                if seconds is not None and seconds <= 0:
+                    # Already expired: go straight to the timeout path without creating the coroutine
+                    raise asyncio.TimeoutError()
+                return await _run_with_deadline(func(*args, **kwargs), seconds)
             except asyncio.TimeoutError:
                 if fallback:
                     res = fallback(*args, **kwargs)
+                    if fallback_is_async:
+                        return await res
                     return await res if asyncio.iscoroutine(res) else res
                 raise
 
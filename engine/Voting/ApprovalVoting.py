@@ -1,22 +1,23 @@
-from typing import List
-from collections import defaultdict
+from typing import List, Optional
+from array import array
+from collections import Counter
+from itertools import chain
 
 def approval_voting(votes: List[List[str]]) -> str or None:
     if not votes or not any(votes): return None
 
-    vote_counts = defaultdict(int)
-    highest_votes, winner = 0, ""
-
-    if len(votes) == 0: return "No Winner"
+    # tally every approval in one C-level pass; ties go to the candidate approved first
+    vote_counts = Counter(chain.from_iterable(votes))
+    return vote_counts.most_common(1)[0][0]
 
+# Dense-id variant: candidates are the integers 0..num_candidates-1, and each ballot lists the ids it
+# approves. Counts live in a fixed array indexed by id, so tallying does no hashing at all.
+# Returns the winning id (lowest id on a tie), or None if nothing was approved.
+def approval_voting_fast(num_candidates: int, votes: List[List[int]]) -> Optional[int]:
+    counts = array("q", [0]) * num_candidates
     for ballot in votes:
-        for candidate in ballot:
-            vote_counts[candidate] += 1
-
-            if vote_counts[candidate] > highest_votes:
-                highest_votes = vote_counts[candidate]
-                winner = candidate
-
-    return winner
+        for candidate_id in ballot:
+            counts[candidate_id] += 1
 
-    
+    if not any(counts): return None
+    return max(range(num_candidates), key=counts.__getitem__)
@@ -4,8 +4,10 @@
 # through last place respectively in an n-candidate ballot, but custom point allocations
 # can be provided. The winner is determined by summing points across all ballots.
 
-from typing import Set, List
-from collections import defaultdict
+from typing import Set, List, Optional
+from array import array
+from collections import Counter, defaultdict
+from itertools import chain
 
 # Compute the Borda Count winner from a set of ranked preference ballots.
 # - candidates: Set of all candidate names appearing in ballots.
@@ -14,26 +16,35 @@ from collections import defaultdict
 #   n is the number of candidates ranked by each voter. Must match the length of each voter's preference list.
 # Returns: The candidate name with the highest total points, or "No Winner" if no votes were cast.
 def borda_count(candidates: Set[str], votes: List[List[str]], points: List[int] = None):
-    # initialize counts and points
-    vote_counts = defaultdict(int)
-    if not points: points = [len(votes) - i - 1 for i in range(0, len(votes[0]))]
-    
-    # count the points of the votes
-    for ballot in votes:
-        assert len(ballot) == len(points), "points list must be same length of voter's preference list"
-        for i, candidate in enumerate(ballot):
-            vote_points = points[i]
-            vote_counts[candidate] += vote_points
+    if not votes: return "No Winner"
+    # initialize points
+    if not points: points = [len(votes[0]) - i - 1 for i in range(0, len(votes[0]))]
+    assert all(len(ballot) == len(points) for ballot in votes), "points list must be same length of voter's preference list"
 
-    # determinte winner with whoeveer has the most points
-    highest_points, winner = float("-inf"), ""
-    for candidate, points in vote_counts.items():
-        if points > highest_points:
-            highest_points = points
-            winner = candidate
+    # count the points of the votes one rank position at a time: Counter tallies each column of
+    # the ballots in C, so the Python-level work is per (position, candidate) pair instead of per vote
+    vote_counts = defaultdict(int)
+    for vote_points, column in zip(points, zip(*votes)):
+        for candidate, count in Counter(column).items():
+            vote_counts[candidate] += vote_points * count
 
-    if highest_points == float("-inf"): return "No Winner"
+    # determine winner with whoever has the most points; ties go to the candidate seen first
+    # in ballot order, as before
+    order = dict.fromkeys(chain.from_iterable(votes))
+    if not order: return "No Winner"
+    return max(order, key=vote_counts.__getitem__)
 
-    return winner
+# Dense-id variant of borda_count: candidates are the integers 0..num_candidates-1 and ballots are
+# ranked lists of ids. Points accumulate in a fixed array indexed by id instead of a dict keyed by name.
+# Returns the winning id (lowest id on a tie), or None if no votes were cast.
+def borda_count_fast(num_candidates: int, votes: List[List[int]], points: List[int] = None) -> Optional[int]:
+    if not votes or num_candidates == 0: return None
+    if not points: points = [len(votes[0]) - i - 1 for i in range(0, len(votes[0]))]
 
+    counts = array("q", [0]) * num_candidates
+    for ballot in votes:
+        assert len(ballot) == len(points), "points list must be same length of voter's preference list"
+        for candidate_id, vote_points in zip(ballot, points):
+            counts[candidate_id] += vote_points
 
+    return max(range(num_candidates), key=counts.__getitem__)
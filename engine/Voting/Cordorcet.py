@@ -2,7 +2,8 @@
 Cordorcet voting method implementation.
 Implements the Cordorcet method, which selects a candidate who would beat every other 
 candidate in a head-to-head election. Returns None if no such candidate exists (a tie or circular preference issue).
-Uses pairwise comparisons to determine if each candidate is a Cordorcet winner.
+Tallies every head-to-head result in a single pass over the ballots (pairwise preference matrix),
+then checks each candidate against it with O(1) lookups per opponent.
 """
 
 from typing import List, Set
@@ -23,28 +24,60 @@ def wins(candidate1: str, candidate2: str, votes: List[List[str]]) -> bool:
 
     return cand1_votes >= cand2_votes # tie goes to candidate 1
 
+def pairwise_matrix(candidates: List[str], votes: List[List[str]]) -> List[List[int]]:
+    # prefs[i][j] = number of ballots preferring candidates[i] over candidates[j], using the same
+    # rule as wins(): whichever of the pair is ranked first gets the ballot, a ranked candidate beats
+    # an unranked one, and ballots ranking neither are ignored. Built in one pass over the ballots:
+    # prefs[i][j] = (#ballots ranking i) - (#ballots ranking j before i), so each ballot only touches
+    # the pairs it actually ranks. Names not in candidates and repeated names are skipped.
+    idx = {candidate: i for i, candidate in enumerate(candidates)}
+    n = len(candidates)
+    ranked = [0] * n
+    before = [[0] * n for _ in range(n)]  # before[j][i] = #ballots ranking j ahead of i
+    for ballot in votes:
+        seen: List[int] = []
+        for candidate in ballot:
+            i = idx.get(candidate)
+            if i is None or i in seen:
+                continue
+            for j in seen:
+                before[j][i] += 1
+            seen.append(i)
+        for i in seen:
+            ranked[i] += 1
+
+    return [[ranked[i] - before[j][i] for j in range(n)] for i in range(n)]
+
 def cordorcet(candidates: List[str], votes: List[List[str]]) -> str or None:
     # make sure we have votes
     if not candidates or not votes or not any(votes): return None
     assert len(candidates) == len(set(candidates)), "algorithm works, but have duplicate candidates in candidates list. Will result in no winners"
 
     n = len(candidates)
+    prefs = pairwise_matrix(candidates, votes)
 
-    # apply condorcet
-    for candidate in candidates:
+    # apply condorcet: a winner beats (or ties, tie goes to the candidate) every opponent head-to-head.
+    # Every head-to-head checked also settles the other side: an opponent strictly beaten by the
+    # candidate can never win, so it goes into non_winners and is never scanned itself.
+    non_winners = set()
+    for i in range(n):
+        if i in non_winners:
+            continue
+        row = prefs[i]
         is_condorcet_winner = True
-        for opponent in candidates:
-            if candidate != opponent and not wins(candidate, opponent, votes):
+        for j in range(n):
+            if j == i:
+                continue
+            if row[j] < prefs[j][i]:
                 is_condorcet_winner = False
+                non_winners.add(i)
                 break
-            
-        if is_condorcet_winner:
-            return candidate
+            if row[j] > prefs[j][i]:
+                non_winners.add(j)
 
+        if is_condorcet_winner:
+            return candidates[i]
+        if len(non_winners) == n:
+            return None
 
     return None
-
-
-
-
-
@@ -16,10 +16,8 @@
 # higher preference. Only the highest-ranked active candidate on each ballot receives
 # that ballot's vote in each round.
 
-import enum
-from typing import Set, List
-from collections import Counter, defaultdict
-import heapq
+from typing import Set, List, Optional
+from array import array
 
 MAJORITY=.5
 
@@ -37,7 +35,8 @@ MAJORITY=.5
 #
 # Algorithm:
 #     - Maintains a set of active candidates, eliminating one per round
-#     - Each round counts votes by finding the first active candidate on each ballot
+#     - Each ballot's vote sits with its first active candidate; only the eliminated candidate's
+#       ballots are moved on to their next active choice, so ballots are never rescanned
 #     - Checks if any candidate has majority (>50% of votes cast for active candidates)
 #     - If no majority, eliminates the candidate with fewest votes
 #     - Continues until one candidate remains or a majority winner emerges
@@ -45,31 +44,59 @@ MAJORITY=.5
 # Note:
 #     - Ballots ranking eliminated candidates effectively skip to their next preference
 #     - Ties in elimination (multiple candidates with minimum votes) are broken arbitrarily
-#       by whichever candidate is encountered last during iteration
+#       by whichever candidate is encountered first during set iteration
 def rcv(candidates: Set[str], votes: List[List[str]]):
-    active_candidates = set(candidates)
-    total_votes = len(votes)
+    # Map candidates to dense ids in set iteration order and run the id-based count below. The lowest
+    # id is then the first candidate in iteration order, which is how elimination ties have always
+    # been broken. Names that aren't candidates are dropped, since they could never receive a vote.
+    active_candidates = list(set(candidates))
+    if not active_candidates: return None
+    ids = {candidate: i for i, candidate in enumerate(active_candidates)}
+    ballots = [[ids[candidate] for candidate in ballot if candidate in ids] for ballot in votes]
+    return active_candidates[rcv_fast(len(active_candidates), ballots)]
 
-    while len(active_candidates) > 1:
-        vote_counts = defaultdict(int)
-        for ballot in votes:
-            for candidate in ballot:
-                if candidate in active_candidates:
-                    vote_counts[candidate] += 1
-                    break
+# Dense-id variant of rcv: candidates are the integers 0..num_candidates-1 and ballots are ranked lists
+# of ids. Active flags and ballot groups are plain lists indexed by id, so no round hashes a candidate.
+# Returns the winning id, or None if there are no candidates. Elimination ties go to the lowest id.
+def rcv_fast(num_candidates: int, votes: List[List[int]]) -> Optional[int]:
+    if num_candidates == 0: return None
+    active = [True] * num_candidates
+    remaining = num_candidates
+    positions = [0] * len(votes)
+    ballots_by_top: List[List[int]] = [[] for _ in range(num_candidates)]
+    # vote count per id (0 once eliminated) in a typed array, so max()/index() scan packed ints
+    counts = array("q", [0]) * num_candidates
+    current_total_votes = 0
 
-        current_total_votes = sum(vote_counts.values())
-        for candidate, count in vote_counts.items():
-            if float(count) / current_total_votes > 0.5:
-                return candidate 
-        
-        min_votes, winner = float("inf"), ""
-        for candidate in active_candidates:
-            count = vote_counts.get(candidate, 0)
-            if count < min_votes:
-                min_votes = count
-                loser = candidate
+    def transfer(ballot_idx: int):
+        # advance the ballot's cursor to its next active candidate (if any) and file it there
+        nonlocal current_total_votes
+        ballot = votes[ballot_idx]
+        pos = positions[ballot_idx]
+        while pos < len(ballot) and not active[ballot[pos]]:
+            pos += 1
+        positions[ballot_idx] = pos
+        if pos < len(ballot):
+            ballots_by_top[ballot[pos]].append(ballot_idx)
+            counts[ballot[pos]] += 1
+            current_total_votes += 1
 
-        active_candidates.remove(loser)
-        
-    return list(active_candidates)[0]
\ No newline at end of file
+    for ballot_idx in range(len(votes)):
+        transfer(ballot_idx)
+
+    while remaining > 1:
+        # at most one candidate can hold a majority, and it would be the top count
+        top = max(counts)
+        if current_total_votes and float(top) / current_total_votes > MAJORITY:
+            return counts.index(top)
+
+        loser = min(filter(active.__getitem__, range(num_candidates)), key=counts.__getitem__)
+        active[loser] = False
+        remaining -= 1
+        moved, ballots_by_top[loser] = ballots_by_top[loser], []
+        counts[loser] = 0
+        current_total_votes -= len(moved)
+        for ballot_idx in moved:
+            transfer(ballot_idx)
+
+    return active.index(True)
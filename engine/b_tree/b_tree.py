@@ -1,38 +1,61 @@
 from typing import Optional
+from array import array
+from bisect import bisect_left, bisect_right, insort_right
 import math
 
 class Node():
-    def __init__(self, m: int, leaf: bool = True):
+    # keys are a plain list by default; given an array typecode (e.g. 'q' for 64-bit ints) they are
+    # stored unboxed and contiguous in an array.array, which bisect and slicing handle the same way
+    def __init__(self, m: int, leaf: bool = True, typecode: Optional[str] = None):
         self.m = m
-        self.keys: list = []
+        self.keys = array(typecode) if typecode else []
         self.children: list['Node'] = []
         self.leaf = leaf
 
 class BTree():
-    def __init__(self, m: int):
+    # - m: order of the tree (max children per node), at least 3
+    # - typecode: optional array.array typecode for numeric keys (e.g. 'q'), storing each node's keys
+    #   as packed 8-byte values instead of a list of boxed objects; None keeps a list (any keys).
+    #   Keys the typecode can't hold are rejected by array itself: e.g. a float or str key into 'q'
+    #   raises TypeError and an out-of-range int raises OverflowError. The check happens when the key
+    #   is placed in its leaf, before any split, so a rejected insert leaves the tree unchanged.
+    def __init__(self, m: int, typecode: Optional[str] = None):
         if m < 3:
             raise ValueError("B-Tree order m must be greater than or equal to 3")
-        self.tree = Node(m, True)
+        self.typecode = typecode
+        self.tree = Node(m, True, typecode)
         self.m_ary = m
 
     def insert(self, key):
-        
-        root = self.tree
-        MAX_KEYS = self.m_ary - 1
-        
-        if len(root.keys) == MAX_KEYS:
-            new_root = Node(self.m_ary, False)
-            new_root.children = [root]
-            self.tree = new_root
-            self._split_child(new_root, 0, root)
-            self._insert_non_full(new_root, key)
-
-        else:
-            self._insert_non_full(root, key)
+        # Descend to the leaf the key belongs in, remembering (node, child index) at each level,
+        # place the key in sorted position, then split bottom-up while a node has overflowed to m keys.
+        # Splitting on overflow (rather than splitting full nodes on the way down) leaves both halves
+        # non-empty for every m >= 3, including m = 3 where a full node has only two keys.
+        path = []
+        node = self.tree
+        while not node.leaf:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        insort_right(node.keys, key)
+
+        while len(node.keys) >= self.m_ary:
+            if path:
+                parent, i = path.pop()
+            else:
+                # the root overflowed: grow the tree by one level
+                parent = Node(self.m_ary, False, self.typecode)
+                parent.children = [node]
+                self.tree = parent
+                i = 0
+            self._split_child(parent, i, node)
+            node = parent
 
-        
     def _split_child(self, parent: Node, index: int, child: Node):
-        z = Node(self.m_ary, leaf=child.leaf)
+        # Split the overflowing child at parent.children[index] (m keys) around its middle key: the
+        # upper half of its keys (and children) moves to a new right sibling in one slice each, and the
+        # middle key moves up into the parent between the two halves. Both halves keep >= 1 key.
+        z = Node(self.m_ary, leaf=child.leaf, typecode=self.typecode)
 
         mid = len(child.keys) //2
         seperator = child.keys[mid]
@@ -41,61 +64,31 @@ class BTree():
         child.keys = child.keys[:mid]
 
         if not child.leaf:
-            pass
-
-        
-
-
-            
-
-        
-
-        
-            
-
-
-
-
-
-
-
-
-
-
-
-
+            z.children = child.children[mid + 1:]
+            child.children = child.children[:mid + 1]
 
+        parent.keys.insert(index, seperator)
+        parent.children.insert(index + 1, z)
 
     def exists(self, key):
         return True if self.search(key) is not None else False
     
     def search(self, key, node=None):
+        # Descend iteratively from node (default: the root), one loop iteration per level, instead of
+        # a recursive call (and Python frame) per level.
         node = self.tree if node is None else node
-        
-        if node is None:
-            return None
 
-        if not node.keys and (node.leaf or not node.children):
-            return None
-
-        left, right = 0, len(node.keys) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            if node.keys[mid] == key:
-                return node.keys[mid]
-            elif node.keys[mid] > key:
-                right = mid - 1
-            else:
-                left = mid + 1
+        while node is not None:
+            # bisect runs the comparisons in C; keys[i] is the first key >= key
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                return node.keys[i]
 
-        if node.leaf:
-            return None
+            if node.leaf or i >= len(node.children):
+                return None
+            node = node.children[i]
 
-        child_index = left
-        if child_index >= len(node.children):
-            return None
-        
-        return self.search(key, node.children[child_index])
+        return None
 
     def delete(self, data):
         pass
\ No newline at end of file
@@ -1,13 +1,19 @@
 from typing import Dict, List
+from collections import defaultdict
+from operator import attrgetter
 import time
 from .schemas import Atom
 
+_RECENCY_KEY = attrgetter("timestamp", "sequence")
+_TIE_BREAK_KEY = attrgetter("site_id", "id")
+
 class CRDT():
 	def __init__(self, site_id: str):
 		self.atoms: Dict[str, Atom] = {}
 		self.site_id = site_id
-		self._last_ts = 0
-		self._seq = 0
+		# the clock is read once per session; ids within it are ordered by an in-process counter
+		self._base_ts = time.time_ns()
+		self._counter = 0
 		root_atom = Atom(
 			id="ROOT",
 			value=None,
@@ -21,14 +27,10 @@ class CRDT():
 		self.ROOT_ID = root_atom.id
 
 	def _next_id(self):
-		ts = int(time.time_ns())
-		if ts == self._last_ts:
-			self._seq += 1
-		else:
-			self._last_ts = ts
-			self._seq = 0
-		new_id = f"{ts}-{self._seq}-{self.site_id}"
-		return ts, self._seq, new_id
+		# (timestamp, sequence, id) without a clock read per atom: timestamp is the session start and
+		# sequence a per-site counter, so ids stay unique per site and later inserts sort as newer
+		self._counter += 1
+		return self._base_ts, self._counter, f"{self._base_ts}-{self._counter}-{self.site_id}"
 
 	def generate_unique_id(self) -> str:
 		_, _, new_id = self._next_id()
@@ -63,27 +65,35 @@ class CRDT():
 		self.atoms[atom_id] = existing
 
 	def converge(self):
-		children_map: Dict[str, List[Atom]] = {}
+		children_map: Dict[str, List[Atom]] = defaultdict(list)
 		for atom in self.atoms.values():
 			if atom.predecessor_id:
-				children_map.setdefault(atom.predecessor_id, []).append(atom)
+				children_map[atom.predecessor_id].append(atom)
 
-		def sort_key(a: Atom):
-			# newer first, break ties with sequence, then site_id, then id
-			return (-a.timestamp, -a.sequence, a.site_id, a.id)
+		# sort every sibling group once up front, so the walk below never sorts. Order is newer first
+		# (timestamp, then sequence, descending), ties broken by site_id, then id (ascending). Done as
+		# two stable sorts with C-level attrgetter keys instead of a Python key function per atom:
+		# the tie-breakers first, then the descending sort, which keeps equal-time atoms in that order.
+		for children in children_map.values():
+			if len(children) > 1:
+				children.sort(key=_TIE_BREAK_KEY)
+				children.sort(key=_RECENCY_KEY, reverse=True)
 
 		text_result: List[str] = []
 		id_map_result: List[str] = []
 
-		def traverse(parent_id: str):
-			children = sorted(children_map.get(parent_id, []), key=sort_key)
-			for child in children:
-				if not child.tombstone and child.value is not None:
-					text_result.append(child.value)
-					id_map_result.append(child.id)
-				traverse(child.id)
+		# pre-order walk with an explicit stack (deep documents would exceed the recursion limit);
+		# siblings are pushed reversed so they pop in sorted order
+		stack = list(reversed(children_map.get(self.ROOT_ID, [])))
+		while stack:
+			atom = stack.pop()
+			if not atom.tombstone and atom.value is not None:
+				text_result.append(atom.value)
+				id_map_result.append(atom.id)
+			children = children_map.get(atom.id)
+			if children:
+				stack.extend(reversed(children))
 
-		traverse(self.ROOT_ID)
 		return {
 			"text": "".join(text_result),
 			"id_mapping": id_map_result,
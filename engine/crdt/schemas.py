@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 from typing import Optional
+import sys
 
-@dataclass
+# Slotted on Python 3.10+ (dataclass(slots=True)) so each atom skips a per-instance __dict__, which
+# matters for documents holding millions of atoms. Older versions can't combine hand-written
+# __slots__ with the field defaults below, so they keep a regular dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Atom:
 	id: str
 	value: Optional[str] = None
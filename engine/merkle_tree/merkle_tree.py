@@ -1,189 +1,270 @@
 # Merkle Tree implementation specialized for list[str] inputs.
 # Leaves are string contents hashed with SHA-256 (UTF-8), and internal nodes hash the
-# concatenation of child digests. The tree duplicates the last child when a level has
-# an odd number of nodes, ensuring every internal node has two children.
-# For usability and performance, it stores both parent pointers (fast O(log N) updates)
-# and an array of levels with root-first ordering (O(1) node access by (level, index)).
+# concatenation of the two raw 32-byte child digests (one 64-byte input). The tree duplicates
+# the last child when a level has an odd number of nodes, ensuring every internal node has two
+# children.
+# Storage is struct-of-arrays: one bytearray of packed 32-byte digests per level, root-first.
+# Node i of a level occupies bytes [32*i, 32*i + 32), its children are nodes 2i and 2i + 1 of
+# the level below and its parent is node i >> 1 of the level above, so there are no per-node
+# objects or pointers; digests are bytes internally and hex only at the API boundary.
 
-from collections import deque
-from typing import List, Self, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Self, Tuple
 from .DiffResult import DiffResult
 import hashlib
+import os
 
-# Node structure representing a Merkle node (leaf or internal).
-# - data: hex digest string for this node (SHA-256 of leaf content or of child digests).
-# - left/right: child links (None for leaves).
-# - parent: parent link (None at root). Enables efficient upward recomputation.
-# - content: human-readable content (leaf string for leaves; "L+R" for internal nodes).
-class Node():
-    def __init__(self, data, left, right, parent, content):
-        self.data = data
-        self.left: Node = left
-        self.right: Node = right
-        self.parent: Node = parent
-        self.content: str = content
+# Size of one SHA-256 digest, i.e. the stride of every level slab.
+DIGEST_SIZE = 32
+
+# Leaf hashing fans out to threads only when it can actually run in parallel: hashlib releases the
+# GIL while hashing inputs of at least ~2 KiB, so smaller leaves stay on the calling thread.
+_PARALLEL_MIN_LEAVES = 1024
+_GIL_RELEASE_MIN_BYTES = 2048
+
+# Digest of an internal node: SHA-256 over exactly 64 bytes (two child digests). Module-level with
+# the constructor pre-bound so hot paths skip generate_hash()'s method dispatch and str check.
+def _sha256_64(left: bytes, right: bytes, _sha256=hashlib.sha256) -> bytes:
+    return _sha256(left + right).digest()
+
+# Hash a contiguous run of leaf strings (one thread pool task).
+def _hash_strings(strings: List[str]) -> List[bytes]:
+    sha256 = hashlib.sha256
+    return [sha256(string.encode('utf-8')).digest() for string in strings]
+
+# Leaf digests are compared this many at a time: a block of equal digests is skipped with one
+# contiguous bytes comparison, and only unequal blocks are scanned digest by digest.
+_DIFF_BLOCK_DIGESTS = 64
+
+# Indices (< count) at which two packed digest slabs differ, stopping once `limit` are found.
+# Compares the stored digests directly, so no leaf is rehashed.
+def _differing_digests(a: bytes, b: bytes, count: int, limit: int) -> List[int]:
+    res: List[int] = []
+    end = count * DIGEST_SIZE
+    step = _DIFF_BLOCK_DIGESTS * DIGEST_SIZE
+    for start in range(0, end, step):
+        stop = min(start + step, end)
+        if a[start:stop] == b[start:stop]:
+            continue
+        for offset in range(start, stop, DIGEST_SIZE):
+            if a[offset:offset + DIGEST_SIZE] != b[offset:offset + DIGEST_SIZE]:
+                res.append(offset // DIGEST_SIZE)
+                if len(res) >= limit:
+                    return res
+    return res
 
 # MerkleTree built from a list of strings. Provides:
-# - Building and (re)building the tree (full rebuild on append ops in this version).
+# - Building the tree, and appending leaves incrementally (O(log N) hashes per leaf).
 # - Equality and structural diff utilities.
-# - Point updates to a leaf with O(log N) recomputation using parent pointers.
-# - O(1) node addressing via precomputed root-first levels.
+# - Point updates to a leaf, batched: ancestors of all updated leaves are rehashed once on commit().
+# - O(1) digest addressing by (level, index) over contiguous per-level slabs.
 class MerkleTree():
-    # Initialize from a list[str] of leaf contents. Builds the tree and the levels index.
-    # size mirrors the number of leaves; levels is root-first; tree is the root node (or None).
+    # Initialize from a list[str] of leaf contents. Builds the per-level digest slabs.
+    # size mirrors the number of leaves; digests is root-first (digests[-1] holds the leaves).
     def __init__(self, data: List[str]):
         self.data = data
         self.size = len(data)
-        self.levels = []
-        self.tree = self.init_merkle_tree()
+        self.digests: List[bytearray] = []
+        # leaf indices updated by set_leaf() whose ancestors haven't been rehashed yet (see commit())
+        self._dirty = set()
+        self.init_merkle_tree()
+
+    # Return the root digest (32 bytes), or None if the tree is empty.
+    # Commits pending set_leaf() updates first, so the root digest is always current.
+    def get_root(self) -> Optional[bytes]:
+        if not self.digests:
+            return None
+        self.commit()
+        return bytes(self.digests[0])
+
+    # Root digest as hex (or None if empty), for display and external comparison.
+    def root_hex(self) -> Optional[str]:
+        root = self.get_root()
+        return root.hex() if root is not None else None
 
-    # Return the root node (or None if the tree is empty). Most callers want root.data.
-    def get_root(self):
-        return self.tree
-    
     # Return the current number of leaves. This mirrors len(self.data) and is kept in sync.
     def get_leaves(self):
         return self.size
-    
+
     # Return the raw string content at a leaf index (0-based). Does not return the hash.
     def get_leaf(self, idx: int):
         return self.data[idx]
-    
+
     # Return the height (number of levels), counting the root as level 0.
     def height(self):
-        return len(self.levels)
-    
+        return len(self.digests)
+
     # Return the number of nodes at a given level (0-based, root-first).
     # Returns -1 if level is out of range.
     def level_width(self, level: int):
-        if level < 0 or level >= len(self.level):
+        if level < 0 or level >= len(self.digests):
             return -1
-        
-        return len(self.level[level])
-    
-    # O(1) access to a node by (level, index), where level is root-first and index is left-to-right.
-    # Returns None if out of bounds or if the tree is empty.
-    def get_node(self, level:int, idx: int) -> Node:
-        if not self.tree or level < 0 or idx < 0 or level >= len(self.levels) or idx >= len(self.levels[level]):
+
+        return len(self.digests[level]) // DIGEST_SIZE
+
+    # O(1) access to a node digest by (level, index), where level is root-first and index is
+    # left-to-right. Returns None if out of bounds or if the tree is empty.
+    def get_node(self, level:int, idx: int) -> Optional[bytes]:
+        if level < 0 or idx < 0 or level >= len(self.digests) or idx >= len(self.digests[level]) // DIGEST_SIZE:
             return None
-        
-        return self.levels[level][idx]
-    
-    # Generate a SHA-256 hex digest from a string (UTF-8). Used for both leaves and internals.
-    # For internal nodes, child digests (hex) are concatenated and hashed.
-    def generate_hash(self, data):
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()
-    
-    # Build the Merkle tree from self.data and populate self.levels (root-first).
-    # - Leaves: hash each string; store as nodes with no children and parent=None.
-    # - Build upward: pair children left/right; if odd, duplicate the last child.
-    # - Set parent pointers for fast upward recomputation; return the root node (or None).
-    def init_merkle_tree(self):
+
+        self.commit()
+        return bytes(self.digests[level][idx * DIGEST_SIZE:(idx + 1) * DIGEST_SIZE])
+
+    # Generate a raw SHA-256 digest (32 bytes). Strings (leaf contents) are UTF-8 encoded first;
+    # bytes (two concatenated child digests for internal nodes) are hashed as-is, with no encode step.
+    def generate_hash(self, data) -> bytes:
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return hashlib.sha256(data).digest()
+
+    # Digest every leaf string. Large batches of large leaves are split into one contiguous range per
+    # worker (not one task per leaf, to amortize dispatch) and hashed on a thread pool.
+    def hash_leaves(self, strings: List[str]) -> List[bytes]:
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(strings) < _PARALLEL_MIN_LEAVES or sum(map(len, strings)) < _GIL_RELEASE_MIN_BYTES * len(strings):
+            return _hash_strings(strings)
+        chunk = -(-len(strings) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_hash_strings, [strings[i:i + chunk] for i in range(0, len(strings), chunk)])
+            return [digest for part in parts for digest in part]
+
+    # Hash one whole level slab: consecutive 64-byte windows are (left, right) child pairs, with the
+    # last digest duplicated when the count is odd, and the parent digests come back as the next
+    # slab. Hashing runs straight over views of the slab with the constructor bound once; this is
+    # also the one place a batched (multi-buffer) SHA-256 implementation would plug in.
+    @staticmethod
+    def hash_level(level: bytes) -> bytearray:
+        if (len(level) // DIGEST_SIZE) % 2:
+            level = bytes(level) + level[-DIGEST_SIZE:]
+        sha256 = hashlib.sha256
+        view = memoryview(level)
+        pair = 2 * DIGEST_SIZE
+        return bytearray(b"".join([sha256(view[i:i + pair]).digest() for i in range(0, len(level), pair)]))
+
+    # Build the digest slabs from self.data (root-first) and return the root digest (or None).
+    # - Leaves: hash each string (hash_leaves) into the leaf slab.
+    # - Build upward one level at a time with hash_level() (if odd, the last child is duplicated).
+    def init_merkle_tree(self) -> Optional[bytes]:
+        self._dirty = set()
         if self.size == 0:
-            self.levels = []
-            self.tree = None
+            self.digests = []
             return None
-        # Build the leaf hashess
-        leaf_hashes = [Node(self.generate_hash(string), left=None, right=None, parent=None, content=string) for string in self.data]
-        levels = [leaf_hashes]
-        q = deque(leaf_hashes) 
-
-        # build the rest of the tree
-        while len(q) > 1:
-            next_q = deque()
-            curr_level = []
-            
-            while q:
-                left_child = q.popleft()
-                right_child = q.popleft() if q else left_child
-                content = f"{left_child.content}+{right_child.content}"
-                parent = Node(self.generate_hash(left_child.data + right_child.data), left=left_child, right=right_child, parent=None, content=content)
-                left_child.parent = parent
-                right_child.parent = parent
-                next_q.append(parent)
-                curr_level.append(parent)
-
-            levels.append(curr_level)
-            q = next_q
-
-        self.levels = list(reversed(levels))
-        return q[0] if q else None
-    
+        level = bytearray(b"".join(self.hash_leaves(self.data)))
+        levels = [level]
+        while len(level) > DIGEST_SIZE:
+            level = self.hash_level(level)
+            levels.append(level)
+
+        self.digests = list(reversed(levels))
+        return bytes(self.digests[0])
+
+    # Children of node i on a level of width `width`: (2i, 2i + 1), or (2i, 2i) when 2i is the last
+    # node (the duplicated odd child).
+    @staticmethod
+    def _children(i: int, width: int) -> Tuple[int, int]:
+        left = 2 * i
+        return left, (left + 1 if left + 1 < width else left)
+
+    # Leaf strings under node i of a level, left to right (a duplicated odd child repeats its leaves).
+    # Walks the slab index math recursively; nothing but the leaf strings themselves is stored.
+    def _leaf_contents(self, level: int, i: int) -> Iterator[str]:
+        if level == len(self.digests) - 1:
+            yield self.data[i]
+            return
+        for child in self._children(i, len(self.digests[level + 1]) // DIGEST_SIZE):
+            yield from self._leaf_contents(level + 1, child)
+
+    # Display content of a node: the leaf string, or "L+R" recomputed on demand for internal nodes.
+    def _content(self, level: int, i: int) -> str:
+        return "+".join(self._leaf_contents(level, i))
+
     # Breadth-first traversal that returns a list of either node hashes or content strings.
     # - If both flags are False, returns [].
+    # - Like the pointer-based layout it replaces, a duplicated odd child (and its subtree) is
+    #   visited once per parent link, so it appears twice.
     # - Be cautious: content strings on internal nodes grow as "L+R" and can become large.
     def print_tree(self, hashes: bool = False, content: bool = False) -> List[str]:
         if self.size == 0 or (not hashes and not content):
             return []
+        self.commit()
         res = []
-        q = deque()
-        q.append(self.tree)
-        while q:
-            n = len(q)
+        frontier = [0]
+        for level in range(len(self.digests)):
+            slab = self.digests[level]
+            for i in frontier:
+                res.append(slab[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE].hex() if hashes else self._content(level, i))
+            if level + 1 < len(self.digests):
+                width = len(self.digests[level + 1]) // DIGEST_SIZE
+                frontier = [child for i in frontier for child in self._children(i, width)]
 
-            for i in range(n):
-                curr = q.popleft()
-                res.append(curr.data if hashes else curr.content)
-
-                if curr.left:
-                    q.append(curr.left)
-                
-                if curr.right:
-                    q.append(curr.right)
-
-        return res  
+        return res
 
     # Root equality check: returns True if both trees are non-empty and the root digests match.
     # This is an O(1) identity/equality check over the committed content and order.
     def equals(self, merkle_tree: Self) -> bool:
-        return (self.tree is not None and merkle_tree.tree is not None and self.tree.data == merkle_tree.tree.data)
+        a_root, b_root = self.get_root(), merkle_tree.get_root()
+        return a_root is not None and b_root is not None and a_root == b_root
 
     # Structural diff: walks top-down comparing subtree hashes. Returns:
     # - first_difference: (level, index) of the first differing subtree, or (-1, -1) if none.
     # - differing_subtrees: list[(level, index)] for all differing subtrees discovered.
-    # - leaf_differing_indices: list[int] of leaf indices whose leaf hashes differ (bounded by max_diffs).
+    # - leaf_differing_indices: list[int] of leaf indices whose stored leaf digests differ (bounded by max_diffs).
     # If early_exit is True, stops after the first differing subtree. Assumes same policy/build rules.
+    # Nodes are (node index or None) per tree; a tree with fewer levels runs out (None) first.
     def diff(self, merkle_tree: Self, max_diffs: int, early_exit: bool = False) -> DiffResult:
         if self.equals(merkle_tree):
             return DiffResult(first_difference=(-1, -1), leaf_differing_indices=[], differing_subtrees=[])
-        
+
         differing_subtrees: List[Tuple[int, int]] = []
         first_difference = None
+        a_levels, b_levels = self.digests, merkle_tree.digests
 
-        # compute diff
+        # compute diff: the frontier holds (position, a node index, b node index) for one level, where
+        # position is the subtree's index among the children of the previous level's differing
+        # subtrees and a missing node (past the leaves of the shorter tree, or an empty tree) is None.
+        # Digests are sliced straight out of each level slab; equal subtrees are never expanded.
         curr_level = 0
-        curr_level_pairs = [(self.tree, merkle_tree.tree)]        
-        while curr_level_pairs:
-            next_level_pairs = []
-            for idx, (a, b) in enumerate(curr_level_pairs):
-                a_hash = a.data if a else None
-                b_hash = b.data if b else None
-
-                if a_hash != b_hash:
-                    if first_difference is None:
-                        first_difference = (curr_level, idx)
-                        if early_exit:
-                            return DiffResult(
-                                first_difference=first_difference,
-                                leaf_differing_indices=[],
-                                differing_subtrees=[first_difference]
-                            )
-                    differing_subtrees.append((curr_level, idx))
-                    next_level_pairs.append((a.left if a else None, b.left if b else None))
-                    next_level_pairs.append((a.right if a else None, b.right if b else None))
-
-            curr_level_pairs = next_level_pairs
+        frontier = [(0, 0 if a_levels else None, 0 if b_levels else None)]
+        while frontier:
+            a_slab = a_levels[curr_level] if curr_level < len(a_levels) else None
+            b_slab = b_levels[curr_level] if curr_level < len(b_levels) else None
+            a_width = len(a_levels[curr_level + 1]) // DIGEST_SIZE if curr_level + 1 < len(a_levels) else 0
+            b_width = len(b_levels[curr_level + 1]) // DIGEST_SIZE if curr_level + 1 < len(b_levels) else 0
+            next_frontier = []
+            differing = 0
+            for pos, a, b in frontier:
+                a_hash = a_slab[a * DIGEST_SIZE:(a + 1) * DIGEST_SIZE] if a is not None else None
+                b_hash = b_slab[b * DIGEST_SIZE:(b + 1) * DIGEST_SIZE] if b is not None else None
+                if a_hash == b_hash:
+                    continue
+
+                if first_difference is None:
+                    first_difference = (curr_level, pos)
+                    if early_exit:
+                        return DiffResult(
+                            first_difference=first_difference,
+                            leaf_differing_indices=[],
+                            differing_subtrees=[first_difference]
+                        )
+                child_pos = 2 * differing
+                differing += 1
+                differing_subtrees.append((curr_level, pos))
+                a_left, a_right = self._children(a, a_width) if a is not None and a_width else (None, None)
+                b_left, b_right = self._children(b, b_width) if b is not None and b_width else (None, None)
+                if a_left is not None or b_left is not None:
+                    next_frontier.append((child_pos, a_left, b_left))
+                    next_frontier.append((child_pos + 1, a_right, b_right))
+
+            frontier = next_frontier
             curr_level += 1
 
         # leaf differences
-        leaf_differing_indices: List[int] = []
         a_leaves, b_leaves = self.data, merkle_tree.data
         L = min(len(a_leaves), len(b_leaves))
-        for i in range(L):
-            if self.generate_hash(a_leaves[i]) != self.generate_hash(b_leaves[i]):
-                leaf_differing_indices.append(i)
-                if len(leaf_differing_indices) >= max_diffs:
-                    break
+        leaf_differing_indices = _differing_digests(
+            a_levels[-1] if a_levels else b"", b_levels[-1] if b_levels else b"", L, max_diffs
+        )
 
         if len(leaf_differing_indices) < max_diffs and len(a_leaves) != len(b_leaves):
             i = L
@@ -199,53 +280,89 @@ class MerkleTree():
             leaf_differing_indices=leaf_differing_indices,
             differing_subtrees=differing_subtrees,
         )
-    
-    # Point update: replace the string at leaf index with new_str and recompute upward to the root.
-    # - Skips recomputation if the new digest equals the current leaf digest.
-    # - Updates self.data, leaf.content, leaf.data, and then all ancestor node digests/content.
+
+    # Point update: replace the string at leaf index with new_str. Ancestors are not rehashed here:
+    # the leaf index is recorded as dirty and commit() (run automatically by every read) rehashes
+    # the union of the dirty leaves' ancestors once, so K updates between reads share their paths.
+    # - Skips marking dirty if the new digest equals the current leaf digest.
+    # - Updates self.data and the leaf digest immediately.
     # - Returns True on success; False for out-of-range index.
     def set_leaf(self, index: int, new_str: str):
         if index < 0 or index >= len(self.data):
             return False
-        
-        # get leaf and update
-        leaf = self.levels[-1][index]
+        return self._set_leaf_internal(index, new_str)
+
+    def _set_leaf_internal(self, index: int, new_str: str):
+        leaves = self.digests[-1]
+        start = index * DIGEST_SIZE
         new_digest = self.generate_hash(new_str)
-        if new_digest == leaf.data:
-            self.data[index] = new_str 
-            leaf.content = new_str
-            return True
-        
         self.data[index] = new_str
-        leaf.content = new_str
-        leaf.data = self.generate_hash(new_str)
+        if new_digest != leaves[start:start + DIGEST_SIZE]:
+            leaves[start:start + DIGEST_SIZE] = new_digest
+            self._dirty.add(index)
+        return True
 
-        # traverse back up tree and update hashes
-        node = leaf.parent
-        while node:
-            node.content = f"{node.left.content}+{node.right.content}"
-            node.data = self.generate_hash(node.left.data + node.right.data)
-            node = node.parent
+    # Rehash every ancestor of the leaves changed since the last commit, bottom-up. The parent of
+    # node i is node i >> 1 one level up, so each level's dirty set is the previous one shifted,
+    # and shared ancestors are hashed once. No-op when nothing is dirty.
+    def commit(self):
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        for depth in range(2, len(self.digests) + 1):
+            children, level = self.digests[-depth + 1], self.digests[-depth]
+            width = len(children) // DIGEST_SIZE
+            dirty = {i >> 1 for i in dirty}
+            for i in dirty:
+                left, right = self._children(i, width)
+                level[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE] = _sha256_64(
+                    children[left * DIGEST_SIZE:(left + 1) * DIGEST_SIZE],
+                    children[right * DIGEST_SIZE:(right + 1) * DIGEST_SIZE],
+                )
+        self._dirty = set()
 
-        return True
+    # Attach a new leaf digest at the right edge and rehash only its ancestors. Appending leaf i only
+    # changes node i >> k on each level k (its parent either gains the new node as right child in
+    # place of the duplicated left one, or is created), so this is O(log N) hashes; a new root level
+    # is added when the old root gains a sibling.
+    def _attach_leaf(self, leaf_digest: bytes):
+        self.commit()
+        if not self.digests:
+            self.digests = [bytearray(leaf_digest)]
+            return
+
+        self.digests[-1] += leaf_digest
+        depth = 1  # counts levels up from the leaves (digests[-depth])
+        while True:
+            level = self.digests[-depth]
+            width = len(level) // DIGEST_SIZE
+            if width == 1:
+                return
+            if depth == len(self.digests):
+                self.digests.insert(0, bytearray())
+            parent_level = self.digests[-depth - 1]
+
+            p = (width - 1) >> 1
+            left, right = self._children(p, width)
+            digest = _sha256_64(level[left * DIGEST_SIZE:(left + 1) * DIGEST_SIZE], level[right * DIGEST_SIZE:(right + 1) * DIGEST_SIZE])
+            parent_level[p * DIGEST_SIZE:(p + 1) * DIGEST_SIZE] = digest
+            depth += 1
 
-    # Append a single leaf (full rebuild version): appends to self.data, rebuilds the tree/levels,
-    # updates size, and returns the new leaf Node (last element of the leaf level).
-    # This is simple and correct; an O(log N) incremental version can replace it later.
-    # TODO: implement in log n time (i got lazy, there has to be a way)
-    def append_leaf(self, new_str: str) -> Node:
+    # Append a single leaf: appends to self.data, hashes the new leaf and its O(log N) ancestors
+    # (no rebuild), updates size, and returns the new leaf's digest.
+    def append_leaf(self, new_str: str) -> bytes:
         self.data.append(new_str)
-        self.tree = self.init_merkle_tree()
         self.size = len(self.data)
-        return self.levels[-1][-1]
+        leaf_digest = self.generate_hash(new_str)
+        self._attach_leaf(leaf_digest)
+        return leaf_digest
 
-    # Append multiple leaves (full rebuild version): extends self.data, rebuilds the tree/levels,
-    # updates size, and returns the list of newly appended leaf Nodes in order.
-    # This enables callers to capture handles to the new leaves immediately after append.
-    def append_leaves(self, new_strs: list[str]) -> List[Node]:
-        start = len(self.data)
+    # Append multiple leaves: extends self.data and attaches each new leaf incrementally (O(log N)
+    # hashes each), updates size, and returns the new leaves' digests in order.
+    def append_leaves(self, new_strs: list[str]) -> List[bytes]:
+        new_digests = self.hash_leaves(new_strs)
         self.data.extend(new_strs)
-        self.tree = self.init_merkle_tree()
         self.size = len(self.data)
-        return self.levels[-1][start:]
-        
\ No newline at end of file
+        for leaf_digest in new_digests:
+            self._attach_leaf(leaf_digest)
+        return new_digests
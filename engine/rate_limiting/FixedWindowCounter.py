@@ -3,9 +3,22 @@
 # number of requests per key within each window. When a window expires, all counts reset.
 # It supports blacklisting, tracks per-key and global metrics, and provides utilities
 # for querying remaining requests and time until the next window reset.
-# This implementation is not thread-safe.
-from typing import List, Dict
-from datetime import datetime
+# Thread-safe within one process: per-key state is guarded by one of _LOCK_STRIPES locks picked by
+# hash(key), so requests for different keys rarely contend; the window reset and the global
+# counters each have their own lock. Readers (map, user_metrics, bad_actors) don't lock: they
+# iterate a copy of the per-key dict, so concurrent allow() calls adding keys can't break them,
+# and each key's values are as of that copy.
+# Memory: every key ever seen keeps its entry (it carries the key's lifetime allowed/denied
+# metrics); a window reset zeroes counts lazily but does not remove keys.
+from typing import List, Dict, Optional
+import threading
+import time
+
+# Window length in milliseconds for each supported unit.
+_UNIT_MS = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
+
+# Number of lock stripes (a power of two, so a stripe is picked with a mask).
+_LOCK_STRIPES = 64
 
 # FixedWindowCounter enforces a request limit per key over a discrete time window.
 # - Tracks requests for unique keys using a dictionary.
@@ -22,14 +35,20 @@ class FixedWindowCounter():
     # Sets up internal state for tracking requests, windows, and metrics.
     def __init__(self, unit: str, limit: int):
         self.unit = self.__validate_unit(unit)
+        self._unit_ms = _UNIT_MS[self.unit]
         self.limit = self.__validate_limit(limit)
-        self.map: Dict[str, int] = {}
-        self.start_window = self.__get_time()
+        # per-key [window_start, count, allowed, denied]: one dict lookup per request reaches the
+        # key's window count and metrics; count only applies while window_start == self.start_window
+        self.state: Dict[str, List] = {}
+        # monotonic ms at which the current window opened; None until the first request opens one
+        self.start_window: Optional[int] = None
         self.blacklist: set = set()
 
         self.allowed = 0
         self.denied = 0
-        self.user_metrics = {}
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._window_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
 
     # Returns the total number of allowed requests across all keys since initialization.
     def get_allowed(self):
@@ -63,11 +82,11 @@ class FixedWindowCounter():
         
         return limit
     
-    # Current time in epoch milliseconds (wall clock).
+    # Current time in milliseconds from the monotonic clock (immune to wall-clock jumps).
     # NOTE: Tests may stub an instance attribute named "__get_time" (without name mangling).
     # To support that, internal callers should use _now_ms(), which prefers the instance stub.
     def __get_time(self):
-        return int(datetime.now().timestamp() * 1000)
+        return time.monotonic_ns() // 1_000_000
 
     # Returns current time in ms, preferring a test-provided instance stub named "__get_time".
     def _now_ms(self):
@@ -78,28 +97,41 @@ class FixedWindowCounter():
             except Exception:
                 # Fallback to real time if the override misbehaves
                 pass
-        return int(datetime.now().timestamp() * 1000)
+        return time.monotonic_ns() // 1_000_000
 
     # Ensures the current window is aligned with the current time.
-    # Resets the window if time moved forward past the window end or backwards before start.
+    # Opens a new window at the current time if none is open yet or the current one has ended.
+    # The monotonic clock never goes backwards, so only the forward case needs handling.
+    # Counts are tagged with the window they belong to, so a reset is O(1): counts from an older
+    # window read as 0 and are overwritten on the key's next request. Returns the window start.
     def _ensure_window_current(self):
-        unit_ms = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
         now_ms = self._now_ms()
-        window_len = unit_ms[self.unit]
-        if now_ms < self.start_window or now_ms > self.start_window + window_len:
-            self.start_window = now_ms
-            self.map.clear()
+        if self.start_window is None or now_ms > self.start_window + self._unit_ms:
+            with self._window_lock:
+                if self.start_window is None or now_ms > self.start_window + self._unit_ms:
+                    self.start_window = now_ms
+        return self.start_window
+
+    # Per-key request counts in the current window (keys with no requests in it are omitted).
+    @property
+    def map(self) -> Dict[str, int]:
+        return {key: entry[1] for key, entry in self.state.copy().items() if entry[0] == self.start_window and entry[1]}
+
+    # Per-key [allowed, denied] metrics since initialization.
+    @property
+    def user_metrics(self) -> Dict[str, List[int]]:
+        return {key: [entry[2], entry[3]] for key, entry in self.state.copy().items()}
     
     # Checks if the current time is past the end of the previous window.
     def __is_past_prev_window_end(self):
-        unit_ms = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
-        return self.start_window + unit_ms[self.unit] < self._now_ms()
+        return self.start_window is None or self.start_window + self._unit_ms < self._now_ms()
     
     # Returns the time in milliseconds until the current window expires and all counts reset.
-    # Returns 0 if the window has already expired.
+    # Returns 0 if the window has already expired (or no request has opened one yet).
     def get_time_until_reset(self):
-        unit_ms = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
-        window_end = self.start_window + unit_ms[self.unit]
+        if self.start_window is None:
+            return 0
+        window_end = self.start_window + self._unit_ms
         return max(0, window_end - self._now_ms())
 
     # Checks if a request from a given key is allowed.
@@ -107,38 +139,84 @@ class FixedWindowCounter():
     # Returns False if the key is blacklisted or has exceeded its limit.
     # This method updates both global and per-key metrics.
     def allow(self, key):
-        self.user_metrics.setdefault(key, [0, 0]) # [allowed, denied]
+        with self._locks[hash(key) & (_LOCK_STRIPES - 1)]:
+            allowed = self.__allow_locked(key)
+
+        with self._counter_lock:
+            if allowed:
+                self.allowed += 1
+            else:
+                self.denied += 1
+        return allowed
+
+    # Per-key part of allow(); the caller holds the key's lock stripe.
+    def __allow_locked(self, key):
+        entry = self.state.get(key)
+        if entry is None:
+            entry = self.state[key] = [None, 0, 0, 0]
 
         if key in self.blacklist:
-            self.denied += 1
-            self.user_metrics[key][1] += 1
+            entry[3] += 1
             return False
-        
-        self._ensure_window_current()
 
-        count = self.map.get(key, 0)
-        if count >= self.limit:
-            self.denied += 1
-            self.user_metrics[key][1] += 1
+        start_window = self._ensure_window_current()
+        if entry[0] != start_window:
+            entry[0] = start_window
+            entry[1] = 0
+
+        if entry[1] >= self.limit:
+            entry[3] += 1
             return False
-        
-        self.map[key] = count + 1
-        self.allowed += 1
-        self.user_metrics[key][0] += 1
+
+        entry[1] += 1
+        entry[2] += 1
         return True
 
+    # Admits up to n requests from a key in one call and returns how many were allowed; the rest
+    # are denied. Metrics end up as if allow() had been called n times, but the key's lock stripe
+    # and the counter lock are each taken once. Raises ValueError if n is negative.
+    def allow_batch(self, key, n: int) -> int:
+        if n < 0:
+            raise ValueError("Invalid batch size, must be 0 or greater.")
+
+        with self._locks[hash(key) & (_LOCK_STRIPES - 1)]:
+            entry = self.state.get(key)
+            if entry is None:
+                entry = self.state[key] = [None, 0, 0, 0]
+
+            if key in self.blacklist:
+                taken = 0
+            else:
+                start_window = self._ensure_window_current()
+                if entry[0] != start_window:
+                    entry[0] = start_window
+                    entry[1] = 0
+
+                taken = min(n, self.limit - entry[1])
+                entry[1] += taken
+                entry[2] += taken
+            entry[3] += n - taken
+
+        with self._counter_lock:
+            self.allowed += taken
+            self.denied += n - taken
+        return taken
+
     # Returns the number of remaining requests a key can make in the current window.
     # Returns the full limit for keys that have not yet made a request.
     def remaining(self, key):
-        self._ensure_window_current()
-        return self.limit - self.map.get(key, 0)
+        start_window = self._ensure_window_current()
+        entry = self.state.get(key)
+        if entry is None or entry[0] != start_window:
+            return self.limit
+        return self.limit - entry[1]
 
     # Returns a list of keys whose denied request count is greater than their allowed count.
     # This can be used to identify clients that are persistently exceeding their limits.
     def bad_actors(self):
         res = []
-        for key, value in self.user_metrics.items():
-            allowed, denied = value
+        for key, entry in self.state.copy().items():
+            _, _, allowed, denied = entry
             if denied > allowed:
                 res.append(key)
         
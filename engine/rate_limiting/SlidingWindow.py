@@ -1,5 +1,5 @@
 # Sliding-window rate limiter (per-key) with millisecond resolution.
-# Stores a sorted list of request timestamps (epoch ms) per key and decides allow/deny
+# Stores an ordered deque of request timestamps (monotonic ms) per key and decides allow/deny
 # based on how many fall within the last rolling time window.
 #
 # Supported units:
@@ -8,27 +8,42 @@
 # Semantics:
 # - A request is allowed if the count of timestamps within the last window is < limit.
 # - Window boundary is inclusive at the start: timestamps >= start_of_window are counted
-#   (because pruning uses bisect_left on sorted timestamps).
+#   (pruning pops only timestamps strictly older than the start of the window).
 #
 # State:
-# - map: Dict[str, List[int]] → per-key ascending timestamps (epoch ms).
+# - state: Dict[str, list] → per-key [timestamps, allowed, denied], so one lookup per request
+#   reaches both; timestamps is a deque of ascending monotonic ms, at most limit entries.
+# - map / user_metrics: read-only views of state (per-key timestamps / [allowed, denied]).
 # - blacklist: set[str] → keys that are always denied by allow().
-# - user_metrics: Dict[str, List[int]] → per-key [allowed, denied] counters.
 # - allowed / denied: global counters across all keys since instance creation.
 #
 # Performance:
-# - allow(key): O(log n) to find boundary plus O(k) to slice when pruning (k pruned items),
-#   and O(1) append when allowed.
-# - remaining(key): O(log n) (no mutation).
+# - allow(key): O(1) append when allowed; pruning pops expired timestamps off the left of the
+#   deque, O(1) per pruned item (no copying of the surviving tail).
+# - remaining(key): O(k) for k expired timestamps still stored (no mutation).
 #
 # Notes:
 # - Old timestamps are pruned only on the over-limit path; under light load, stale entries
 #   may remain until a later over-limit check triggers pruning.
-# - This implementation is single-process and not thread-safe; add locks for concurrency.
-# - Clock is wall time (not monotonic); large clock jumps can affect behavior.
-from datetime import datetime
-from typing import Dict, List
-from bisect import bisect_left
+# - Thread-safe within one process: allow() locks one of _LOCK_STRIPES stripes chosen by
+#   hash(key), so calls for different keys rarely contend; global counters are kept per stripe.
+#   remaining(key) takes the key's stripe lock. The bulk readers (map, user_metrics, bad_actors)
+#   don't lock; they iterate a copy of state and map hands out copies of the deques, so
+#   concurrent allow() calls can't break the iteration.
+# - A key idle for a full window has its timestamps dropped on its next access (lazy expiry).
+#   Its state entry stays (it carries the key's lifetime metrics), so memory grows with the
+#   number of distinct keys seen; lazy expiry only bounds each key's deque.
+# - Clock is monotonic, so wall-clock jumps (NTP, DST, manual changes) cannot affect behavior.
+from collections import deque
+from typing import Deque, Dict, List
+import threading
+import time
+
+# Milliseconds per supported unit.
+_UNIT_MS = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
+
+# Number of lock stripes (a power of two, so a stripe is picked with a mask).
+_LOCK_STRIPES = 64
 
 class SlidingWindow():
     valid_units = ['second', 'minute', 'hour', 'day']
@@ -43,12 +58,24 @@ class SlidingWindow():
     def __init__(self, unit: str, window: int, limit: int):
         self.unit = self.__validate_unit(unit)
         self.window = self.__validate_window(window)
+        self._unit_ms = _UNIT_MS[self.unit]
+        # full rolling window length in ms, so the window start is one subtraction per request
+        self._window_ms = self.window * self._unit_ms
         self.limit = self.__validate_limit(limit)
-        self.map: Dict[str, List[int]] = {}
+        self.state: Dict[str, List] = {}
         self.blacklist: set = set()
-        self.user_metrics = {}
-        self.allowed = 0
-        self.denied = 0
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        # per-stripe [allowed, denied], each guarded by its stripe's lock
+        self._stripe_counts = [[0, 0] for _ in range(_LOCK_STRIPES)]
+
+    # Global allowed / denied counters, summed over the lock stripes.
+    @property
+    def allowed(self):
+        return sum(counts[0] for counts in self._stripe_counts)
+
+    @property
+    def denied(self):
+        return sum(counts[1] for counts in self._stripe_counts)
 
     # Global number of allowed requests since construction (all keys).
     def get_allowed(self):
@@ -58,14 +85,25 @@ class SlidingWindow():
     def get_denied(self):
         return self.denied
     
+    # Per-key request timestamps in the window (copies, so callers never hold a live deque).
+    @property
+    def map(self) -> Dict[str, Deque[int]]:
+        return {key: entry[0].copy() for key, entry in self.state.copy().items()}
+
+    # Per-key [allowed, denied] metrics since construction (read-only view of state).
+    @property
+    def user_metrics(self) -> Dict[str, List[int]]:
+        return {key: [entry[1], entry[2]] for key, entry in self.state.copy().items()}
+
     # Per-key metrics accessor.
     # Returns a tuple (allowed, denied) for the given key.
     # If the key has no recorded metrics, returns (0, 0).
     def get_user_metrics(self, key):
-        if key not in self.user_metrics:
+        entry = self.state.get(key)
+        if entry is None:
             return (0,0)
-        
-        return self.user_metrics[0], self.user_metrics[1]
+
+        return entry[1], entry[2]
 
     # Validate unit against allowed values; raises ValueError for invalid input.
     def __validate_unit(self, unit):
@@ -88,16 +126,14 @@ class SlidingWindow():
         
         return limit
     
-    # Current time in epoch milliseconds (wall clock).
+    # Current time in milliseconds from the monotonic clock.
     def __get_time(self):
-        return int(datetime.now().timestamp() * 1000)
+        return time.monotonic_ns() // 1_000_000
 
-    # Compute the inclusive start boundary (epoch ms) for the current rolling window.
-    # Uses a per-call conversion from unit to milliseconds; entries >= this value are counted.
-    def __get_starting_time(self):
-        current_time = self.__get_time()
-        unit_ms = {'second': 1000, 'minute': 60000, 'hour': 3600000, 'day': 86400000}
-        return current_time - self.window * unit_ms[self.unit]
+    # Compute the inclusive start boundary (monotonic ms) for the current rolling window.
+    # Uses the window length precomputed in __init__; entries >= this value are counted.
+    def _window_start_ms(self):
+        return self.__get_time() - self._window_ms
 
     # Add a key to the blacklist. Any subsequent allow(key) returns False.
     def add_to_blacklist(self, key):
@@ -108,68 +144,80 @@ class SlidingWindow():
     # 1) Immediately deny if key is blacklisted.
     # 2) Initialize per-key storage and per-key metrics on first use.
     # 3) If current in-window count < limit, record timestamp and allow.
-    # 4) Otherwise, prune out-of-window timestamps (using bisect_left on sorted list),
+    # 4) Otherwise, pop out-of-window timestamps off the left of the deque,
     #    then re-check capacity; if below limit, append and allow; else deny.
     # Side effects:
     # - On allow: records timestamp and increments per-key/global allowed counters.
     # - On deny: increments per-key/global denied counters.
-    # Complexity: O(log n + k) when pruning (k pruned), O(1) when under limit and no prune.
+    # Complexity: O(k) when pruning (k pruned), O(1) when under limit and no prune.
+    # The whole decision runs inline under the key's lock stripe, and the global counters are
+    # per-stripe cells summed on read, so a request takes one lock and makes no helper calls.
+    # A key whose newest timestamp is already out of the window is idle: its deque is emptied
+    # on this access (lazy expiry) instead of being scanned.
     def allow(self, key):
         if key in self.blacklist:
             return False
-        
-        if not key in self.map:
-            self.map[key] = []
-            self.user_metrics[key] = [0,0]
-
-        # under limit, allow
-        if len(self.map[key]) < self.limit:
-            self.map[key].append(self.__get_time())
-            self.user_metrics[key][0] += 1
-            self.allowed += 1
-            return True
-
-        # over limit, binary search for first timestamp within window and then update list
-        start_window = self.__get_starting_time()
-        arr = self.map[key]
-
-        # First index with value >= start_window (inclusive boundary).
-        i = bisect_left(arr, start_window)
-        if i > 0:
-            arr = arr[i:]
-            self.map[key] = arr
-
-        if len(arr) < self.limit:
-            arr.append(self.__get_time())
-            self.user_metrics[key][0] += 1
-            self.allowed += 1
-            return True
-        
-        self.user_metrics[key][1] += 1
-        self.denied += 1
-        return False
-    
+
+        stripe = hash(key) & (_LOCK_STRIPES - 1)
+        with self._locks[stripe]:
+            entry = self.state.get(key)
+            if entry is None:
+                entry = self.state[key] = [deque(maxlen=self.limit), 0, 0]
+            arr = entry[0]
+
+            now = self.__get_time()
+            start_window = now - self._window_ms
+            if arr and arr[-1] < start_window:
+                arr.clear()
+
+            # over limit, drop timestamps that fell out of the window (inclusive boundary) in place
+            if len(arr) >= self.limit:
+                while arr and arr[0] < start_window:
+                    arr.popleft()
+
+            counts = self._stripe_counts[stripe]
+            if len(arr) < self.limit:
+                arr.append(now)
+                entry[1] += 1
+                counts[0] += 1
+                return True
+
+            entry[2] += 1
+            counts[1] += 1
+            return False
+
     # Read-only capacity query for a key (does not mutate state).
     # Returns how many additional requests are currently allowed for this key,
     # computed as limit - count_in_window, clamped to [0, limit].
     # Notes:
     # - Does not consider blacklist; a blacklisted key may return a positive number here.
-    # - Does not prune internal state; counts are derived logically via bisect_left.
+    # - Does not prune internal state; expired timestamps are counted from the left and skipped.
+    # - Holds the key's lock stripe, since a concurrent allow() may pop or clear the same deque.
     def remaining(self, key):
-        if key not in self.map:
+        entry = self.state.get(key)
+        if entry is None:
             return self.limit
-        start_window = self.__get_starting_time()
-        arr = self.map[key]
-        i = bisect_left(arr, start_window)
-        current = len(arr) - i
-        return max(0, self.limit - current)
+        arr = entry[0]
+        with self._locks[hash(key) & (_LOCK_STRIPES - 1)]:
+            if not arr:
+                return self.limit
+            start_window = self._window_start_ms()
+            # common case: the oldest stored timestamp is still in the window, so all of them count
+            if arr[0] >= start_window:
+                return max(0, self.limit - len(arr))
+            expired = 0
+            for timestamp in arr:
+                if timestamp >= start_window:
+                    break
+                expired += 1
+            return max(0, self.limit - (len(arr) - expired))
     
     # Returns a list of keys considered "bad actors": those with denied > allowed
-    # according to per-key user_metrics. O(number_of_keys).
+    # according to per-key metrics. O(number_of_keys).
     def bad_actors(self):
         res = []
-        for key, value in self.user_metrics.items():
-            allowed, denied = value
+        for key, entry in self.state.copy().items():
+            _, allowed, denied = entry
             if denied > allowed:
                 res.append(key)
         
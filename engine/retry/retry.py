@@ -1,4 +1,4 @@
-# Retry decorator for synchronous callables.
+# Retry decorator for synchronous and async callables.
 # Provides configurable retry attempts with fixed or exponential backoff.
 #
 # Usage examples
@@ -18,23 +18,46 @@
 # - delay: Initial sleep (in seconds) between failed attempts.
 # - exponential_backoff: When True, doubles the delay after each failed attempt.
 # - exceptions: Tuple of exception types that should trigger a retry.
+# - max_delay: Upper bound (in seconds) on any single sleep; stops exponential growth.
+# - jitter: None (sleep the exact delay), 'full' (uniform in [0, delay]) or 'equal'
+#   (delay/2 plus uniform in [0, delay/2]); randomizing spreads out clients that failed together.
 #
 # Behavior
 # - Calls the wrapped function; on success, returns immediately.
-# - On failure, sleeps for the current delay and optionally doubles it if exponential_backoff is True.
+# - On failure, sleeps for the current delay (capped at max_delay, then jittered) and optionally
+#   doubles it if exponential_backoff is True.
 # - If the last attempt fails (i.e., after max_retries), re-raises the last exception.
 # - Preserves the wrapped function's metadata via functools.wraps.
+# - Coroutine functions get an async wrapper that waits with asyncio.sleep, so backoff releases
+#   the event loop instead of blocking it.
 #
 # Notes & limitations
-# - This implementation is synchronous and uses time.sleep, which blocks the current thread.
-# - There is no jitter or maximum backoff cap.
+# - Synchronous callables wait with time.sleep, which blocks the current thread.
 # - The exceptions parameter restricts which exceptions trigger retries; others are
 #   re-raised immediately without retrying.
 from functools import wraps
 from typing import Callable, Optional, Tuple, Type
+import asyncio
+import random
 import time 
 
-def retry(_func: Optional[Callable] = None, *, max_retries: int = 3, delay: float = .1, exponential_backoff: bool = False, exceptions: Tuple[Type[BaseException], ...] = (Exception,),):
+# Delay actually slept for a nominal backoff delay, per jitter mode.
+def _full_jitter(delay: float) -> float:
+    return random.uniform(0, delay)
+
+def _equal_jitter(delay: float) -> float:
+    return delay / 2 + random.uniform(0, delay / 2)
+
+# Jitter mode -> function applied to each delay (None sleeps the exact delay).
+_JITTERS = {None: None, 'full': _full_jitter, 'equal': _equal_jitter}
+valid_jitters = tuple(_JITTERS)
+
+def retry(_func: Optional[Callable] = None, *, max_retries: int = 3, delay: float = .1, exponential_backoff: bool = False, exceptions: Tuple[Type[BaseException], ...] = (Exception,), max_delay: float = 30.0, jitter: Optional[str] = None,):
+    if jitter not in valid_jitters:
+        raise ValueError("Invalid jitter, must be None, 'full', or 'equal'.")
+    # Resolved once here rather than re-dispatched on every retry.
+    jittered = _JITTERS[jitter]
+
     # Decorator factory: supports both @retry and @retry(...). Returns a decorator that
     # installs retry logic around the target function.
     def decorator(func: Callable):
@@ -42,7 +65,7 @@ def retry(_func: Optional[Callable] = None, *, max_retries: int = 3, delay: floa
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Start with the configured delay and increase it on each failure if exponential_backoff.
-            current_delay = delay
+            current_delay = min(delay, max_delay)
             # Attempt indices: 0..max_retries inclusive -> total attempts = max_retries + 1.
             for attempt in range(max_retries + 1):
                 try:
@@ -53,15 +76,29 @@ def retry(_func: Optional[Callable] = None, *, max_retries: int = 3, delay: floa
                         raise
 
                     # Wait before the next retry attempt.
-                    time.sleep(current_delay)
+                    # time.sleep is looked up per retry (not bound once) so it can be patched after decoration.
+                    time.sleep(jittered(current_delay) if jittered else current_delay)
                     if exponential_backoff:
-                        # Double the delay for the next attempt when backoff is enabled.
-                        current_delay *= 2
-                except Exception:
-                    # Exception not in the retry allowlist; re-raise immediately.
-                    raise
+                        # Double the delay for the next attempt when backoff is enabled, up to max_delay.
+                        current_delay = min(current_delay * 2, max_delay)
+                # Exceptions outside the retry allowlist are not caught and propagate immediately.
         
-        return wrapper
+        # Same retry loop for coroutine functions, awaiting the call and the backoff sleep.
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            current_delay = min(delay, max_delay)
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions:
+                    if attempt == max_retries:
+                        raise
+
+                    await asyncio.sleep(jittered(current_delay) if jittered else current_delay)
+                    if exponential_backoff:
+                        current_delay = min(current_delay * 2, max_delay)
+
+        return async_wrapper if asyncio.iscoroutinefunction(func) else wrapper
     return decorator if _func is None else decorator(_func)
 
     
\ No newline at end of file
@@ -1,46 +1,66 @@
 # Skip List implementation for ordered sets of comparable keys.
 # Structure overview:
-# - Probabilistic multi-level linked structure with horizontal (left/right) and vertical (top/bottom) pointers.
-# - Each level has sentinel endpoints: -inf (left) and +inf (right). All real keys live between them.
-# - Search starts at the top-left sentinel and proceeds right/down, yielding expected O(log N) behavior.
-# - This implementation stores level endpoints in `self.layers` as [neg_sentinel, pos_sentinel] per level.
+# - Probabilistic multi-level linked structure in Pugh's layout: one node per key, holding a tower of
+#   forward pointers (forward[i] is the next node on level i), so descending a level is an index
+#   decrement rather than a pointer chase to a separate node.
+# - Sentinel towers bound every level: head (-inf) on the left and tail (+inf) on the right. All real
+#   keys live between them, so every forward pointer below a node's height is non-None.
+# - Search starts at the head's top level and proceeds right/down, yielding expected O(log N) behavior.
+# - `self.layers` exposes the endpoints [head, tail] per level for compatibility.
 #   Real nodes are linked via pointers and are not stored in arrays per level.
 # - Note: Some utilities here are intentionally minimal and primarily for internal/testing use.
 
+from bisect import bisect_left, bisect_right
 import random
 
+# Batches smaller than this are inserted key by key; larger ones take the sorted finger path.
+_BULK_INSERT_MIN = 16
+
+# Upper bound on recycled nodes kept by a SkipList (deleted towers are reused by later inserts).
+_NODE_POOL_MAX = 4096
+
 class Node:
-	# Node structure representing a skip-list node (tower element).
+	# Node structure representing a skip-list tower.
 	# - data: the comparable key for this node (float('-inf')/float('inf') for sentinels).
-	# - left/right: horizontal neighbors on the same level.
-	# - bottom/top: vertical links to the same key one level below/above (None at bottom/top).
-	left: 'Node | None'
-	right: 'Node | None'
-	bottom: 'Node | None'
-	top: 'Node | None'
-
-	def __init__(self, data, left=None, right=None, bottom=None, top=None):
+	# - forward: next node on each level the tower spans (len(forward) is the tower height).
+	# Slotted: no per-node __dict__, so nodes are smaller and attribute loads in traversals are cheaper.
+	__slots__ = ('data', 'forward')
+
+	forward: 'list[Node | None]'
+
+	def __init__(self, data, height: int = 1):
 		self.data = data
-		self.left = left
-		self.right = right
-		self.bottom = bottom
-		self.top = top
+		self.forward = [None] * height
 
 class SkipList():
+	# Maximum tower height: a tower's level is drawn from MAXLEVEL random bits at once.
+	MAXLEVEL = 16
+
 	# SkipList storing comparable keys.
 	# Fields:
-	# - layers: list of [neg_sentinel, pos_sentinel] for each level (0 = base level).
+	# - head/tail: sentinel towers (-inf / +inf); head spans every level.
 	# - height: number of levels (>= 1 once initialized).
 	# - size: count of real keys at the base level.
 	# - first/last: optional references intended to track the first/last base-level nodes (not fully maintained).
+	# - _node_pool: deleted nodes kept for reuse by insert (at most _NODE_POOL_MAX).
+	# - _sorted_keys: cached to_list() for ceiling/floor; any insert/delete drops it (None) and the next
+	#   range read rebuilds it, so write-only workloads never pay for it.
 	def __init__(self):
-		self.layers = []
+		self._node_pool: list[Node] = []
+		self._sorted_keys = None
+		self.tail = Node(float('inf'))
+		self.head = Node(float('-inf'), 0)
 		self.height = 0
 		self.size = 0
 		self.__create_layer()
 		self.first = None
 		self.last = None
 
+	# Level endpoints [head, tail] for each level (0 = base level).
+	@property
+	def layers(self):
+		return [[self.head, self.tail] for _ in range(self.height)]
+
 	# Return the stored first node reference (or None). Intended as the smallest base-level node.
 	# Note: This field is not robustly maintained by current insert/delete logic.
 	def get_first(self):
@@ -54,267 +74,306 @@ class SkipList():
 	# Return the number of levels currently in the skip list.
 	def get_height(self):
 		return self.height
-	
+
 	# Return the number of elements (keys) stored.
 	def get_size(self):
 		return self.size
-	
+
 	# Return the endpoints [neg_sentinel, pos_sentinel] for a given 1-based level index.
 	# Raises ValueError if the requested level does not exist.
 	def get_layer(self, layer: int):
 		if layer < 1 or layer > self.height:
 			raise ValueError(f"Layer does not exist in skip list, must be between 1 and {self.height}")
-	
-		return self.layers[layer - 1]
-	
+
+		return [self.head, self.tail]
+
 	# Return a minimal snapshot of the internal structure: [layers, height].
 	# Primarily useful for debugging and tests; not a public data export.
 	def get_full_list(self):
 		return [self.layers, self.height]
 
-	# Random coin flip for tower growth during insert (True ~ heads).
-	def __flip_coin(self):
-		return random.randint(0, 1) == 1
-	
+	# Random tower height for insert, geometric(1/2) like repeated coin flips but from one draw:
+	# the position of the lowest set bit among MAXLEVEL random bits (all-zero bits cap at MAXLEVEL).
+	# The height is further capped at log2(size) + 1: a list of N keys only needs about log2(N)
+	# levels, so an unlucky draw on a small list can't add near-empty top levels every search walks.
+	def __random_height(self):
+		bits = random.getrandbits(SkipList.MAXLEVEL)
+		height = (bits & -bits).bit_length() if bits else SkipList.MAXLEVEL
+		cap = self.size.bit_length() + 1
+		return height if height <= cap else cap
+
 	# Clear the data structure to an empty state and reinitialize with a single level of sentinels.
-	# Caution: Current implementation sets self.layers = 0 (int), which will break subsequent list indexing.
-	# Intended behavior would be to reset to an empty list before re-creating the base layer.
 	def clear(self):
-		self.layers = 0
+		self.head = Node(float('-inf'), 0)
 		self.height = 0
+		self.size = 0
+		self._sorted_keys = None
 		self.__create_layer()
 		self.smallest = float('inf')
 		self.largest = float("-inf")
 
-	# Return a list representing the "first layer".
-	# Current behavior: returns [node or node.data for node in self.layers[0]] which are the two sentinels only.
-	# Note: This does not traverse the actual list of values between sentinels; it's mainly a structural peek.
+	# Return the stored keys in ascending order (or their nodes if nodes=True), sentinels excluded.
+	# Walks the base level once into a list preallocated to size; the end is found by identity with
+	# the tail sentinel rather than comparing keys against +inf.
 	def to_list(self, nodes: bool = False):
-		first_layer = self.layers[0]
-		return [node if nodes else node.data for node in first_layer]
-	
-	# Internal: create a new top layer with -inf and +inf sentinels and link them vertically to the layer below.
-	# Called at initialization and during insertion promotion when a new level is needed.
-	def __create_layer(self):
-		is_first_layer = self.height == 0
-		below_left = None if is_first_layer else self.layers[self.height - 1][0]
-		below_right = None if is_first_layer else self.layers[self.height - 1][-1]
-
-		neg_node = Node(float('-inf'), left=None, right=None, bottom=below_left, top=None)
-		pos_node = Node(float('inf'),   left=neg_node, right=None, bottom=below_right, top=None)
-		neg_node.right = pos_node
-
-		if not is_first_layer:
-			below_left.top = neg_node
-			below_right.top = pos_node
+		res = [None] * self.size
+		tail = self.tail
+		node = self.head.forward[0]
+		idx = 0
+		if nodes:
+			while node is not tail:
+				res[idx] = node
+				idx += 1
+				node = node.forward[0]
+		else:
+			while node is not tail:
+				res[idx] = node.data
+				idx += 1
+				node = node.forward[0]
+		return res
 
-		self.layers.append([neg_node, pos_node])
+	# Internal: a node for key with a tower of `height` levels, recycled from the pool when possible.
+	# Stale forward pointers are left in place: insert overwrites every level of the new tower.
+	def _new_node(self, key, height):
+		if not self._node_pool:
+			return Node(key, height)
+		node = self._node_pool.pop()
+		node.data = key
+		forward = node.forward
+		if len(forward) > height:
+			del forward[height:]
+		elif len(forward) < height:
+			forward.extend([None] * (height - len(forward)))
+		return node
+
+	# Internal: add a new top level, linking the head's new top pointer straight to the tail.
+	# Called at initialization and during insertion when a tower is taller than the list.
+	def __create_layer(self):
+		self.head.forward.append(self.tail)
 		self.height += 1
 
-	# Search for a key: proceeds top-down, moving right while right.data < key.
-	# If an exact match is seen at the current level (node.right.data == key), returns that node (which may be above base level).
-	# Otherwise, descends until reaching the base level and returns the predecessor node at that level (data <= key).
-	# Note: Because an exact match can return an upper-level node, callers that need base-level neighbors should adjust.
+	# Search for a key: proceeds top-down, moving right while forward.data < key.
+	# If an exact match is seen at any level, returns that node (a tower spans all of its levels).
+	# Otherwise, descends until reaching the base level and returns the predecessor node (data < key).
 	def search(self, key):
-		node = self.layers[self.height - 1][0]
-		while True:
-			while node.right and node.right.data < key:
-				node = node.right
-			
-			if node.right and node.right.data == key:
-				return node.right
-			
-			if node.bottom:
-				node = node.bottom
-			else:
-				return node
+		node = self.head
+		for level in range(self.height - 1, -1, -1):
+			nxt = node.forward[level]
+			while nxt.data < key:
+				node = nxt
+				nxt = nxt.forward[level]
+
+			if nxt.data == key:
+				return nxt
+
+		return node
 
 	# Internal helper: builds a list of predecessor nodes at each level for a target key.
 	# preds[i] is the predecessor on level i (0 = base). Used by insert/delete to splice links.
 	def __find_predecessors(self, key):
 		# builds table of predecessors at each level
 		preds = [None] * self.height
-		node = self.layers[self.height - 1][0]
-		level = self.height - 1
-		while True:
-			while node.right and node.right.data < key:
-				node = node.right
+		node = self.head
+		for level in range(self.height - 1, -1, -1):
+			nxt = node.forward[level]
+			while nxt.data < key:
+				node = nxt
+				nxt = nxt.forward[level]
 			preds[level] = node
-			if node.bottom:
-				node = node.bottom
-				level -= 1
-			else:
-				break
 		return preds
 
 	# Insert a key:
-	# - Uses predecessors to splice into base level.
-	# - Promotes the node with geometric probability, adding levels as needed.
+	# - Uses predecessors to splice the new tower into every level it spans.
+	# - The tower gets a geometric random height (capped at MAXLEVEL and by size), adding levels as needed.
 	# - Duplicate inserts return the existing node and do not alter size.
 	# Complexity: expected O(log N).
-	# Note: The `first`/`last` updates at the end compare a Node to float sentinels and will not work as intended.
 	def insert(self, key):
 		preds = self.__find_predecessors(key)
-		pred = preds[0]
 
 		# duplicate check
-		if pred.right and pred.right.data == key:
-			return pred.right
-
-		# insert at base level
-		right = pred.right
-		new_node = Node(key, left=pred, right=right, bottom=None, top=None)
-		pred.right = new_node
+		succ = preds[0].forward[0]
+		if succ.data == key:
+			return succ
+
+		height = self.__random_height()
+		while self.height < height:
+			# add new top level and use the head as its predecessor
+			self.__create_layer()
+			preds.append(self.head)
+
+		# every level ends at the tail, so each pred has a successor to take over: no guards needed
+		new_node = self._new_node(key, height)
+		new_forward = new_node.forward
+		for level in range(height):
+			pred_forward = preds[level].forward
+			new_forward[level] = pred_forward[level]
+			pred_forward[level] = new_node
 		self.size += 1
-		if right:
-			right.left = new_node
-
-		# promote with coin flips
-		level = 1
-		lower = new_node
-		while self.__flip_coin():
-			if level >= self.height:
-				# add new top layer and use its -inf as predecessor
-				self.__create_layer()
-				preds.append(self.layers[self.height - 1][0])
-
-			pred = preds[level]
-			right = pred.right
-			upper = Node(key, left=pred, right=right, bottom=lower, top=None)
-			pred.right = upper
-			if right:
-				right.left = upper
-			lower.top = upper
-			lower = upper
-			level += 1
-		
-		# Intended to update first/last: current comparisons won't succeed because they compare Node to float sentinels.
-		if new_node.left == float('-inf'):
-			self.first = new_node
-
-		if new_node.right == float('inf'):
-			self.last = new_node
+		self._sorted_keys = None
 
 		return new_node
-	
+
 	# Containment check for a key. True if an exact match is found at any level; False otherwise.
 	# Complexity: expected O(log N).
 	def contains(self, key):
-		node = self.layers[self.height - 1][0]
-		while True:
-			while node.right and node.right.data < key:
-				node = node.right
-			
-			if node.right and node.right.data == key:
+		node = self.head
+		for level in range(self.height - 1, -1, -1):
+			nxt = node.forward[level]
+			while nxt.data < key:
+				node = nxt
+				nxt = nxt.forward[level]
+
+			if nxt.data == key:
 				return True
-			
-			if node.bottom:
-				node = node.bottom
-			else:
-				return False
 
-	# Delete a key (if present) across all levels, then shrink empty top layers.
+		return False
+
+	# Delete a key (if present) from every level its tower spans, then shrink empty top layers.
 	# Complexity: expected O(log N).
 	def delete(self, key):
 		preds = self.__find_predecessors(key)
-		found = False
-
-		for level in range(self.height - 1, -1, -1):
-			pred = preds[level]
-			curr = pred.right
-			if curr and curr.data == key:
-				found = True
-				forward = curr.right
-				pred.right = forward
-				if forward:
-					forward.left = pred
-				if curr.bottom:
-					curr.bottom.top = None
-				curr.left = curr.right = curr.top = curr.bottom = None
-
-		if not found:
+		curr = preds[0].forward[0]
+		if curr.data != key:
 			return
 
+		for level, nxt in enumerate(curr.forward):
+			preds[level].forward[level] = nxt
+
+		# recycle the detached tower; drop the key so the pool doesn't keep it alive
+		if len(self._node_pool) < _NODE_POOL_MAX:
+			curr.data = None
+			self._node_pool.append(curr)
+
 		self.size -= 1
-		while self.height > 1 and self.layers[-1][0].right is self.layers[-1][-1]:
-			neg, pos = self.layers.pop()
-			self.layers[-1][0].top = None
-			self.layers[-1][-1].top = None
+		self._sorted_keys = None
+		head_forward, tail = self.head.forward, self.tail
+		while self.height > 1 and head_forward[-1] is tail:
+			head_forward.pop()
 			self.height -= 1
 
-	# Bulk insert convenience wrapper. No ordering requirement; duplicates are no-ops.
+	# Bulk insert. No ordering requirement; duplicates are no-ops.
+	# Larger batches are sorted once and spliced in with one finger (last predecessor) per level:
+	# keys arrive in ascending order, so each key only re-walks the few low levels whose finger went
+	# stale instead of descending from the head's top level.
 	def insert_many(self, keys: list):
 		if len(keys) == 0:
 			return
-		
+
+		if len(keys) < _BULK_INSERT_MIN:
+			for key in keys:
+				self.insert(key)
+			return
+
+		self.insert_many_sorted(sorted(keys))
+
+	# Bulk insert of keys already in ascending order (duplicates allowed) using per-level fingers.
+	def insert_many_sorted(self, keys):
+		head = self.head
+		fingers = [head] * self.height
 		for key in keys:
-			self.insert(key)
+			# climb while the finger's successor is still below key; from the first level where it
+			# isn't, that finger and every finger above it are already the key's predecessors
+			top = 0
+			while top < self.height and fingers[top].forward[top].data < key:
+				top += 1
+
+			# re-walk only the stale levels, descending from the highest stale finger
+			node = fingers[top - 1] if top else head
+			for level in range(top - 1, -1, -1):
+				nxt = node.forward[level]
+				while nxt.data < key:
+					node = nxt
+					nxt = nxt.forward[level]
+				fingers[level] = node
+
+			# duplicate check
+			if fingers[0].forward[0].data == key:
+				continue
+
+			height = self.__random_height()
+			while self.height < height:
+				self.__create_layer()
+				fingers.append(head)
+
+			new_node = self._new_node(key, height)
+			new_forward = new_node.forward
+			for level in range(height):
+				pred_forward = fingers[level].forward
+				new_forward[level] = pred_forward[level]
+				pred_forward[level] = new_node
+			self.size += 1
+			self._sorted_keys = None
 
 	# Bulk delete convenience wrapper. Non-existent keys are ignored.
 	def delete_many(self, keys: list):
 		if len(keys) == 0:
 			return
-		
+
 		for key in keys:
 			self.delete(key)
 
+	# Internal: the keys in ascending order, rebuilt from the base level only after a mutation.
+	# Range reads slice this contiguous list instead of chasing forward pointers node by node.
+	def __sorted(self):
+		keys = self._sorted_keys
+		if keys is None:
+			keys = self._sorted_keys = self.to_list()
+		return keys
+
 	# Ceiling utility:
-	# - If is_node=True and an exact match occurs during traversal, returns that node (may be upper level).
-	# - Otherwise, descends and collects node.data from the last traversal point to the right end at base level.
+	# - If is_node=True and an exact match occurs during traversal, returns that node's successor.
+	# - Otherwise, collects node.data from the last traversal point (the predecessor) to the right end at base level.
 	# Note: Semantics here are non-standard for "ceiling" (commonly returns a single key or None).
 	def ceiling(self, key, is_node: bool = False) -> list:
 		# return list of keys >= key or None or starting node where key >= key
-		node = self.layers[self.height - 1][0]
+		if not is_node:
+			# same result as the walk below: from the predecessor (head if none) through the tail
+			keys = self.__sorted()
+			idx = bisect_left(keys, key)
+			res = keys[idx - 1:] if idx else [self.head.data] + keys
+			res.append(self.tail.data)
+			return res
 
-		while True:
-			while node.right and node.right.data < key:
-				node = node.right
+		node = self.head
+
+		for level in range(self.height - 1, -1, -1):
+			nxt = node.forward[level]
+			while nxt.data < key:
+				node = nxt
+				nxt = nxt.forward[level]
 
 			if node.data == key:
 				if is_node:
-					return node.right
+					return nxt
 
-			if node.bottom:
-				node = node.bottom
-			else:
-				break
-		
 		res = []
+		append = res.append
 		while node:
-			res.append(node.data)
-			node = node.right
+			append(node.data)
+			node = node.forward[0]
 
 		return res
-	
+
 	# Floor utility:
-	# - Descends to base level and collects node.data for keys <= given key from the start up to predecessor.
+	# - Collects keys from the start up to, but excluding, the largest key <= given key.
+	# - With no key <= given key, returns every key followed by the tail's +inf.
 	# Note: Semantics here are non-standard for "floor" (commonly returns a single key or None).
 	def floor(self, key) -> list:
-		node = self.layers[self.height - 1][0]
-
-		while True:
-			while node.right and node.right.data <= key:
-				node = node.right   
-
-			if node.bottom:
-				node = node.bottom
-			else:
-				break
-
-		res = []
-		curr = self.layers[0][0]
-		while curr and curr.right and curr.right != node:
-			res.append(curr.right.data)
-			curr = curr.right
+		keys = self.__sorted()
+		idx = bisect_right(keys, key)
+		if idx:
+			return keys[:idx - 1]
 
+		res = keys[:]
+		res.append(self.tail.data)
 		return res
 
 	# Successor utility: returns the data for the node after the predecessor/right neighbor.
 	# Note: Current logic advances two steps in some cases and can skip the true successor or hit +inf.
 	def successor(self, key):
 		pred = self.search(key)
-		curr = pred.right
-		return curr.right.data if curr.right else None
+		nxt = pred.forward[0].forward[0]
+		return nxt.data if nxt else None
 
 	# Predecessor utility: returns the predecessor's data (or the key itself on exact match).
 	# Note: Current logic returns the key itself if an exact match is found (non-standard for predecessor).
@@ -322,11 +381,9 @@ class SkipList():
 		pred = self.search(key)
 		return pred.data if pred else None
 
-	# Merge another skip list's contents into this one by iterating other.
-	# Note: Current implementation does not advance `node` in the loop, which will not terminate.
+	# Merge another skip list's keys into this one; other is left unchanged.
+	# other's base level is already sorted, so its keys go straight to the finger-based bulk insert.
 	def merge(self, other: 'SkipList'):
-		node = other.get_first()
-		while node:
-			self.insert(node.data)
+		self.insert_many_sorted(other.to_list())
 
-		return self.get_full_list()
\ No newline at end of file
+		return self.get_full_list()
@@ -1,13 +1,15 @@
 # Trie implementation specialized for string keys.
 # Each node stores:
 # - char: single character for the edge leading to this node (root has None).
-# - children: dict[char, Node] mapping next character to child node.
+# - children: dict[char, Node] mapping next character to child node. Traversals probe it once per
+#   character with .get() rather than a membership test followed by an index.
 # - is_end: whether this node terminates a stored key.
 #
 # Design notes:
 # - Keys must be non-empty strings. Empty strings are rejected.
 # - Prefix queries treat the empty prefix as invalid (returns False).
-# - Key enumeration uses DFS and returns keys in insertion-agnostic order.
+# - Key enumeration uses an iterative DFS (explicit stack, no recursion limit on key length) and
+#   returns keys in insertion-agnostic order.
 # - This structure is optimized for prefix operations and set-like membership.
 #
 # API overview:
@@ -26,8 +28,7 @@
 # - update(keys: list[str]) -> int:
 #     Insert multiple keys; returns a count of how many were considered "new".
 # - delete(key: str) -> bool:
-#     Remove a key, if present. Returns False for empty key.
-#     Assumes the key exists; deleting a non-existent key may raise KeyError when traversing.
+#     Remove a key, if present. Returns False for empty or missing keys.
 # - longest_prefix_of(key: str) -> str:
 #     Return the longest stored key that is a prefix of 'key'.
 #
@@ -41,7 +42,13 @@
 # - Deletion performs lazy cleanup of orphan nodes on the way back up.
 # - Concurrency is not handled; external synchronization is required for multi-threaded use.
 
+# Upper bound on recycled nodes kept by a Trie (pruned nodes are reused by later inserts).
+_NODE_POOL_MAX = 4096
+
 class Node():
+	# Slotted: no per-node __dict__, which keeps large tries compact.
+	__slots__ = ('char', 'children', 'is_end')
+
 	def __init__(self, char, is_end:bool = False):
 		self.char = char
 		self.children: dict = {}
@@ -51,6 +58,8 @@ class Trie():
 	def __init__(self):
 		self.root = Node(None)
 		self.size = 0
+		# nodes pruned by delete(), kept for reuse by insert() (at most _NODE_POOL_MAX)
+		self._node_pool: list[Node] = []
 	
 	# Return the number of stored keys.
 	def length(self):
@@ -65,6 +74,16 @@ class Trie():
 		self.root = Node(None)
 		self.size = 0
 	
+	# Internal: a fresh node for char, recycled from the pool when possible.
+	def _new_node(self, char, is_end: bool = False):
+		if not self._node_pool:
+			return Node(char, is_end)
+		node = self._node_pool.pop()
+		node.char = char
+		node.children.clear()
+		node.is_end = is_end
+		return node
+
 	# Insert a non-empty key into the trie.
 	# - Raises ValueError if key == "".
 	# - Returns a boolean flag; note that this flag reflects internal state before finalizing
@@ -79,11 +98,12 @@ class Trie():
 		# Walk/create nodes for each character in the key.
 		while idx < len(key):
 			curr_char = key[idx]
-			if curr_char not in curr.children:
+			child = curr.children.get(curr_char)
+			if child is None:
 				is_end = True if idx == len(key) - 1 else False
-				curr.children[curr_char] = Node(key[idx], is_end)
+				child = curr.children[curr_char] = self._new_node(key[idx], is_end)
 			
-			curr = curr.children[curr_char]
+			curr = child
 			idx += 1
 
 		# Determine "newness" based on existing terminal state at the last node.
@@ -103,10 +123,9 @@ class Trie():
 			return False
 
 		for ch in key:
-			if not ch in curr.children:
+			curr = curr.children.get(ch)
+			if curr is None:
 				return False
-			
-			curr = curr.children[ch]
 
 		return curr.is_end
 	
@@ -118,19 +137,17 @@ class Trie():
 		curr = self.root
 		
 		for ch in prefix:
-			if not ch in curr.children:
+			curr = curr.children.get(ch)
+			if curr is None:
 				return False
-			
-			curr = curr.children[ch]
 		
 		return True
 
 	# Return up to 'limit' keys that start with 'prefix'.
 	# - If 'prefix' path is missing, returns [].
 	# - If limit is None, returns all matches.
-	# - If 'prefix' itself is a stored key, it is included only when 'path' is non-empty during DFS.
+	# - If 'prefix' itself is a stored key, it is not included (only strictly longer keys are reported).
 	def keys_with_prefix(self, prefix, limit=None):
-		res: list[str] = []
 		curr = self.root
 
 		if limit is not None and limit <= 0:
@@ -138,50 +155,44 @@ class Trie():
 
 		# Traverse to last char in prefix
 		for ch in prefix:
-			if not ch in curr.children:
+			curr = curr.children.get(ch)
+			if curr is None:
 				return []
-			
-			curr = curr.children[ch]
-
-		if limit is not None and len(res) >= limit:
-			return []
-
-		path: list[str] = []
-		def dfs(node: Node):
-			if limit is not None and len(res) >= limit:
-				return
-		
-			# If node terminates a key and we have collected at least one extra char,
-			# report prefix + path.
-			if node.is_end and path:
-				res.append(prefix + "".join(path))
-				if limit is not None and len(res) >= limit:
-					return
-				
-			for ch, child in node.children.items():
-				path.append(ch)
-				dfs(child)
-				path.pop()
-				if limit is not None and len(res) >= limit:
-					return
 
-		dfs(curr)
-		return res
+		return self.__collect(curr, prefix, limit)
 
 	# Return all keys stored in the trie.
 	def keys(self):
+		return self.__collect(self.root, "", None)
+
+	# Internal: keys below node (excluding node itself), each prefixed with prefix, up to limit.
+	# Iterative pre-order DFS: the stack holds one children iterator per open level and path holds the
+	# characters from node down to the current child, so there is no recursion (and no depth limit).
+	# Each child's own char is its edge label, so iterating values() avoids unpacking (char, child) pairs.
+	def __collect(self, node: Node, prefix: str, limit):
 		res: list[str] = []
-		path: list[str] = []
-
-		def dfs(node: Node):
-			if node.is_end and path:
-				res.append(''.join(path))
-			for ch, child in node.children.items():
-				path.append(ch)
-				dfs(child)
+		append = res.append
+		join = "".join
+		path = [prefix]
+		stack = [iter(node.children.values())]
+		while stack:
+			for child in stack[-1]:
+				path.append(child.char)
+				if child.is_end:
+					append(join(path))
+					if limit is not None and len(res) >= limit:
+						return res
+
+				# descend into the child; its siblings resume from the saved iterator afterwards
+				if child.children:
+					stack.append(iter(child.children.values()))
+					break
+				path.pop()
+			else:
+				# this level is exhausted: drop it and the char of the node it belonged to
+				stack.pop()
 				path.pop()
 
-		dfs(self.root)
 		return res
 	
 	# Bulk insert a list of keys. Returns a count of keys considered "new" by insert().
@@ -194,31 +205,42 @@ class Trie():
 
 		return keys_added
 	
-	# Delete a key. Returns False for empty key.
-	# Assumes the key exists in the trie; if any character path is missing,
-	# traversal will raise a KeyError during access.
+	# Delete a key. Returns True if it was stored, False otherwise (including the empty key).
 	# Performs lazy cleanup: prunes nodes that become non-terminal and childless.
 	def delete(self, key):
 		if key == "":
 			return False
 		
+		# parents[i] is the node whose child along key[i] is on the path, so the pruning pass reads
+		# the edge char back from key itself instead of keeping (parent, char, node) tuples.
 		curr = self.root
-		stack = [] # parent, char, node
+		parents = []
 		for ch in key:
-			stack.append((curr, ch, curr.children[ch]))
-			curr = curr.children[ch]
+			child = curr.children.get(ch)
+			if child is None:
+				return False
+			parents.append(curr)
+			curr = child
+
+		if not curr.is_end:
+			return False
 
 		# Unmark terminal and update size.
 		curr.is_end = False
 		self.size -= 1
 
 		# Prune back up until reaching a branching or terminal node.
-		while stack:
-			parent, ch, curr = stack.pop()
+		idx = len(key)
+		while idx:
 			if curr.children or curr.is_end:
 				break
 
-			del parent.children[ch]
+			idx -= 1
+			parent = parents[idx]
+			del parent.children[key[idx]]
+			if len(self._node_pool) < _NODE_POOL_MAX:
+				self._node_pool.append(curr)
+			curr = parent
 
 		return True
 
@@ -231,11 +253,11 @@ class Trie():
 
 		curr = self.root
 		for ch in key:
-			if ch not in curr.children:
+			curr = curr.children.get(ch)
+			if curr is None:
 				break
 			
 			res.append(ch)
-			curr = curr.children[ch]
 			if curr.is_end:
 				longest = len(res)
 
@@ -0,0 +1,13 @@
+import os
+import sys
+
+# Import paths for the whole suite, set up once before any test module is collected:
+# - the project root, for `from engine.X import Y` imports;
+# - engine/, for the top-level `from X.X import Y` imports. It is appended (not prepended) so
+#   engine's packages never shadow installed ones.
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENGINE_DIR = os.path.join(ROOT_DIR, "engine")
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
@@ -1,15 +1,51 @@
+import ast
 import importlib
 import os
 import sys
 import traceback
 import asyncio
 import inspect
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# Ensure project root is on sys.path so tests can import the `engine` package
+# Same import paths tests/conftest.py sets up under pytest (this runner doesn't load conftest):
+# the project root for `engine.X` imports and engine/ for the top-level `X.X` imports.
+# Worker processes inherit sys.path from this one.
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENGINE_DIR = os.path.join(ROOT_DIR, "engine")
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
+if ENGINE_DIR not in sys.path:
+    sys.path.append(ENGINE_DIR)
 
+# Names of the top-level test functions (sync or async) defined in a test file, in source order.
+# Parses the file instead of importing it, so discovery doesn't pay for the module's imports.
+def _discover(path):
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    return [node.name for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test")]
+
+# Runs the given test functions of one module inside a worker process.
+# Returns (module_name, status, detail) where status is PASSED or FAILED and detail
+# holds the traceback for failures.
+def _run_one(module_name, test_names):
+    try:
+        module = importlib.import_module(module_name)
+        for name in test_names:
+            func = getattr(module, name)
+            # Check if function is async
+            if inspect.iscoroutinefunction(func):
+                asyncio.run(func())
+            else:
+                func()
+
+        return module_name, "PASSED", ""
+
+    except Exception:
+        return module_name, "FAILED", traceback.format_exc()
+
+# Runs each test module in its own worker process so modules execute in parallel and a crash
+# in one module can't take down the others. Results print in completion order.
+# Modules whose source defines no test functions are skipped without being imported.
 def run_all_tests():
     test_dir = os.path.dirname(__file__)
     test_files = [f for f in os.listdir(test_dir) if f.startswith("test_") and f.endswith(".py") and f != "test.py"]
@@ -19,34 +55,41 @@ def run_all_tests():
     failed = 0
     skipped = 0
 
+    to_run = {}
     for file in test_files:
         module_name = file[:-3]
         try:
-            module = importlib.import_module(module_name)
-            print(f"Running {module_name}...")
-            test_funcs = [getattr(module, name) for name in dir(module) if name.startswith("test") and callable(getattr(module, name))]
-
-            if not test_funcs:
-                print(f"{module_name} SKIPPED (no test functions found)")
-                skipped += 1
-                continue
-
-            for func in test_funcs:
-                # Check if function is async
-                if inspect.iscoroutinefunction(func):
-                    asyncio.run(func())
-                else:
-                    func()
-
-            print(f"{module_name} PASSED")
-            passed += 1
-            
-        except Exception:
+            test_names = _discover(os.path.join(test_dir, file))
+        except SyntaxError:
             print(f"{module_name} FAILED")
             traceback.print_exc()
             failed += 1
+            continue
+
+        if not test_names:
+            print(f"{module_name} SKIPPED (no test functions found)")
+            skipped += 1
+            continue
+        to_run[module_name] = test_names
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = {ex.submit(_run_one, name, test_names): name for name, test_names in to_run.items()}
+        for future in as_completed(futures):
+            try:
+                module_name, status, detail = future.result()
+            except Exception:
+                # the worker died (e.g. a crash in an extension module) before returning a result
+                module_name, status, detail = futures[future], "FAILED", traceback.format_exc()
+
+            if status == "PASSED":
+                print(f"{module_name} PASSED")
+                passed += 1
+            else:
+                print(f"{module_name} FAILED")
+                print(detail)
+                failed += 1
 
     print(f"\nSummary: {passed} passed, {failed} failed, {skipped} skipped out of {total}")
 
 if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
+    run_all_tests()
@@ -0,0 +1,110 @@
+import random
+
+from b_tree.b_tree import BTree
+
+# In-order keys, the set of leaf depths, and whether any non-root node is empty.
+def _walk(tree):
+    keys, depths = [], set()
+    empty = False
+
+    def visit(node, depth):
+        nonlocal empty
+        if depth and not node.keys:
+            empty = True
+        if node.leaf:
+            depths.add(depth)
+            keys.extend(node.keys)
+            return
+        assert len(node.children) == len(node.keys) + 1
+        for i, child in enumerate(node.children):
+            visit(child, depth + 1)
+            if i < len(node.keys):
+                keys.append(node.keys[i])
+
+    visit(tree.tree, 0)
+    return keys, depths, empty
+
+def test_random_inserts_keep_tree_balanced():
+    rng = random.Random(7)
+    for m in range(3, 8):
+        tree = BTree(m)
+        inserted = [rng.randrange(10_000) for _ in range(2000)]
+        for key in inserted:
+            tree.insert(key)
+
+        keys, depths, empty = _walk(tree)
+        assert keys == sorted(inserted)
+        assert len(depths) == 1
+        assert not empty
+        # every node holds at most m - 1 keys
+        stack = [tree.tree]
+        while stack:
+            node = stack.pop()
+            assert len(node.keys) <= m - 1
+            stack.extend(node.children)
+
+def test_m_below_three_rejected():
+    try:
+        BTree(2)
+        assert False, "Should raise ValueError for m < 3"
+    except ValueError:
+        pass
+
+def test_search_and_exists():
+    tree = BTree(3)
+    # empty tree
+    assert tree.search(5) is None
+    assert not tree.exists(5)
+
+    # single leaf root
+    tree.insert(5)
+    assert tree.search(5) == 5
+    assert tree.exists(5)
+    assert not tree.exists(4)
+
+    # multi-level: keys found in leaves and internal nodes, misses between and beyond keys
+    for key in range(0, 400, 2):
+        tree.insert(key)
+    assert not tree.tree.leaf
+    for key in range(0, 400, 2):
+        assert tree.search(key) == key
+    assert tree.search(tree.tree.keys[0]) == tree.tree.keys[0]
+    for key in [-1, 1, 201, 399, 400, 10_000]:
+        assert tree.search(key) is None
+        assert not tree.exists(key)
+
+def test_typed_array_keys():
+    from array import array
+
+    rng = random.Random(3)
+    tree = BTree(4, typecode='q')
+    inserted = [rng.randrange(-10**12, 10**12) for _ in range(1000)]
+    for key in inserted:
+        tree.insert(key)
+
+    # splits slice arrays into arrays, and every node (including new roots) keeps the typecode
+    stack = [tree.tree]
+    while stack:
+        node = stack.pop()
+        assert isinstance(node.keys, array) and node.keys.typecode == 'q'
+        stack.extend(node.children)
+
+    keys, depths, empty = _walk(tree)
+    assert keys == sorted(inserted)
+    assert len(depths) == 1 and not empty
+    assert all(tree.exists(key) for key in inserted[:100])
+
+    # keys the typecode can't hold are rejected without changing the tree
+    for bad, error in [(2.5, TypeError), ("x", TypeError), (2**70, OverflowError)]:
+        try:
+            tree.insert(bad)
+            assert False, "Should reject a key that doesn't fit the typecode"
+        except error:
+            pass
+    assert _walk(tree)[0] == sorted(inserted)
+
+if __name__ == "__main__":
+    test_random_inserts_keep_tree_balanced()
+    test_m_below_three_rejected()
+    test_search_and_exists()
+    test_typed_array_keys()
@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from Bitmap.Bitmap import Bitmap
 
 def test_bitmap():
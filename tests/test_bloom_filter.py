@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from bloom_filter.bloom_filter import BloomFilter
 import math
 
@@ -1,9 +1,15 @@
-import datetime
 import math
 import pytest
 
 from engine.CircuitBreaker.CircuitBreaker import CircuitBreaker
 
+CLOSED, HALF_OPEN, OPEN = CircuitBreaker.CLOSED_STATE, CircuitBreaker.HALF_OPEN_STATE, CircuitBreaker.OPEN_STATE
+
+
+def make_cb(key="key", failure_rate=0.5, duration_until_half_opened=5, open_half_calls=2):
+    # Breaker with the settings most tests share; each test overrides only what it exercises.
+    return CircuitBreaker(key, failure_rate, duration_until_half_opened, open_half_calls)
+
 
 def success_func(value=42):
     return value
@@ -15,8 +21,9 @@ def failing_func(exc=ValueError("boom")):
     return _raise
 
 
-def now_ts():
-    return int(datetime.datetime.now().timestamp())
+def _stub_time(cb, now_box):
+    # Replace the breaker's clock with a fixed time in seconds; advance it by assigning to now_box[0].
+    cb._now = lambda: now_box[0]
 
 
 def test_init_validation_failure_rate_bounds():
@@ -36,7 +43,7 @@ def test_init_validation_duration_and_half_calls():
 
 
 def test_closed_success_increments_success_and_returns_result():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=5, open_half_calls=2)
+    cb = make_cb()
     ok, result, err = cb.run(success_func, 123)
     assert ok is True
     assert result == 123
@@ -46,7 +53,7 @@ def test_closed_success_increments_success_and_returns_result():
 
 
 def test_closed_failure_increments_error_and_returns_exception():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=5, open_half_calls=2)
+    cb = make_cb()
     ok, result, err = cb.run(failing_func())
     assert ok is False
     assert result is None
@@ -56,7 +63,7 @@ def test_closed_failure_increments_error_and_returns_exception():
 
 
 def test_closed_opens_when_failure_rate_reaches_threshold():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=5, open_half_calls=2)
+    cb = make_cb()
     # 1 success, 1 failure -> failure rate = 0.5 (>= threshold)
     cb.run(success_func)
     cb.run(failing_func())
@@ -72,18 +79,26 @@ def test_closed_opens_when_failure_rate_reaches_threshold():
 
 
 def test_open_rejects_until_cooldown_then_allows_half_open_probe_success():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=3, open_half_calls=2)
+    cb = make_cb(duration_until_half_opened=3)
+    now = [1_700_000_000]
+    _stub_time(cb, now)
     # Force open now
-    cb.state = CircuitBreaker.OPEN_STATE
-    cb.time_opened = now_ts()
+    cb.state = OPEN
+    cb.time_opened = now[0]
 
     # Before cooldown -> reject
     ok, result, err = cb.run(success_func)
     assert ok is False and result is None and isinstance(err, RuntimeError)
     assert cb.is_open
 
+    # One second short of the cooldown -> still rejected
+    now[0] += cb.duration_until_half_opened - 1
+    ok, result, err = cb.run(success_func)
+    assert ok is False and isinstance(err, RuntimeError)
+    assert cb.is_open
+
     # After cooldown -> transition to half-open and execute once
-    cb.time_opened = now_ts() - cb.duration_until_half_opened - 1
+    now[0] += 1
     ok, result, err = cb.run(success_func, 7)
     assert ok is True and result == 7 and err is None
     assert cb.is_half_open
@@ -91,10 +106,12 @@ def test_open_rejects_until_cooldown_then_allows_half_open_probe_success():
 
 
 def test_half_open_transitions_back_to_open_after_exceeding_probe_limit_with_high_failure_rate():
-    cb = CircuitBreaker("key", failure_rate=0.25, duration_until_half_opened=1, open_half_calls=2)
+    cb = make_cb(failure_rate=0.25, duration_until_half_opened=1)
     # Enter half-open by opening long enough ago
-    cb.state = CircuitBreaker.OPEN_STATE
-    cb.time_opened = now_ts() - cb.duration_until_half_opened - 1
+    now = [1_700_000_000]
+    _stub_time(cb, now)
+    cb.state = OPEN
+    cb.time_opened = now[0] - cb.duration_until_half_opened
 
     # First half-open attempt fails
     ok, result, err = cb.run(failing_func(RuntimeError("fail1")))
@@ -115,9 +132,11 @@ def test_half_open_transitions_back_to_open_after_exceeding_probe_limit_with_hig
 
 
 def test_half_open_transitions_to_closed_on_good_rate_and_executes_closed_call():
-    cb = CircuitBreaker("key", failure_rate=0.6, duration_until_half_opened=1, open_half_calls=2)
-    cb.state = CircuitBreaker.OPEN_STATE
-    cb.time_opened = now_ts() - cb.duration_until_half_opened - 1
+    cb = make_cb(failure_rate=0.6, duration_until_half_opened=1)
+    now = [1_700_000_000]
+    _stub_time(cb, now)
+    cb.state = OPEN
+    cb.time_opened = now[0] - cb.duration_until_half_opened
 
     # Two successful half-open probes
     ok, result, err = cb.run(success_func, 1)
@@ -134,32 +153,35 @@ def test_half_open_transitions_to_closed_on_good_rate_and_executes_closed_call()
 
 
 def test_time_until_half_open():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=10, open_half_calls=1)
+    cb = make_cb(duration_until_half_opened=10, open_half_calls=1)
     assert cb.time_until_half_open() == 0  # closed
-    cb.state = CircuitBreaker.OPEN_STATE
-    cb.time_opened = now_ts() - 8
-    remaining = cb.time_until_half_open()
-    assert remaining in (2, 1, 0)  # allow for runtime jitter within a second or two
+    now = [1_700_000_000]
+    _stub_time(cb, now)
+    cb.state = OPEN
+    cb.time_opened = now[0] - 8
+    assert cb.time_until_half_open() == 2
+    now[0] += 5
+    assert cb.time_until_half_open() == 0
 
 
 def test_metrics_property_reflects_counts_and_rate():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=1, open_half_calls=1)
+    cb = make_cb(duration_until_half_opened=1, open_half_calls=1)
     cb.run(success_func)
     cb.run(success_func)
     cb.run(failing_func())
     m = cb.metrics
-    assert m["state"] == CircuitBreaker.CLOSED_STATE
+    assert m["state"] == CLOSED
     assert m["success"] == 2 and m["error"] == 1
     assert math.isclose(m["failure_rate"], 1/3, rel_tol=0, abs_tol=1e-4)
 
 
 def test_reset_clears_state_and_counters():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=1, open_half_calls=2)
+    cb = make_cb(duration_until_half_opened=1)
     cb.run(success_func)
     cb.run(failing_func())
     # Open it
-    cb.state = CircuitBreaker.OPEN_STATE
-    cb.time_opened = now_ts()
+    cb.state = OPEN
+    cb.time_opened = 1_700_000_000
     # Add some half-open counters too
     cb.half_open_success, cb.half_open_error = 3, 4
 
@@ -171,16 +193,16 @@ def test_reset_clears_state_and_counters():
 
 
 def test_state_properties_flags():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=1, open_half_calls=1)
+    cb = make_cb(duration_until_half_opened=1, open_half_calls=1)
     assert cb.is_closed and not cb.is_open and not cb.is_half_open
-    cb.state = CircuitBreaker.OPEN_STATE
+    cb.state = OPEN
     assert cb.is_open and not cb.is_closed and not cb.is_half_open
-    cb.state = CircuitBreaker.HALF_OPEN_STATE
+    cb.state = HALF_OPEN
     assert cb.is_half_open and not cb.is_open and not cb.is_closed
 
 
 def test_wrap_decorator_success_and_fallback_on_error_and_open():
-    cb = CircuitBreaker("key", failure_rate=0.5, duration_until_half_opened=100, open_half_calls=1)
+    cb = make_cb(duration_until_half_opened=100, open_half_calls=1)
 
     @cb.wrap()
     def plus_one(x):
@@ -192,7 +214,7 @@ def test_wrap_decorator_success_and_fallback_on_error_and_open():
     def fallback(err, *args, **kwargs):
         return "fallback"
 
-    cb2 = CircuitBreaker("key2", failure_rate=0.5, duration_until_half_opened=100, open_half_calls=1)
+    cb2 = make_cb(key="key2", duration_until_half_opened=100, open_half_calls=1)
 
     @cb2.wrap(fallback=fallback)
     def will_fail():
@@ -201,9 +223,11 @@ def test_wrap_decorator_success_and_fallback_on_error_and_open():
     assert will_fail() == "fallback"
 
     # Fallback on open-state rejection
-    cb3 = CircuitBreaker("key3", failure_rate=0.5, duration_until_half_opened=1000, open_half_calls=1)
-    cb3.state = CircuitBreaker.OPEN_STATE
-    cb3.time_opened = now_ts()
+    cb3 = make_cb(key="key3", duration_until_half_opened=1000, open_half_calls=1)
+    now = [1_700_000_000]
+    _stub_time(cb3, now)
+    cb3.state = OPEN
+    cb3.time_opened = now[0]
 
     @cb3.wrap(fallback=fallback)
     def any_func():
@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from ConsistentHashing.ConsistentHashing import ConsistentHashing
 import random
 
@@ -97,11 +95,10 @@ def test_distribution_reasonable_balance_over_many_keys():
     # With 2 servers and 2 vnodes each, distribution over random keys should be roughly balanced
     ch = TestableConsistentHashing(servers=2, virtual_nodes=2)
     random.seed(42)
-    counts = {0: 0, 1: 0}
-    for i in range(2000):
-        k = f"key-{i}".encode()
-        s = ch.insert_data(k)
-        counts[s] += 1
+    keys = [f"key-{i}".encode() for i in range(2000)]
+    counts = [0, 0]
+    for k in keys:
+        counts[ch.insert_data(k)] += 1
     total = counts[0] + counts[1]
     p0 = counts[0] / total
     # Allow wide margin due to small number of vnodes; should not be extremely skewed
@@ -1,5 +1,4 @@
 import sys
-sys.path.append("engine")
 from crdt.crdt import CRDT
 
 def test_crdt():
@@ -36,5 +35,23 @@ def test_crdt():
 
     print("All CRDT tests passed")
 
+def test_converge_deep_chain():
+    # a long run of sequential typing nests each atom under the previous one
+    crdt = CRDT("site1")
+    prev_id = crdt.ROOT_ID
+    for _ in range(sys.getrecursionlimit() + 100):
+        prev_id = crdt.insert_char("x", prev_id).id
+    conv = crdt.converge()
+    assert conv["text"] == "x" * (sys.getrecursionlimit() + 100)
+
+def test_atom_is_slotted():
+    from crdt.schemas import Atom
+    atom = CRDT("site1").insert_char("a", "ROOT")
+    assert isinstance(atom, Atom)
+    if sys.version_info >= (3, 10):
+        assert not hasattr(atom, "__dict__")
+
 if __name__ == "__main__":
     test_crdt()
+    test_converge_deep_chain()
+    test_atom_is_slotted()
@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")  # Adjust based on actual structure
 from rate_limiting.FixedWindowCounter import FixedWindowCounter
 import pytest  # If available, but since others don't use it, maybe not
 
@@ -77,13 +75,8 @@ def test_multiple_keys():
     now = [0]
     _stub_time(fwc, now)
 
-    assert fwc.allow('key1')
-    assert fwc.allow('key1')
-    assert not fwc.allow('key1')  # key1 over
-
-    assert fwc.allow('key2')
-    assert fwc.allow('key2')
-    assert not fwc.allow('key2')  # key2 over
+    assert fwc.allow_batch('key1', 3) == 2  # key1 over
+    assert fwc.allow_batch('key2', 3) == 2  # key2 over
 
     assert fwc.map['key1'] == 2
     assert fwc.map['key2'] == 2
@@ -176,6 +169,80 @@ def test_edge_cases():
     assert fwc.remaining('unseen') == 1
     assert 'unseen' not in fwc.user_metrics
 
+def test_concurrent_allow_counts_every_request():
+    import threading
+    fwc = FixedWindowCounter('day', 50)
+    now = [0]
+    _stub_time(fwc, now)
+
+    def worker(key):
+        for _ in range(100):
+            fwc.allow(key)
+
+    threads = [threading.Thread(target=worker, args=(f"k{i % 4}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert fwc.allowed == 4 * 50
+    assert fwc.denied == 8 * 100 - 4 * 50
+    assert all(fwc.map[f"k{i}"] == 50 for i in range(4))
+
+def test_window_opens_on_first_request():
+    fwc = FixedWindowCounter('second', 1)
+    now = [5000]
+    _stub_time(fwc, now)
+
+    assert fwc.start_window is None
+    assert fwc.get_time_until_reset() == 0
+    assert fwc.allow('k')
+    assert fwc.start_window == 5000
+    now[0] = 5400
+    assert fwc.get_time_until_reset() == 600
+
+def test_allow_batch_matches_repeated_allow():
+    batched = FixedWindowCounter('second', 5)
+    single = FixedWindowCounter('second', 5)
+    now = [0]
+    _stub_time(batched, now)
+    _stub_time(single, now)
+
+    for key, n in [('a', 3), ('a', 4), ('b', 0), ('b', 9), ('a', 1)]:
+        assert batched.allow_batch(key, n) == sum(single.allow(key) for _ in range(n))
+    assert batched.map == single.map == {'a': 5, 'b': 5}
+    assert batched.user_metrics == single.user_metrics
+    assert (batched.allowed, batched.denied) == (single.allowed, single.denied) == (10, 7)
+
+    # a new window admits a full batch again; blacklisted keys are denied outright
+    now[0] = 1001
+    assert batched.allow_batch('a', 2) == 2
+    batched.add_to_blacklist('b')
+    assert batched.allow_batch('b', 4) == 0
+    assert batched.user_metrics['b'] == [5, 8]
+
+    with pytest.raises(ValueError):
+        batched.allow_batch('a', -1)
+
+def test_readers_safe_during_concurrent_new_keys():
+    import threading
+    fwc = FixedWindowCounter('day', 5)
+
+    def worker(t):
+        for i in range(5000):
+            fwc.allow(f"{t}-{i}")
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    # readers iterate while allow() keeps adding keys; they must not raise
+    while any(t.is_alive() for t in threads):
+        fwc.bad_actors()
+        fwc.map
+        fwc.user_metrics
+    for t in threads:
+        t.join()
+    assert len(fwc.user_metrics) == 4 * 5000
+
 def run_all_tests():
     test_initialization_valid()
     test_initialization_invalid_unit()
@@ -189,6 +256,10 @@ def run_all_tests():
     test_bad_actors()
     test_unit_conversions()
     test_edge_cases()
+    test_concurrent_allow_counts_every_request()
+    test_window_opens_on_first_request()
+    test_allow_batch_matches_repeated_allow()
+    test_readers_safe_during_concurrent_new_keys()
     print("All FixedWindowCounter tests passed!")
 
 if __name__ == "__main__":
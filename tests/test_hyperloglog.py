@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from HyperLogLog.HyperLogLog import HyperLogLog, run_tests, _assert_within, _rse
 import math
 import random
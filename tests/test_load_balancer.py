@@ -3,13 +3,9 @@ import asyncio
 import time
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from collections import deque
-from engine.LoadBalancer.LoadBalancer import LoadBalancer
-from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
-from engine.LoadBalancer.RoundRobin import RoundRobin
-from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
-from engine.LoadBalancer.LeastTime import LeastTime
-from engine.LoadBalancer.ServerBuilder import ServerBuilder
-from engine.LoadBalancer.models import Server, Metadata, WeightedRoundRobinRequests
+
+# engine.LoadBalancer imports aiohttp (most of this module's import time), so each test and
+# fixture imports the engine names it uses; collecting or deselecting tests doesn't pay for it.
 
 
 # ============================================================================
@@ -18,6 +14,7 @@ from engine.LoadBalancer.models import Server, Metadata, WeightedRoundRobinReque
 
 @pytest.fixture
 def basic_metadata():
+    from engine.LoadBalancer.models import Metadata
     return Metadata(
         total_requests=0,
         speeds=[],
@@ -31,6 +28,7 @@ def basic_metadata():
 
 @pytest.fixture
 def basic_server(basic_metadata):
+    from engine.LoadBalancer.models import Server
     return Server(
         name="server-1",
         url="http://localhost:5001",
@@ -44,6 +42,7 @@ def basic_server(basic_metadata):
 
 @pytest.fixture
 def server_dict():
+    from engine.LoadBalancer.models import Server, Metadata
     servers = {}
     for i in range(3):
         servers[f"server-{i}"] = Server(
@@ -68,6 +67,7 @@ def server_dict():
 
 @pytest.fixture
 def weighted_server_dict():
+    from engine.LoadBalancer.models import Server, Metadata
     servers = {}
     weights = [5, 3, 2]
     for i, weight in enumerate(weights):
@@ -115,6 +115,7 @@ def mock_response():
 # ============================================================================
 
 def test_server_builder_basic():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").build()
     assert server.name == "test"
     assert server.url == "http://localhost:5000"
@@ -125,16 +126,19 @@ def test_server_builder_basic():
 
 
 def test_server_builder_with_weight():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_weight(5).build()
     assert server.weight == 5
 
 
 def test_server_builder_with_max_connections():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_max_connections(200).build()
     assert server.max_connections == 200
 
 
 def test_server_builder_chaining():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = (ServerBuilder("test", "http://localhost:5000")
               .with_weight(3)
               .with_max_connections(50)
@@ -144,6 +148,7 @@ def test_server_builder_chaining():
 
 
 def test_server_builder_metadata_initialization():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").build()
     assert server.metadata.total_requests == 0
     assert server.metadata.sucess == 0
@@ -153,31 +158,37 @@ def test_server_builder_metadata_initialization():
 
 
 def test_server_builder_with_empty_name():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("", "http://localhost:5000").build()
     assert server.name == ""
 
 
 def test_server_builder_with_empty_url():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "").build()
     assert server.url == ""
 
 
 def test_server_builder_with_negative_weight():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_weight(-5).build()
     assert server.weight == -5
 
 
 def test_server_builder_with_zero_weight():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_weight(0).build()
     assert server.weight == 0
 
 
 def test_server_builder_with_zero_max_connections():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_max_connections(0).build()
     assert server.max_connections == 0
 
 
 def test_server_builder_with_large_weight():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("test", "http://localhost:5000").with_weight(1000000).build()
     assert server.weight == 1000000
 
@@ -187,6 +198,7 @@ def test_server_builder_with_large_weight():
 # ============================================================================
 
 def test_load_balancer_init_least_connections(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     assert lb.strategy == "least_connections"
     assert lb.timeout == 30
@@ -195,55 +207,69 @@ def test_load_balancer_init_least_connections(server_dict):
 
 
 def test_load_balancer_init_round_robin(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     lb = LoadBalancer("round_robin", 30, server_dict, 0.5)
     assert lb.strategy == "round_robin"
     assert isinstance(lb.load_balancer, RoundRobin)
 
 
 def test_load_balancer_init_weighted_round_robin(weighted_server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     lb = LoadBalancer("weighted_round_robin", 30, weighted_server_dict, 0.5)
     assert lb.strategy == "weighted_round_robin"
     assert isinstance(lb.load_balancer, WeightedRoundRobin)
 
 
 def test_load_balancer_init_least_time(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.LeastTime import LeastTime
     lb = LoadBalancer("least_time", 30, server_dict, 0.5)
     assert lb.strategy == "least_time"
     assert isinstance(lb.load_balancer, LeastTime)
 
 
 def test_load_balancer_init_invalid_strategy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(ValueError, match="Error initializing load balancer"):
         LoadBalancer("invalid_strategy", 30, server_dict, 0.5)
 
 
 def test_load_balancer_init_empty_servers():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError, match="must have at least 1 server"):
         LoadBalancer("least_connections", 30, {}, 0.5)
 
 
 def test_load_balancer_init_servers_not_dict(basic_server):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError, match="servers must be a dict"):
         LoadBalancer("least_connections", 30, [basic_server], 0.5)
 
 
 def test_load_balancer_init_servers_wrong_type():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError, match="all items in servers must be Server objects"):
         LoadBalancer("least_connections", 30, {"s1": "not_a_server"}, 0.5)
 
 
 def test_load_balancer_init_with_none_servers():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises((AssertionError, TypeError)):
         LoadBalancer("least_connections", 30, None, 0.5)
 
 
 def test_load_balancer_init_with_single_server(basic_server):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     servers = {"server-1": basic_server}
     lb = LoadBalancer("least_connections", 30, servers, 0.5)
     assert len(lb.servers) == 1
 
 
 def test_load_balancer_init_with_many_servers():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {}
     for i in range(100):
         servers[f"server-{i}"] = ServerBuilder(f"server-{i}", f"http://host{i}:5000").build()
@@ -252,6 +278,7 @@ def test_load_balancer_init_with_many_servers():
 
 
 def test_load_balancer_init_sets_start_time(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     before = time.time()
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     after = time.time()
@@ -259,6 +286,7 @@ def test_load_balancer_init_sets_start_time(server_dict):
 
 
 def test_load_balancer_init_requests_counter_zero(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     assert lb.requests == 0
 
@@ -268,6 +296,7 @@ def test_load_balancer_init_requests_counter_zero(server_dict):
 # ============================================================================
 
 def test_load_balancer_from_config_basic():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'least_connections',
         'timeout': 30,
@@ -285,6 +314,7 @@ def test_load_balancer_from_config_basic():
 
 
 def test_load_balancer_from_config_default_values():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'round_robin',
         'servers': [
@@ -298,6 +328,7 @@ def test_load_balancer_from_config_default_values():
 
 
 def test_load_balancer_from_config_missing_strategy():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'servers': [
             {'name': 'api-1', 'url': 'http://localhost:5001'},
@@ -308,6 +339,7 @@ def test_load_balancer_from_config_missing_strategy():
 
 
 def test_load_balancer_from_config_missing_servers():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'least_connections',
     }
@@ -316,6 +348,7 @@ def test_load_balancer_from_config_missing_servers():
 
 
 def test_load_balancer_from_config_empty_servers_list():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'least_connections',
         'servers': []
@@ -325,6 +358,7 @@ def test_load_balancer_from_config_empty_servers_list():
 
 
 def test_load_balancer_from_config_invalid_server_format():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'least_connections',
         'servers': [
@@ -340,11 +374,13 @@ def test_load_balancer_from_config_invalid_server_format():
 # ============================================================================
 
 def test_load_balancer_len(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     assert len(lb) == 3
 
 
 def test_load_balancer_repr(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     repr_str = repr(lb)
     assert "LoadBalancer" in repr_str
@@ -354,6 +390,7 @@ def test_load_balancer_repr(server_dict):
 
 
 def test_load_balancer_str(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     str_output = str(lb)
     assert isinstance(str_output, str)
@@ -365,6 +402,8 @@ def test_load_balancer_str(server_dict):
 # ============================================================================
 
 def test_load_balancer_add_server(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     new_server = ServerBuilder("server-new", "http://localhost:6000").build()
     lb.add_server("server-new", new_server)
@@ -373,12 +412,15 @@ def test_load_balancer_add_server(server_dict):
 
 
 def test_load_balancer_add_server_not_server_type(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     with pytest.raises(AssertionError, match="failed to add server"):
         lb.add_server("bad", "not_a_server")
 
 
 def test_load_balancer_add_server_key_not_string(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     new_server = ServerBuilder("server-new", "http://localhost:6000").build()
     with pytest.raises(AssertionError, match="server_key must be a string"):
@@ -386,6 +428,8 @@ def test_load_balancer_add_server_key_not_string(server_dict):
 
 
 def test_load_balancer_add_server_duplicate_key(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     new_server = ServerBuilder("server-0", "http://localhost:6000").build()
     lb.add_server("server-0", new_server)
@@ -393,6 +437,7 @@ def test_load_balancer_add_server_duplicate_key(server_dict):
 
 
 def test_load_balancer_add_server_none(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     with pytest.raises(AssertionError):
         lb.add_server("none", None)
@@ -403,6 +448,7 @@ def test_load_balancer_add_server_none(server_dict):
 # ============================================================================
 
 def test_load_balancer_get_healthy_servers(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     healthy = lb.get_healthy_servers()
     assert len(healthy) == 3
@@ -410,6 +456,7 @@ def test_load_balancer_get_healthy_servers(server_dict):
 
 
 def test_load_balancer_get_healthy_servers_with_unhealthy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     server_dict["server-1"].healthy = False
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     healthy = lb.get_healthy_servers()
@@ -418,6 +465,7 @@ def test_load_balancer_get_healthy_servers_with_unhealthy(server_dict):
 
 
 def test_load_balancer_get_healthy_servers_all_unhealthy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     for server in server_dict.values():
         server.healthy = False
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
@@ -426,6 +474,7 @@ def test_load_balancer_get_healthy_servers_all_unhealthy(server_dict):
 
 
 def test_load_balancer_traffic_metrics(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     metrics = lb.traffic_metrics()
     assert "Request Rate" in metrics
@@ -433,6 +482,7 @@ def test_load_balancer_traffic_metrics(server_dict):
 
 
 def test_load_balancer_traffic_metrics_with_active_connections(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     server_dict["server-0"].active_connections = 5
     server_dict["server-1"].active_connections = 3
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
@@ -441,6 +491,7 @@ def test_load_balancer_traffic_metrics_with_active_connections(server_dict):
 
 
 def test_load_balancer_performance_metrics(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     metrics = lb.performance_metrics()
     assert "server-0" in metrics
@@ -449,6 +500,7 @@ def test_load_balancer_performance_metrics(server_dict):
 
 
 def test_load_balancer_performance_metrics_with_data(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     server_dict["server-0"].metadata.total_requests = 100
     server_dict["server-0"].metadata.total_time = 50.0
     server_dict["server-0"].metadata.latency = 0.5
@@ -459,12 +511,14 @@ def test_load_balancer_performance_metrics_with_data(server_dict):
 
 
 def test_load_balancer_health_metrics(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     metrics = lb.health_metrics()
     assert "HEALTHY" in metrics
 
 
 def test_load_balancer_health_metrics_with_unhealthy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     server_dict["server-1"].healthy = False
     server_dict["server-1"].metadata.failure = 10
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
@@ -474,12 +528,14 @@ def test_load_balancer_health_metrics_with_unhealthy(server_dict):
 
 
 def test_load_balancer_health_metrics_all_healthy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     metrics = lb.health_metrics()
     assert metrics.count("HEALTHY") >= 3
 
 
 def test_load_balancer_health_metrics_all_unhealthy(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     for server in server_dict.values():
         server.healthy = False
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
@@ -492,6 +548,7 @@ def test_load_balancer_health_metrics_all_unhealthy(server_dict):
 # ============================================================================
 
 def test_least_connections_init(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     assert lc.servers == server_dict
     assert lc.timeout == 30
@@ -499,6 +556,7 @@ def test_least_connections_init(server_dict):
 
 
 def test_least_connections_next_selects_min_connections(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     server_dict["server-0"].active_connections = 5
     server_dict["server-1"].active_connections = 2
     server_dict["server-2"].active_connections = 8
@@ -508,12 +566,14 @@ def test_least_connections_next_selects_min_connections(server_dict):
 
 
 def test_least_connections_next_all_equal_connections(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     selected = next(lc)
     assert selected in server_dict.keys()
 
 
 def test_least_connections_next_single_server(basic_server):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     servers = {"server-1": basic_server}
     lc = LeastConnectionsLoadBalancing(servers, 30, 0.5)
     selected = next(lc)
@@ -521,6 +581,7 @@ def test_least_connections_next_single_server(basic_server):
 
 
 def test_least_connections_next_all_max_connections(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     for server in server_dict.values():
         server.active_connections = 100
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
@@ -529,6 +590,7 @@ def test_least_connections_next_all_max_connections(server_dict):
 
 
 def test_least_connections_next_consistent_selection_until_change(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     server_dict["server-1"].active_connections = 1
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     selections = [next(lc) for _ in range(5)]
@@ -536,6 +598,7 @@ def test_least_connections_next_consistent_selection_until_change(server_dict):
 
 
 def test_least_connections_next_switches_when_connections_change(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_dict["server-0"].active_connections = 10
     selected1 = next(lc)
@@ -547,6 +610,7 @@ def test_least_connections_next_switches_when_connections_change(server_dict):
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_success(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     
     with patch.object(lc.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -560,6 +624,7 @@ async def test_least_connections_handle_request_success(server_dict, mock_reques
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_increments_connections(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     initial_connections = server_dict[server_key].active_connections
@@ -575,6 +640,7 @@ async def test_least_connections_handle_request_increments_connections(server_di
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_decrements_connections_on_success(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     initial_connections = server_dict[server_key].active_connections
@@ -588,6 +654,7 @@ async def test_least_connections_handle_request_decrements_connections_on_succes
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_decrements_connections_on_error(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     initial_connections = server_dict[server_key].active_connections
@@ -603,6 +670,7 @@ async def test_least_connections_handle_request_decrements_connections_on_error(
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_updates_success_metadata(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     
@@ -616,6 +684,7 @@ async def test_least_connections_handle_request_updates_success_metadata(server_
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_updates_failure_metadata(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     
@@ -631,6 +700,7 @@ async def test_least_connections_handle_request_updates_failure_metadata(server_
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_calculates_latency(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     
@@ -649,6 +719,7 @@ async def test_least_connections_handle_request_calculates_latency(server_dict,
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_updates_health_based_on_success_rate(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     
     with patch.object(lc.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -661,6 +732,7 @@ async def test_least_connections_handle_request_updates_health_based_on_success_
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_marks_unhealthy_on_failures(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     
@@ -678,6 +750,7 @@ async def test_least_connections_handle_request_marks_unhealthy_on_failures(serv
 
 @pytest.mark.asyncio
 async def test_least_connections_handle_request_at_max_connections(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_key = next(lc)
     server_dict[server_key].active_connections = 100
@@ -691,6 +764,7 @@ async def test_least_connections_handle_request_at_max_connections(server_dict,
 # ============================================================================
 
 def test_round_robin_init(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     assert rr.servers == server_dict
     assert len(rr.ordered_servers) == 3
@@ -698,17 +772,20 @@ def test_round_robin_init(server_dict):
 
 
 def test_round_robin_init_creates_ordered_servers(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     assert all(key in server_dict for key in rr.ordered_servers)
 
 
 def test_round_robin_next_rotates_through_servers(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     selections = [next(rr) for _ in range(10)]
     assert len(set(selections)) >= 2
 
 
 def test_round_robin_next_single_server(basic_server):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     servers = {"server-1": basic_server}
     rr = RoundRobin(servers, 30, 0.5)
     selections = [next(rr) for _ in range(5)]
@@ -716,6 +793,7 @@ def test_round_robin_next_single_server(basic_server):
 
 
 def test_round_robin_next_skips_unhealthy_servers(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     server_dict["server-1"].healthy = False
     rr = RoundRobin(server_dict, 30, 0.5)
     selections = [next(rr) for _ in range(10)]
@@ -723,6 +801,7 @@ def test_round_robin_next_skips_unhealthy_servers(server_dict):
 
 
 def test_round_robin_next_skips_at_capacity_servers(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     server_dict["server-1"].active_connections = 100
     rr = RoundRobin(server_dict, 30, 0.5)
     selections = [next(rr) for _ in range(10)]
@@ -730,6 +809,7 @@ def test_round_robin_next_skips_at_capacity_servers(server_dict):
 
 
 def test_round_robin_next_raises_when_no_healthy_servers(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     for server in server_dict.values():
         server.healthy = False
     rr = RoundRobin(server_dict, 30, 0.5)
@@ -738,6 +818,7 @@ def test_round_robin_next_raises_when_no_healthy_servers(server_dict):
 
 
 def test_round_robin_next_raises_when_all_at_capacity(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     for server in server_dict.values():
         server.active_connections = 100
     rr = RoundRobin(server_dict, 30, 0.5)
@@ -746,6 +827,7 @@ def test_round_robin_next_raises_when_all_at_capacity(server_dict):
 
 
 def test_round_robin_next_cycles_correctly(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     first_round = [next(rr) for _ in range(3)]
     second_round = [next(rr) for _ in range(3)]
@@ -754,6 +836,8 @@ def test_round_robin_next_cycles_correctly(server_dict):
 
 
 def test_round_robin_add_server(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     rr = RoundRobin(server_dict, 30, 0.5)
     new_server = ServerBuilder("server-new", "http://localhost:6000").build()
     rr.add_server(new_server)
@@ -761,6 +845,7 @@ def test_round_robin_add_server(server_dict):
 
 
 def test_round_robin_add_server_invalid_type(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     with pytest.raises(AssertionError):
         rr.add_server("not_a_server")
@@ -771,18 +856,21 @@ def test_round_robin_add_server_invalid_type(server_dict):
 # ============================================================================
 
 def test_weighted_round_robin_init(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     assert wrr.servers == weighted_server_dict
     assert len(wrr.ordered_servers) == 3
 
 
 def test_weighted_round_robin_builds_request_data(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     requests_per_round = [req.requests for _, req in wrr.ordered_servers]
     assert 2 in requests_per_round or 5 in requests_per_round
 
 
 def test_weighted_round_robin_next_respects_weights(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     selections = [next(wrr) for _ in range(20)]
     
@@ -794,6 +882,7 @@ def test_weighted_round_robin_next_respects_weights(weighted_server_dict):
 
 
 def test_weighted_round_robin_next_single_server(basic_server):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     servers = {"server-1": basic_server}
     wrr = WeightedRoundRobin(servers, 30, 0.5)
     selected = next(wrr)
@@ -801,6 +890,7 @@ def test_weighted_round_robin_next_single_server(basic_server):
 
 
 def test_weighted_round_robin_next_skips_unhealthy(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     weighted_server_dict["server-1"].healthy = False
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     selections = [next(wrr) for _ in range(10)]
@@ -808,6 +898,7 @@ def test_weighted_round_robin_next_skips_unhealthy(weighted_server_dict):
 
 
 def test_weighted_round_robin_next_skips_at_capacity(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     weighted_server_dict["server-1"].active_connections = 100
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     selections = [next(wrr) for _ in range(10)]
@@ -815,6 +906,7 @@ def test_weighted_round_robin_next_skips_at_capacity(weighted_server_dict):
 
 
 def test_weighted_round_robin_next_raises_when_no_healthy_servers(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     for server in weighted_server_dict.values():
         server.healthy = False
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
@@ -823,6 +915,7 @@ def test_weighted_round_robin_next_raises_when_no_healthy_servers(weighted_serve
 
 
 def test_weighted_round_robin_resets_request_counter(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     for _ in range(30):
         next(wrr)
@@ -832,6 +925,8 @@ def test_weighted_round_robin_resets_request_counter(weighted_server_dict):
 
 
 def test_weighted_round_robin_add_server(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     new_server = ServerBuilder("server-new", "http://localhost:6000").with_weight(4).build()
     wrr.add_server("server-new", new_server)
@@ -840,6 +935,8 @@ def test_weighted_round_robin_add_server(weighted_server_dict):
 
 
 def test_weighted_round_robin_add_server_rebuilds_structure(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     initial_n = wrr.n
     new_server = ServerBuilder("server-new", "http://localhost:6000").with_weight(4).build()
@@ -849,6 +946,7 @@ def test_weighted_round_robin_add_server_rebuilds_structure(weighted_server_dict
 
 
 def test_weighted_round_robin_with_equal_weights(server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(server_dict, 30, 0.5)
     selections = [next(wrr) for _ in range(12)]
     counts = {}
@@ -860,6 +958,8 @@ def test_weighted_round_robin_with_equal_weights(server_dict):
 
 
 def test_weighted_round_robin_with_zero_weight():
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {
         "server-0": ServerBuilder("server-0", "http://localhost:5000").with_weight(0).build(),
         "server-1": ServerBuilder("server-1", "http://localhost:5001").with_weight(1).build(),
@@ -874,6 +974,7 @@ def test_weighted_round_robin_with_zero_weight():
 # ============================================================================
 
 def test_least_time_init(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     assert lt.servers == server_dict
     assert lt.min_response_time == float("inf")
@@ -881,12 +982,14 @@ def test_least_time_init(server_dict):
 
 
 def test_least_time_next_initial_selection_random(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     selected = next(lt)
     assert selected in server_dict.keys()
 
 
 def test_least_time_next_prefers_healthy_servers(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     server_dict["server-2"].healthy = False
     lt = LeastTime(server_dict, 30, 0.5)
     selections = [next(lt) for _ in range(10)]
@@ -894,6 +997,7 @@ def test_least_time_next_prefers_healthy_servers(server_dict):
 
 
 def test_least_time_next_falls_back_when_no_healthy(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     for server in server_dict.values():
         server.healthy = False
     lt = LeastTime(server_dict, 30, 0.5)
@@ -902,6 +1006,7 @@ def test_least_time_next_falls_back_when_no_healthy(server_dict):
 
 
 def test_least_time_next_returns_fastest_after_tracking(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     
     lt.min_response_time = 0.05
@@ -912,6 +1017,7 @@ def test_least_time_next_returns_fastest_after_tracking(server_dict):
 
 
 def test_least_time_finally_after_request_updates_min_time(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     server = server_dict["server-0"]
     server.metadata.latency = 0.03
@@ -924,6 +1030,7 @@ def test_least_time_finally_after_request_updates_min_time(server_dict):
 
 
 def test_least_time_finally_after_request_doesnt_update_for_unhealthy(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     lt.min_response_time = 0.1
     lt.min_response_time_key = "server-0"
@@ -939,6 +1046,7 @@ def test_least_time_finally_after_request_doesnt_update_for_unhealthy(server_dic
 
 
 def test_least_time_finally_after_request_doesnt_update_for_slower(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     lt.min_response_time = 0.03
     lt.min_response_time_key = "server-0"
@@ -954,6 +1062,7 @@ def test_least_time_finally_after_request_doesnt_update_for_slower(server_dict):
 
 
 def test_least_time_tracks_fastest_over_time(server_dict):
+    from engine.LoadBalancer.LeastTime import LeastTime
     lt = LeastTime(server_dict, 30, 0.5)
     
     for i, (key, server) in enumerate(server_dict.items()):
@@ -965,6 +1074,7 @@ def test_least_time_tracks_fastest_over_time(server_dict):
 
 
 def test_least_time_single_server(basic_server):
+    from engine.LoadBalancer.LeastTime import LeastTime
     servers = {"server-1": basic_server}
     lt = LeastTime(servers, 30, 0.5)
     selected = next(lt)
@@ -977,6 +1087,7 @@ def test_least_time_single_server(basic_server):
 
 @pytest.mark.asyncio
 async def test_least_connections_concurrent_requests(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     
     with patch.object(lc.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -995,6 +1106,7 @@ async def test_least_connections_concurrent_requests(server_dict, mock_request,
 
 @pytest.mark.asyncio
 async def test_round_robin_concurrent_requests(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     
     with patch.object(rr.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -1012,6 +1124,7 @@ async def test_round_robin_concurrent_requests(server_dict, mock_request, mock_r
 
 @pytest.mark.asyncio
 async def test_load_balancer_concurrent_handle_incoming_requests(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     
     with patch.object(lb.load_balancer.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -1033,6 +1146,8 @@ async def test_load_balancer_concurrent_handle_incoming_requests(server_dict, mo
 # ============================================================================
 
 def test_load_balancer_with_many_servers():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {}
     for i in range(1000):
         servers[f"server-{i}"] = ServerBuilder(f"server-{i}", f"http://host{i}:5000").build()
@@ -1042,6 +1157,8 @@ def test_load_balancer_with_many_servers():
 
 
 def test_round_robin_with_many_servers():
+    from engine.LoadBalancer.RoundRobin import RoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {}
     for i in range(1000):
         servers[f"server-{i}"] = ServerBuilder(f"server-{i}", f"http://host{i}:5000").build()
@@ -1052,6 +1169,8 @@ def test_round_robin_with_many_servers():
 
 
 def test_weighted_round_robin_with_large_weights():
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {}
     for i in range(10):
         servers[f"server-{i}"] = ServerBuilder(f"server-{i}", f"http://host{i}:5000").with_weight(1000000).build()
@@ -1063,6 +1182,7 @@ def test_weighted_round_robin_with_large_weights():
 
 @pytest.mark.asyncio
 async def test_load_balancer_many_sequential_requests(server_dict, mock_request, mock_response):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     
     with patch.object(lb.load_balancer.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -1079,23 +1199,28 @@ async def test_load_balancer_many_sequential_requests(server_dict, mock_request,
 # ============================================================================
 
 def test_server_with_special_characters_in_name():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     server = ServerBuilder("server@#$%^&*()", "http://localhost:5000").build()
     assert server.name == "server@#$%^&*()"
 
 
 def test_server_with_very_long_name():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     long_name = "s" * 10000
     server = ServerBuilder(long_name, "http://localhost:5000").build()
     assert server.name == long_name
 
 
 def test_server_with_very_long_url():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     long_url = "http://localhost:5000/" + "a" * 10000
     server = ServerBuilder("test", long_url).build()
     assert server.url == long_url
 
 
 def test_load_balancer_with_unicode_server_names():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     servers = {}
     servers["服务器-1"] = ServerBuilder("服务器-1", "http://localhost:5000").build()
     servers["सर्वर-2"] = ServerBuilder("सर्वर-2", "http://localhost:5001").build()
@@ -1105,6 +1230,7 @@ def test_load_balancer_with_unicode_server_names():
 
 
 def test_load_balancer_from_config_with_unicode():
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     config = {
         'strategy': 'least_connections',
         'servers': [
@@ -1116,6 +1242,7 @@ def test_load_balancer_from_config_with_unicode():
 
 
 def test_load_balancer_metrics_with_zero_elapsed_time(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     lb.start_time = time.time()
     metrics = lb.traffic_metrics()
@@ -1123,6 +1250,7 @@ def test_load_balancer_metrics_with_zero_elapsed_time(server_dict):
 
 
 def test_metadata_success_rate_with_zero_requests():
+    from engine.LoadBalancer.models import Metadata
     metadata = Metadata(
         total_requests=0,
         speeds=[],
@@ -1136,6 +1264,7 @@ def test_metadata_success_rate_with_zero_requests():
 
 
 def test_round_robin_with_fluctuating_health(server_dict):
+    from engine.LoadBalancer.RoundRobin import RoundRobin
     rr = RoundRobin(server_dict, 30, 0.5)
     
     selections = []
@@ -1149,6 +1278,7 @@ def test_round_robin_with_fluctuating_health(server_dict):
 
 @pytest.mark.asyncio
 async def test_handle_request_with_timeout_error(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 1, 0.5)
     
     with patch.object(lc.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -1160,6 +1290,7 @@ async def test_handle_request_with_timeout_error(server_dict, mock_request):
 
 @pytest.mark.asyncio  
 async def test_handle_request_with_connection_error(server_dict, mock_request):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     
     with patch.object(lc.session, 'request', new_callable=AsyncMock) as mock_req:
@@ -1174,6 +1305,7 @@ async def test_handle_request_with_connection_error(server_dict, mock_request):
 # ============================================================================
 
 def test_least_connections_selection_is_consistent_with_same_state(server_dict):
+    from engine.LoadBalancer.LeastConnections import LeastConnectionsLoadBalancing
     lc = LeastConnectionsLoadBalancing(server_dict, 30, 0.5)
     server_dict["server-1"].active_connections = 5
     
@@ -1184,6 +1316,7 @@ def test_least_connections_selection_is_consistent_with_same_state(server_dict):
 
 
 def test_metrics_collector_increments_properly(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     lb = LoadBalancer("least_connections", 30, server_dict, 0.5)
     initial_requests = lb.requests
     
@@ -1210,6 +1343,7 @@ def test_server_metadata_accumulates_over_requests(basic_server):
 
 
 def test_weighted_round_robin_request_counter_state(weighted_server_dict):
+    from engine.LoadBalancer.WeightedRoundRobin import WeightedRoundRobin
     wrr = WeightedRoundRobin(weighted_server_dict, 30, 0.5)
     
     for _ in range(5):
@@ -1224,41 +1358,49 @@ def test_weighted_round_robin_request_counter_state(weighted_server_dict):
 # ============================================================================
 
 def test_load_balancer_init_with_string_timeout(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises((TypeError, AssertionError)):
         LoadBalancer("least_connections", "30", server_dict, 0.5)
 
 
 def test_load_balancer_init_with_negative_timeout(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError):
         LoadBalancer("least_connections", -10, server_dict, 0.5)
 
 
 def test_load_balancer_init_with_invalid_healthy_threshold(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError):
         LoadBalancer("least_connections", 30, server_dict, 1.5)
 
 
 def test_load_balancer_init_with_zero_healthy_threshold(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError):
         LoadBalancer("least_connections", 30, server_dict, 0.0)
 
 
 def test_load_balancer_init_with_negative_healthy_threshold(server_dict):
+    from engine.LoadBalancer.LoadBalancer import LoadBalancer
     with pytest.raises(AssertionError):
         LoadBalancer("least_connections", 30, server_dict, -0.5)
 
 
 def test_server_builder_with_none_name():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     with pytest.raises(TypeError):
         ServerBuilder(None, "http://localhost:5000").build()
 
 
 def test_server_builder_with_none_url():
+    from engine.LoadBalancer.ServerBuilder import ServerBuilder
     with pytest.raises(TypeError):
         ServerBuilder("test", None).build()
 
 
 def test_weighted_round_robin_requests_init_with_negative():
+    from engine.LoadBalancer.models import WeightedRoundRobinRequests
     wrr_req = WeightedRoundRobinRequests(requests=-5, request_number=0)
     assert wrr_req.requests == -5
 
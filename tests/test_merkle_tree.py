@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from merkle_tree.merkle_tree import MerkleTree
 from merkle_tree.DiffResult import DiffResult
 
@@ -28,7 +26,7 @@ def test_merkle_tree():
     # append
     new_leaf = mt.append_leaf("e")
     assert mt.size == 4
-    assert new_leaf.content == "e"
+    assert new_leaf == mt.get_node(mt.height() - 1, 3)
 
     # equals
     mt2 = MerkleTree(["a","d","c","e"])
@@ -42,5 +40,88 @@ def test_merkle_tree():
 
     print("All MerkleTree tests passed")
 
+def test_digests_are_raw_bytes():
+    import hashlib
+    mt = MerkleTree(["a", "b"])
+    leaf_a, leaf_b = mt.get_node(1, 0), mt.get_node(1, 1)
+    assert leaf_a == hashlib.sha256(b"a").digest()
+    assert mt.get_root() == hashlib.sha256(leaf_a + leaf_b).digest()
+    assert mt.root_hex() == mt.get_root().hex()
+    assert mt.print_tree(hashes=True)[0] == mt.root_hex()
+    assert mt.get_node(2, 0) is None and mt.get_node(1, 2) is None
+
+def test_incremental_append_matches_rebuild():
+    mt = MerkleTree([])
+    for n in range(1, 20):
+        mt.append_leaf(str(n - 1)) if n % 3 else mt.append_leaves([str(n - 1)])
+        rebuilt = MerkleTree([str(i) for i in range(n)])
+        assert mt.get_root() == rebuilt.get_root()
+        assert mt.digests == rebuilt.digests
+        assert mt.height() == rebuilt.height()
+        assert mt.print_tree(content=True) == rebuilt.print_tree(content=True)
+    new_leaves = mt.append_leaves(["x", "y"])
+    assert new_leaves == [mt.generate_hash("x"), mt.generate_hash("y")]
+    assert mt.get_root() == MerkleTree([str(i) for i in range(19)] + ["x", "y"]).get_root()
+
+def test_parallel_leaf_hashing_matches_serial():
+    import hashlib
+    import merkle_tree.merkle_tree as merkle_module
+    data = ["x" * 4096 + str(i) for i in range(1500)]
+    original = merkle_module.os.cpu_count
+    merkle_module.os.cpu_count = lambda: 4
+    try:
+        digests = MerkleTree([]).hash_leaves(data)
+    finally:
+        merkle_module.os.cpu_count = original
+    assert digests == [hashlib.sha256(s.encode("utf-8")).digest() for s in data]
+
+def test_batched_set_leaf_commits_on_read():
+    data = [str(i) for i in range(9)]
+    mt = MerkleTree(list(data))
+    for i, value in ((0, "x"), (3, "y"), (8, "z"), (3, "w")):
+        assert mt.set_leaf(i, value)
+        data[i] = value
+    assert mt.set_leaf(9, "out of range") is False
+    assert mt.get_root() == MerkleTree(data).get_root()
+    mt.set_leaf(4, "v")
+    data[4] = "v"
+    assert mt.equals(MerkleTree(list(data)))
+
+def test_diff_leaf_indices_across_blocks():
+    data = [str(i) for i in range(300)]
+    changed = list(data)
+    for i in (5, 64, 65, 299):
+        changed[i] = "x"
+    diff = MerkleTree(data).diff(MerkleTree(changed), 10)
+    assert diff.leaf_differing_indices == [5, 64, 65, 299]
+    assert MerkleTree(data).diff(MerkleTree(changed), 2).leaf_differing_indices == [5, 64]
+    assert MerkleTree(data).diff(MerkleTree(changed + ["y", "z"]), 10).leaf_differing_indices == [5, 64, 65, 299, 300, 301]
+
+def test_diff_does_not_rehash_leaves():
+    import merkle_tree.merkle_tree as merkle_module
+    a = MerkleTree([str(i) for i in range(100)])
+    b = MerkleTree([str(i) if i % 10 else "x" for i in range(100)])
+    original = merkle_module.hashlib.sha256
+    merkle_module.hashlib.sha256 = None
+    try:
+        diff = a.diff(b, 100)
+    finally:
+        merkle_module.hashlib.sha256 = original
+    assert diff.leaf_differing_indices == list(range(0, 100, 10))
+
+def test_level_width():
+    mt = MerkleTree(["a", "b", "c", "d", "e"])
+    assert [mt.level_width(level) for level in range(mt.height())] == [1, 2, 3, 5]
+    assert mt.level_width(-1) == -1
+    assert mt.level_width(mt.height()) == -1
+    assert MerkleTree([]).level_width(0) == -1
+
 if __name__ == "__main__":
     test_merkle_tree()
+    test_digests_are_raw_bytes()
+    test_incremental_append_matches_rebuild()
+    test_parallel_leaf_hashing_matches_serial()
+    test_batched_set_leaf_commits_on_read()
+    test_diff_leaf_indices_across_blocks()
+    test_diff_does_not_rehash_leaves()
+    test_level_width()
@@ -1,7 +1,5 @@
-import sys
 import pytest
 
-sys.path.append("engine")
 from Quadtree.Quadtree import Quadtree
 
 
@@ -107,3 +105,24 @@ def test_float_insert_coordinates_allowed():
     pts = qt.query(2, 1)
     assert isinstance(pts, list)
     assert (2.5, 1.5, "f1") in pts
+
+
+def test_quadrant_matches_child_regions():
+    qt = Quadtree(width=8, height=8, max_points=1)
+    qt.root.subdivide()
+    for px, py in [(0, 0), (3.9, 3.9), (4, 0), (0, 4), (4, 4), (7.5, 7.5)]:
+        idx = qt.root.quadrant(px, py)
+        assert qt.root.children[idx].contains(px, py)
+
+
+def test_split_redistributes_into_children():
+    qt = Quadtree(width=8, height=8, max_points=2)
+    qt.insert(1, 1, "bl")
+    qt.insert(6, 6, "tr")
+    qt.insert(6, 1, "br")
+    assert qt.root.points is None
+    bl, br, tl, tr = qt.root.children
+    assert bl.points == [(1, 1, "bl")]
+    assert br.points == [(6, 1, "br")]
+    assert tl.points == []
+    assert tr.points == [(6, 6, "tr")]
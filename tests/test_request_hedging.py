@@ -0,0 +1,120 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from engine.RequestHedging.RequestHedging import RequestHedging
+
+
+# --------------------
+# Fake aiohttp session: each call pops the next (delay, payload) and records the method used
+# --------------------
+class _FakeResponse:
+    def __init__(self, delay, payload):
+        self.delay = delay
+        self.payload = payload
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def raise_for_status(self):
+        if isinstance(self.payload, Exception):
+            raise self.payload
+
+    async def json(self):
+        return self.payload
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, headers):
+        self.calls.append(("GET", url, headers, None))
+        return _FakeResponse(*self.responses.pop(0))
+
+    def post(self, url, json, headers):
+        self.calls.append(("POST", url, headers, json))
+        return _FakeResponse(*self.responses.pop(0))
+
+    async def close(self):
+        self.closed = True
+
+
+def _hedging_with(session, delay=1000):
+    hedging = RequestHedging("http://service/data", delay=delay, timeout=5)
+    hedging.session = session
+    return hedging
+
+
+# --------------------
+# fetch_data
+# --------------------
+def test_fast_primary_sends_no_hedge():
+    session = _FakeSession([(0, {"from": "primary"})])
+    hedging = _hedging_with(session, delay=200000)
+
+    assert asyncio.run(hedging.fetch_data("get", headers={}, body={})) == {"from": "primary"}
+    assert [call[0] for call in session.calls] == ["GET"]
+
+def test_slow_primary_is_hedged_and_faster_response_wins():
+    session = _FakeSession([(1.0, {"from": "primary"}), (0, {"from": "hedge"})])
+    hedging = _hedging_with(session, delay=1000)
+
+    result = asyncio.run(hedging.fetch_data("POST", headers={"x": "1"}, body={"k": "v"}))
+    assert result == {"from": "hedge"}
+    assert session.calls == [("POST", "http://service/data", {"x": "1"}, {"k": "v"})] * 2
+
+def test_failed_winner_falls_back_to_other_request():
+    session = _FakeSession([(0.05, RuntimeError("boom")), (0.1, {"from": "hedge"})])
+    hedging = _hedging_with(session, delay=1000)
+
+    assert asyncio.run(hedging.fetch_data("GET", headers={}, body={})) == {"from": "hedge"}
+
+def test_invalid_method_rejected():
+    hedging = _hedging_with(_FakeSession([]))
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedging.fetch_data("DELETE", headers={}, body={}))
+
+def test_session_reused_across_calls_until_closed():
+    session = _FakeSession([(0, 1), (0, 2)])
+
+    async def run():
+        async with _hedging_with(session, delay=200000) as hedging:
+            assert await hedging.fetch_data("GET", headers={}, body={}) == 1
+            assert await hedging.fetch_data("GET", headers={}, body={}) == 2
+            assert hedging.session is session
+        return hedging
+
+    hedging = asyncio.run(run())
+    assert session.closed and hedging.session is None
+
+
+# --------------------
+# request(): synchronous entry point runs fetch_data and closes its session
+# --------------------
+def test_request_runs_fetch_data_and_closes_session():
+    session = _FakeSession([(1.0, {"from": "primary"}), (0, {"from": "hedge"})])
+    hedging = RequestHedging("http://service/data", delay=1000, timeout=5)
+
+    with mock.patch("aiohttp.TCPConnector"), mock.patch("aiohttp.ClientSession", return_value=session):
+        assert hedging.request("GET", headers=None, body=None) == {"from": "hedge"}
+
+    assert len(session.calls) == 2
+    assert session.closed and hedging.session is None
+
+
+if __name__ == "__main__":
+    test_fast_primary_sends_no_hedge()
+    test_slow_primary_is_hedged_and_faster_response_wins()
+    test_failed_winner_falls_back_to_other_request()
+    test_invalid_method_rejected()
+    test_session_reused_across_calls_until_closed()
+    test_request_runs_fetch_data_and_closes_session()
+    print("All request hedging tests passed!")
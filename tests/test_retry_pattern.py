@@ -295,3 +295,57 @@ def test_state_not_shared_between_calls():
     assert len(sleep_calls) == 2
 
 
+
+
+def test_max_delay_caps_exponential_backoff():
+    sleep_calls = []
+
+    @retry(max_retries=5, delay=1.0, exponential_backoff=True, max_delay=3.0)
+    def always_fail():
+        raise ValueError("fail")
+
+    with patch("time.sleep", side_effect=sleep_calls.append):
+        with pytest.raises(ValueError):
+            always_fail()
+    assert sleep_calls == [1.0, 2.0, 3.0, 3.0, 3.0]
+
+
+def test_jitter_bounds_sleep_durations():
+    for jitter, low in (("full", 0.0), ("equal", 0.5)):
+        sleep_calls = []
+
+        @retry(max_retries=20, delay=1.0, jitter=jitter)
+        def always_fail():
+            raise ValueError("fail")
+
+        with patch("time.sleep", side_effect=sleep_calls.append):
+            with pytest.raises(ValueError):
+                always_fail()
+        assert len(sleep_calls) == 20
+        assert all(low <= d <= 1.0 for d in sleep_calls)
+
+    with pytest.raises(ValueError):
+        retry(jitter="bogus")
+
+
+def test_async_function_retries_without_blocking_sleep():
+    import asyncio
+    sleep_calls = []
+    state = {"n": 0}
+
+    async def fake_sleep(d):
+        sleep_calls.append(d)
+
+    @retry(max_retries=3, delay=0.01, exponential_backoff=True)
+    async def flaky():
+        state["n"] += 1
+        if state["n"] <= 2:
+            raise ValueError("fail")
+        return "ok"
+
+    assert asyncio.iscoroutinefunction(flaky)
+    with patch("time.sleep", side_effect=AssertionError("blocking sleep")):
+        with patch("asyncio.sleep", side_effect=fake_sleep):
+            assert asyncio.run(flaky()) == "ok"
+    assert state["n"] == 3
+    assert sleep_calls == [0.01, 0.02]
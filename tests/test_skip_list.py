@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from skip_list.skip_list import SkipList
 
 def test_skip_list():
@@ -44,5 +42,92 @@ def test_skip_list():
 
     print("All SkipList tests passed")
 
+def test_random_insert_delete_keeps_height_capped():
+    import random
+    sl = SkipList()
+    keys = random.sample(range(100000), 3000)
+    sl.insert_many(keys)
+    assert sl.get_size() == 3000
+    assert 1 <= sl.get_height() <= SkipList.MAXLEVEL
+    assert all(sl.contains(k) for k in keys)
+
+    sl.delete_many(keys[:1500])
+    assert sl.get_size() == 1500
+    assert not any(sl.contains(k) for k in keys[:1500])
+    assert all(sl.contains(k) for k in keys[1500:])
+
+    # deleted towers are recycled by later inserts
+    assert len(sl._node_pool) == 1500
+    assert all(node.data is None for node in sl._node_pool)
+    sl.insert_many(keys[:1500])
+    assert sl._node_pool == []
+    assert sl.get_size() == 3000
+    assert all(sl.contains(k) for k in keys)
+
+def test_to_list_returns_sorted_keys():
+    sl = SkipList()
+    assert sl.to_list() == []
+
+    sl.insert_many([9, 2, 7, 2, 4])
+    assert sl.to_list() == [2, 4, 7, 9]
+    assert [node.data for node in sl.to_list(nodes=True)] == [2, 4, 7, 9]
+
+    sl.delete(7)
+    assert sl.to_list() == [2, 4, 9]
+
+def test_merge_overlapping_lists():
+    sl = SkipList()
+    sl.insert_many(list(range(0, 100, 2)))
+    other = SkipList()
+    other.insert_many(list(range(0, 100, 3)))
+
+    sl.merge(other)
+    assert sl.to_list() == sorted(set(range(0, 100, 2)) | set(range(0, 100, 3)))
+    assert sl.get_size() == len(sl.to_list())
+    assert other.to_list() == list(range(0, 100, 3))
+
+    sl.merge(sl)
+    assert sl.get_size() == len(sl.to_list())
+
+def test_height_grows_with_size():
+    sl = SkipList()
+    for n in range(1, 2049):
+        sl.insert(n)
+        # one level for the first key, then at most log2(size) + 1
+        assert sl.get_height() <= (n - 1).bit_length() + 1
+
+def test_ceiling_floor_track_updates():
+    sl = SkipList()
+    sl.insert_many([10, 20, 30, 40])
+    assert sl.ceiling(25) == [20, 30, 40, float("inf")]
+    assert sl.floor(25) == [10]
+
+    # reads after a mutation see the new keys
+    sl.insert(25)
+    sl.delete(40)
+    assert sl.ceiling(25) == [20, 25, 30, float("inf")]
+    assert sl.floor(25) == [10, 20]
+    assert sl.ceiling(5) == [float("-inf"), 10, 20, 25, 30, float("inf")]
+def test_deleted_tower_is_reused_by_insert():
+    sl = SkipList()
+    sl.insert_many([10, 20, 30])
+    node = sl.search(20)
+    sl.delete(20)
+    assert sl._node_pool == [node]
+
+    # the recycled tower takes the new key and is relinked at its new position on every level
+    sl.insert(25)
+    assert sl._node_pool == []
+    assert sl.search(25) is node
+    assert node.data == 25
+    assert sl.to_list() == [10, 25, 30]
+    assert not sl.contains(20)
+
 if __name__ == "__main__":
     test_skip_list()
+    test_random_insert_delete_keeps_height_capped()
+    test_to_list_returns_sorted_keys()
+    test_merge_overlapping_lists()
+    test_height_grows_with_size()
+    test_ceiling_floor_track_updates()
+    test_deleted_tower_is_reused_by_insert()
@@ -1,5 +1,3 @@
-import sys
-sys.path.append("engine")
 from rate_limiting.SlidingWindow import SlidingWindow
 
 def _stub_time(limiter: SlidingWindow, now_box):
@@ -143,3 +141,101 @@ def test_unit_conversions_minute_hour_day():
     assert sw_day.allow('k')
 
 
+
+
+def test_partial_prune_keeps_in_window_timestamps():
+    sw = SlidingWindow('second', 1, 3)
+    now = [0]
+    _stub_time(sw, now)
+
+    for t in (0, 400, 800):
+        now[0] = t
+        assert sw.allow('p')
+    now[0] = 1200  # start_window = 200: only the t=0 entry has expired
+    assert sw.remaining('p') == 1
+    assert sw.allow('p')
+    assert list(sw.map['p']) == [400, 800, 1200]
+    assert not sw.allow('p')
+    assert len(sw.map['p']) == sw.limit
+
+
+def test_idle_key_state_expires_on_next_access():
+    sw = SlidingWindow('second', 1, 2)
+    now = [0]
+    _stub_time(sw, now)
+
+    assert sw.allow('idle')
+    now[0] = 5000
+    assert sw.allow('idle')
+    assert list(sw.map['idle']) == [5000]
+
+
+def test_get_user_metrics():
+    sw = SlidingWindow('second', 1, 1)
+    now = [0]
+    _stub_time(sw, now)
+
+    assert sw.get_user_metrics('u') == (0, 0)
+    assert sw.allow('u')
+    assert not sw.allow('u')
+    assert not sw.allow('u')
+    assert sw.get_user_metrics('u') == (1, 2)
+
+def test_readers_safe_during_concurrent_new_keys():
+    import threading
+    sw = SlidingWindow('day', 1, 5)
+
+    def worker(t):
+        for i in range(5000):
+            sw.allow(f"{t}-{i}")
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    # readers iterate while allow() keeps adding keys; they must not raise
+    while any(t.is_alive() for t in threads):
+        sw.bad_actors()
+        sw.map
+        sw.user_metrics
+    for t in threads:
+        t.join()
+    assert len(sw.user_metrics) == 4 * 5000
+
+def test_remaining_safe_during_concurrent_allow():
+    import sys
+    import threading
+    import time
+    sw = SlidingWindow('second', 1, 200)
+    now = [0]
+    _stub_time(sw, now)
+    errors = []
+    stop = time.monotonic() + 0.5
+
+    def writer():
+        # 10 ms per request leaves ~100 expired timestamps in the deque for remaining() to walk
+        # while allow() pops and appends
+        while time.monotonic() < stop:
+            now[0] += 10
+            sw.allow('k')
+
+    def reader():
+        try:
+            while time.monotonic() < stop:
+                assert 0 <= sw.remaining('k') <= 200
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    # map hands out copies, so mutating one leaves the limiter untouched
+    sw.map['k'].clear()
+    assert len(sw.map['k']) > 0
@@ -1,13 +1,7 @@
 import pytest
-import sys
-import os
 from collections import deque
 import time
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT_DIR not in sys.path:
-    sys.path.insert(0, ROOT_DIR)
-
 from engine.TaskQueue.TaskQueue import TaskQueue, TaskResult
 
 
@@ -490,9 +484,18 @@ def test_failed_queue_independence():
 
 def test_task_result_dataclass():
     import datetime
-    result = TaskResult(completed_at=datetime.datetime.now(), result="test")
+    import time
+    result = TaskResult(completed_at_ns=time.monotonic_ns(), result="test")
     assert result.result == "test"
     assert isinstance(result.completed_at, datetime.datetime)
+    assert abs((result.completed_at - datetime.datetime.now()).total_seconds()) < 1
+
+
+def test_task_result_completed_at_follows_monotonic_order():
+    import time
+    first = TaskResult(completed_at_ns=time.monotonic_ns(), result=1)
+    second = TaskResult(completed_at_ns=first.completed_at_ns + 1_000_000, result=2)
+    assert (second.completed_at - first.completed_at).total_seconds() == pytest.approx(0.001, abs=1e-5)
 
 
 def test_enqueue_same_task_multiple_times():
@@ -578,3 +581,32 @@ def test_enqueue_with_special_characters_in_kwargs():
     result = tq.dequeue()
     assert result[2] == {"key_with_underscore": 1, "keyWithCamel": 2}
 
+
+
+def test_len_and_priority_after_draining_levels():
+    tq = TaskQueue(priorities=4)
+    def task(n):
+        return n
+    tq.enqueue(3, task, 3)
+    tq.enqueue(1, task, 1)
+    tq.enqueue(1, task, 11)
+    assert len(tq) == 3
+    assert tq.dequeue()[1] == (1,)
+    assert tq.dequeue()[1] == (11,)
+    tq.enqueue(2, task, 2)
+    assert tq.dequeue()[1] == (2,)
+    assert tq.dequeue()[1] == (3,)
+    assert len(tq) == 0
+    assert tq.dequeue() is None
+
+
+def test_enqueue_without_kwargs_shares_read_only_mapping():
+    tq = TaskQueue()
+    def task():
+        return 1
+    tq.enqueue(0, task)
+    tq.enqueue(0, task)
+    first, second = tq.dequeue(), tq.dequeue()
+    assert first[2] is second[2]
+    with pytest.raises(TypeError):
+        first[2]["x"] = 1
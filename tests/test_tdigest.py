@@ -1,12 +1,6 @@
-import sys
-import os
 import math
 from numbers import Number
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT_DIR not in sys.path:
-    sys.path.insert(0, ROOT_DIR)
-
 from engine.TDigest.TDigest import TDigest, Centroid
 
 
@@ -752,3 +746,122 @@ def test_summary_with_negative_values():
     assert summary["min"] == -50
     assert summary["max"] == 49
     assert -5 <= summary["mean"] <= 5
+
+def test_prefix_weights_track_pushes_and_compress():
+    td = TDigest(alpha=10, neighbors=4, compression_factor=2)
+    for i in range(500):
+        td.push(i % 37, weight=(i % 3) + 1)
+        if i % 50 == 0:
+            idx = len(td.centroids) // 2
+            assert td._bit_prefix(idx) == sum(c.weight for c in td.centroids[:idx])
+    td.compress()
+    assert td._bit_prefix(len(td.centroids)) == td.total_weight
+
+def test_quantile_cache_invalidated_by_push():
+    td = TDigest(alpha=100, neighbors=10, compression_factor=5)
+    for i in range(10):
+        td.push(i)
+    before = td.quantile(0.9)
+    assert td.quantile(0.9) == before
+    for _ in range(100):
+        td.push(1000)
+    assert td.quantile(0.9) > before
+    assert td.cdf(9) < 0.5
+
+def test_centroids_sorted_after_queries():
+    td = TDigest(alpha=10, neighbors=4, compression_factor=2)
+    import random
+    rng = random.Random(7)
+    for _ in range(300):
+        td.push(rng.uniform(-50, 50))
+    td.quantile(0.5)
+    means = [c.mean for c in td.centroids]
+    assert means == sorted(means)
+    assert td._means_sorted()
+
+def test_merge_interleaves_in_mean_order():
+    td1 = TDigest(alpha=100, neighbors=10, compression_factor=5)
+    td2 = TDigest(alpha=100, neighbors=10, compression_factor=5)
+    for i in range(0, 20, 2):
+        td1.push(i)
+    for i in range(1, 20, 2):
+        td2.push(i)
+    td1.merge(td2)
+    means = [c.mean for c in td1.centroids]
+    assert means == sorted(means)
+    assert td1.total_weight == 20
+    td1.centroids[-1].weight += 1
+    assert td2.centroids[-1].weight == 1
+
+def test_centroid_has_no_instance_dict():
+    c = Centroid(mean=1.0, weight=1)
+    assert not hasattr(c, "__dict__")
+    assert c == Centroid(mean=1.0, weight=1)
+
+def test_push_beyond_last_mean_appends_in_order():
+    import engine.TDigest.TDigest as tdigest_module
+    for has_key in (True, False):
+        original = tdigest_module._BISECT_HAS_KEY
+        tdigest_module._BISECT_HAS_KEY = has_key
+        try:
+            td = TDigest(alpha=1, neighbors=1, compression_factor=1000)
+            for x in (1.0, 2.0, 3.0):
+                td.push(x)
+            assert [c.mean for c in td.centroids] == [1.0, 2.0, 3.0]
+            assert td._means_sorted()
+        finally:
+            tdigest_module._BISECT_HAS_KEY = original
+
+def test_summary_mean_tracks_push_compress_and_merge():
+    td = TDigest(alpha=5, neighbors=3, compression_factor=2)
+    other = TDigest(alpha=5, neighbors=3, compression_factor=2)
+    for i in range(200):
+        td.push(float(i), weight=1 + i % 3)
+        other.push(float(i) * 0.5)
+    td.merge(other)
+    td.compress()
+    expected = sum(c.mean * c.weight for c in td.centroids) / td.total_weight
+    assert math.isclose(td.summary()["mean"], expected, rel_tol=1e-9)
+
+def test_quantiles_matches_quantile():
+    td = TDigest(alpha=10, neighbors=5, compression_factor=5)
+    for i in range(500):
+        td.push(float((i * 37) % 101))
+    qs = (0, 0.01, 0.25, 0.5, 0.9, 0.99, 1)
+    assert td.quantiles(qs) == [td.quantile(q) for q in qs]
+
+def test_push_merge_keeps_mean_order_without_sorting():
+    import random
+    rng = random.Random(11)
+    td = TDigest(alpha=20, neighbors=8, compression_factor=50)
+    for _ in range(3000):
+        td.push(rng.gauss(0, 1), weight=rng.randint(1, 5))
+        assert td._means_sorted()
+    prefix = 0
+    for i, c in enumerate(td.centroids):
+        assert td._bit_prefix(i) == prefix
+        prefix += c.weight
+
+def test_push_many_matches_sequential_push():
+    import random
+    rng = random.Random(5)
+    xs = [rng.uniform(-10, 10) for _ in range(2000)]
+    weights = [rng.randint(1, 4) for _ in xs]
+    batched = TDigest(alpha=10, neighbors=5, compression_factor=5)
+    sequential = TDigest(alpha=10, neighbors=5, compression_factor=5)
+    batched.push_many(xs, weights)
+    for x, w in zip(xs, weights):
+        sequential.push(x, w)
+    assert [(c.mean, c.weight) for c in batched.centroids] == [(c.mean, c.weight) for c in sequential.centroids]
+    assert (batched.min_value, batched.max_value) == (sequential.min_value, sequential.max_value)
+    assert batched.summary() == sequential.summary()
+
+def test_push_many_nan_and_validation():
+    td = TDigest(alpha=100, neighbors=10, compression_factor=5)
+    td.push_many([1.0, float("nan"), 2.0])
+    assert math.isnan(td.min_value) and math.isnan(td.max_value)
+    try:
+        td.push_many([1.0, 2.0], weights=[1])
+        assert False, "Should have raised AssertionError"
+    except AssertionError:
+        pass
@@ -320,3 +320,76 @@ def test_function_decorator_propagates_non_timeout_exceptions():
         asyncio.run(bad())
 
 
+
+
+# --------------------
+# Deadline runs in the caller's task (no extra Task per call)
+# --------------------
+def test_wrapped_coroutine_runs_in_callers_task():
+    from engine.Timeout import Timeout as timeout_module
+    if timeout_module._deadline is None:
+        pytest.skip("no deadline scope available; falls back to asyncio.wait_for")
+
+    @timeout(seconds=0.5)
+    async def current():
+        return asyncio.current_task()
+
+    async def main():
+        return asyncio.current_task(), await current()
+
+    outer, inner = asyncio.run(main())
+    assert inner is outer
+
+
+# --------------------
+# Non-positive timeouts short-circuit to the timeout path
+# --------------------
+def test_non_positive_timeout_skips_call_and_uses_fallback():
+    calls = []
+    for seconds in (0, -1):
+        @timeout(seconds=seconds, fallback=lambda x: ("fallback", x))
+        async def work(x):
+            calls.append(x)
+            return x
+
+        assert asyncio.run(work(7)) == ("fallback", 7)
+    assert calls == []
+
+
+def test_zero_timeout_class_raises_without_fallback():
+    calls = []
+
+    async def work():
+        calls.append(1)
+
+    wrapped = Timeout(seconds=0)(work)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(wrapped())
+    assert calls == []
+
+
+def test_sync_fallback_returning_coroutine_is_awaited():
+    async def recover(x):
+        return ("recovered", x)
+
+    @timeout(seconds=0.01, fallback=lambda x: recover(x))
+    async def slow(x):
+        await asyncio.sleep(0.1)
+        return x
+
+    assert asyncio.run(slow(3)) == ("recovered", 3)
+
+
+# --------------------
+# Disabled timeouts return the function undecorated
+# --------------------
+def test_no_timeout_returns_function_unwrapped():
+    import math
+
+    async def work(x):
+        return x
+
+    assert Timeout(seconds=None)(work) is work
+    assert Timeout(seconds=math.inf)(work) is work
+    assert timeout(seconds=None)(work) is work
+    assert asyncio.run(timeout(work, seconds=math.inf)(5)) == 5
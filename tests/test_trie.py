@@ -0,0 +1,87 @@
+from trie.trie import Trie
+
+def test_delete_missing_key_returns_false():
+    trie = Trie()
+    trie.update(["app", "apple", "bat"])
+
+    # missing path, path that is only a prefix of stored keys, and empty key
+    assert trie.delete("cat") is False
+    assert trie.delete("ap") is False
+    assert trie.delete("") is False
+    assert trie.length() == 3
+    assert set(trie.keys()) == {"app", "apple", "bat"}
+
+    assert trie.delete("apple") is True
+    assert trie.delete("apple") is False
+    assert trie.contains("app")
+    assert not trie.starts_with("appl")
+    assert trie.length() == 2
+
+def test_keys_enumerate_depth_first_in_insertion_order():
+    trie = Trie()
+    trie.update(["b", "ba", "a", "abc", "ab"])
+
+    # pre-order DFS: a key comes before its extensions, siblings in the order they were first created
+    assert trie.keys() == ["b", "ba", "a", "ab", "abc"]
+    assert trie.keys_with_prefix("a") == ["ab", "abc"]
+    assert trie.keys_with_prefix("") == trie.keys()
+    assert Trie().keys() == []
+
+def test_keys_with_prefix_excludes_prefix_key_itself():
+    trie = Trie()
+    trie.update(["app", "apple", "apply", "bat"])
+
+    assert trie.keys_with_prefix("app") == ["apple", "apply"]
+    assert trie.keys_with_prefix("apple") == []
+    assert trie.keys_with_prefix("cat") == []
+
+def test_keys_with_prefix_limit_truncates():
+    trie = Trie()
+    trie.update(["apple", "apply", "apt", "ape"])
+
+    assert trie.keys_with_prefix("ap", limit=2) == ["apple", "apply"]
+    assert trie.keys_with_prefix("ap", limit=1) == ["apple"]
+    assert trie.keys_with_prefix("ap", limit=10) == ["apple", "apply", "apt", "ape"]
+    assert trie.keys_with_prefix("ap", limit=0) == []
+    assert trie.keys_with_prefix("ap", limit=-1) == []
+
+def test_keys_longer_than_recursion_limit():
+    import sys
+    long_key = "a" * (sys.getrecursionlimit() + 1000)
+    trie = Trie()
+    trie.update([long_key, long_key + "b", "b"])
+
+    assert trie.keys() == [long_key, long_key + "b", "b"]
+    assert trie.keys_with_prefix("a") == [long_key, long_key + "b"]
+    assert trie.keys_with_prefix(long_key) == [long_key + "b"]
+    assert trie.keys_with_prefix("a", limit=1) == [long_key]
+    assert trie.delete(long_key + "b") is True
+    assert trie.keys() == [long_key, "b"]
+def test_deleted_nodes_are_recycled_clean():
+    trie = Trie()
+    trie.update(["cat", "cart"])
+    r_node = trie.root.children["c"].children["a"].children["r"]
+    t_node = r_node.children["t"]
+
+    # deleting "cart" prunes "t" (a terminal) and then "r" (which still points at "t")
+    assert trie.delete("cart") is True
+    assert trie._node_pool == [t_node, r_node]
+
+    # "dog" reuses them (last pruned first) for "d" and "o": no stale children, is_end reset
+    trie.insert("dog")
+    assert trie._node_pool == []
+    d_node = trie.root.children["d"]
+    assert d_node is r_node and d_node.char == "d"
+    assert d_node.children["o"] is t_node and t_node.char == "o"
+    assert list(d_node.children) == ["o"] and d_node.is_end is False
+    assert list(t_node.children) == ["g"] and t_node.is_end is False
+    assert trie.keys() == ["cat", "dog"]
+    assert not trie.contains("d") and not trie.contains("do")
+
+if __name__ == "__main__":
+    test_delete_missing_key_returns_false()
+    test_keys_enumerate_depth_first_in_insertion_order()
+    test_keys_with_prefix_excludes_prefix_key_itself()
+    test_keys_with_prefix_limit_truncates()
+    test_keys_longer_than_recursion_limit()
+    test_deleted_nodes_are_recycled_clean()
@@ -0,0 +1,209 @@
+import pytest
+
+from engine.Voting.plurality import plurality
+from engine.Voting.ApprovalVoting import approval_voting, approval_voting_fast
+from engine.Voting.BordaCount import borda_count, borda_count_fast
+from engine.Voting.rcv import rcv, rcv_fast
+from engine.Voting.Cordorcet import cordorcet, pairwise_matrix, wins
+
+
+# Plurality tests
+def test_plurality_picks_most_votes():
+    assert plurality({"a", "b", "c"}, ["a", "b", "b", "c", "b", "a"]) == "b"
+    assert plurality(["a", "b"], ["a"]) == "a"
+
+def test_plurality_tie_goes_to_first_voted():
+    assert plurality({"a", "b"}, ["b", "a", "a", "b"]) == "b"
+    assert plurality({"a", "b"}, ["a", "b", "b", "a"]) == "a"
+
+def test_plurality_empty_votes_returns_none():
+    assert plurality({"a", "b"}, []) is None
+    assert plurality(set(), []) is None
+
+def test_plurality_rejects_bad_input_types():
+    with pytest.raises(TypeError):
+        plurality("ab", ["a"])
+    with pytest.raises(TypeError):
+        plurality({"a"}, ("a",))
+
+
+# Approval voting: a tie goes to the candidate approved first in ballot order
+def test_approval_voting_tie_goes_to_first_approved():
+    assert approval_voting([["a"], ["b"], ["b"], ["a"]]) == "a"
+    assert approval_voting([["b", "a"], ["a", "b"]]) == "b"
+    assert approval_voting([["a"], ["b", "c"], ["c"]]) == "c"
+
+# Borda count: default points are n-1..0 with n the length of a ballot, not the number of ballots
+def test_borda_default_points_follow_ballot_length():
+    votes = [["a", "b"], ["c", "b"], ["d", "b"]]
+    # with points [1, 0] "a" wins the three-way tie on first places; [2, 1] would hand it to "b"
+    assert borda_count({"a", "b", "c", "d"}, votes) == "a"
+    assert borda_count({"a", "b", "c", "d"}, votes, [1, 0]) == "a"
+    assert borda_count({"a", "b", "c", "d"}, votes, [2, 1]) == "b"
+    assert borda_count_fast(4, [[0, 1], [2, 1], [3, 1]]) == 0
+
+def test_borda_empty_votes():
+    assert borda_count({"a", "b"}, []) == "No Winner"
+    assert borda_count({"a", "b"}, [], [1, 0]) == "No Winner"
+    assert borda_count_fast(2, []) is None
+
+# Dense-id variants must agree with the name-based functions. Ids are handed out in order of first
+# appearance, so "lowest id wins a tie" lines up with "first seen wins a tie".
+def _to_ids(votes):
+    names = list(dict.fromkeys(candidate for ballot in votes for candidate in ballot))
+    ids = {name: i for i, name in enumerate(names)}
+    return names, [[ids[candidate] for candidate in ballot] for ballot in votes]
+
+ELECTIONS = [
+    [["a", "b", "c"], ["b", "c", "a"], ["b", "a", "c"], ["c", "a", "b"], ["a", "c", "b"]],
+    [["a", "b"], ["b", "a"]],
+    [["x", "y", "z"], ["y", "z", "x"], ["z", "x", "y"]],
+    [["a", "b", "c", "d"], ["d", "c", "b", "a"], ["b", "d", "a", "c"], ["d", "a", "c", "b"]],
+]
+
+def test_approval_voting_fast_matches_approval_voting():
+    approvals = [
+        [["a", "b"], ["b"], ["c", "a"], ["b", "c"]],
+        [["a"], ["b"]],
+        [["c", "b"], ["a", "b", "c"], ["a"]],
+    ] + [[ballot[:2] for ballot in election] for election in ELECTIONS]
+    for votes in approvals:
+        names, id_votes = _to_ids(votes)
+        assert names[approval_voting_fast(len(names), id_votes)] == approval_voting(votes)
+
+    assert approval_voting([]) is None and approval_voting_fast(0, []) is None
+    assert approval_voting([[], []]) is None and approval_voting_fast(3, [[], []]) is None
+
+def test_borda_count_fast_matches_borda_count():
+    for votes in ELECTIONS:
+        names, id_votes = _to_ids(votes)
+        assert names[borda_count_fast(len(names), id_votes)] == borda_count(set(names), votes)
+        points = [2 ** i for i in reversed(range(len(votes[0])))]
+        assert names[borda_count_fast(len(names), id_votes, points)] == borda_count(set(names), votes, points)
+
+    assert borda_count(set(), []) == "No Winner"
+    assert borda_count_fast(0, []) is None
+    assert borda_count_fast(3, []) is None
+
+# RCV tests. rcv() numbers candidates in set iteration order and runs rcv_fast, so cases whose
+# outcome depends on elimination order call rcv_fast with explicit ids.
+def test_rcv_first_round_majority():
+    assert rcv({"a", "b", "c"}, [["a", "b"], ["a", "c"], ["b", "a"]]) == "a"
+    assert rcv_fast(3, [[2], [2, 0], [1], [2, 1], [0]]) == 2
+
+def test_rcv_eliminates_and_transfers_votes():
+    # a 2, b 2, c 1: c is eliminated and its ballot moves on to b, giving b 3 of 5
+    assert rcv({"a", "b", "c"}, [["a"], ["a"], ["b"], ["b"], ["c", "b"]]) == "b"
+    # transfers skip candidates eliminated in earlier rounds: 2 goes first (its ballot to 1), then
+    # 3, whose ballots pass over the eliminated 2 and give 1 a 6 of 10 majority over 0
+    votes = [[0], [0], [0], [0], [1], [1], [1], [2, 1], [3, 2, 1], [3, 2, 1]]
+    assert rcv_fast(4, votes) == 1
+
+def test_rcv_exhausted_ballots_drop_out_of_the_count():
+    # "x" is not a candidate and the repeated "c" counts once. b or c goes first and its ballots
+    # have no further choice, so a's 3 votes are a majority of the 5 still counting
+    votes = [["a"], ["a"], ["a"], ["b"], ["b"], ["c"], ["c", "c"], ["x"]]
+    assert rcv({"a", "b", "c"}, votes) == "a"
+    assert rcv_fast(3, [[], [1], [1], [0, 1], [2]]) == 1
+
+def test_rcv_elimination_ties_go_to_lowest_id():
+    # every candidate has one vote: 0 is eliminated first and its ballot transfers to 1
+    assert rcv_fast(3, [[0, 1], [1, 2], [2, 0]]) == 1
+    # 2 and 3 tie for fewest: 2 goes, then 3, then 0 loses the 3-3 tie with 1
+    assert rcv_fast(4, [[0], [0], [0], [1], [1], [2, 1], [3, 2], []]) == 1
+    assert rcv_fast(2, [[0], [1]]) == 1
+    assert rcv_fast(2, [[1], [0]]) == 1
+    assert rcv_fast(1, []) == 0
+    assert rcv_fast(0, []) is None
+
+def test_rcv_empty_candidates_returns_none():
+    assert rcv(set(), []) is None
+    assert rcv(set(), [["a", "b"], ["b"]]) is None
+    assert rcv([], [["a"]]) is None
+
+
+# Condorcet tests
+def test_cordorcet_clear_winner():
+    votes = [["a", "b", "c"], ["a", "c", "b"], ["b", "a", "c"], ["c", "a", "b"]]
+    assert pairwise_matrix(["a", "b", "c"], votes) == [[4, 3, 3], [1, 4, 2], [1, 2, 4]]
+    assert cordorcet(["a", "b", "c"], votes) == "a"
+
+def test_cordorcet_cycle_has_no_winner():
+    votes = [["a", "b", "c"], ["b", "c", "a"], ["c", "a", "b"]]
+    assert pairwise_matrix(["a", "b", "c"], votes) == [[3, 2, 1], [1, 3, 2], [2, 1, 3]]
+    assert cordorcet(["a", "b", "c"], votes) is None
+
+def test_cordorcet_pairwise_tie_goes_to_first_candidate():
+    votes = [["a", "b"], ["b", "a"]]
+    assert pairwise_matrix(["a", "b"], votes) == [[2, 1], [1, 2]]
+    assert cordorcet(["a", "b"], votes) == "a"
+    assert cordorcet(["b", "a"], votes) == "b"
+
+def test_cordorcet_skips_unranked_unknown_and_repeated_names():
+    # "x" is not a candidate, the repeated "b" only counts once, and a ballot ranking only "a"
+    # or only "c" still prefers that candidate over everyone it leaves unranked
+    votes = [["x", "b"], ["b", "b", "a"], ["a"], ["c"]]
+    assert pairwise_matrix(["a", "b", "c"], votes) == [[2, 1, 2], [2, 2, 2], [1, 1, 1]]
+    assert cordorcet(["a", "b", "c"], votes) == "b"
+
+def test_cordorcet_empty_inputs():
+    assert cordorcet([], [["a"]]) is None
+    assert cordorcet(["a", "b"], []) is None
+    assert cordorcet(["a", "b"], [[], []]) is None
+
+def test_pairwise_matrix_agrees_with_wins():
+    candidates = ["a", "b", "c", "d"]
+    votes = [
+        ["a", "b", "c", "d"], ["d", "c", "b", "a"], ["b", "d"], ["c", "x", "a"],
+        ["d", "d", "a", "b"], [], ["x"], ["b", "a", "b", "c"], ["c", "b", "d", "a"],
+    ]
+    prefs = pairwise_matrix(candidates, votes)
+    for i, c1 in enumerate(candidates):
+        for j, c2 in enumerate(candidates):
+            if i != j:
+                assert wins(c1, c2, votes) == (prefs[i][j] >= prefs[j][i]), (c1, c2)
+
+
+# non_winners pruning: a candidate strictly beaten by a scanned candidate is never scanned itself
+def test_cordorcet_returns_none_once_every_candidate_is_pruned():
+    # "a" beats "b" (pruning it) and loses to "c"; "c" then loses to the already pruned "b"
+    votes = [["a", "b", "c"], ["b", "c", "a"], ["c", "a", "b"]]
+    assert cordorcet(["a", "b", "c"], votes) is None
+    assert cordorcet(["c", "b", "a"], votes) is None
+
+def test_cordorcet_winner_is_last_candidate_scanned():
+    # "a" prunes "b" and is beaten by "c", so "c" is the only candidate left to scan and wins
+    votes = [["c", "a", "b"], ["c", "a", "b"], ["a", "b", "c"]]
+    assert cordorcet(["a", "b", "c"], votes) == "c"
+
+def test_cordorcet_pairwise_tie_does_not_prune():
+    # "a" ties "b" and loses to "c"; "b" must still be scanned, and beats "c"
+    votes = [["b", "c", "a"], ["c", "a", "b"], ["b", "c", "a"], ["a", "b", "c"]]
+    assert cordorcet(["a", "b", "c"], votes) == "b"
+
+
+if __name__ == "__main__":
+    test_plurality_picks_most_votes()
+    test_plurality_tie_goes_to_first_voted()
+    test_plurality_empty_votes_returns_none()
+    test_plurality_rejects_bad_input_types()
+    test_approval_voting_tie_goes_to_first_approved()
+    test_borda_default_points_follow_ballot_length()
+    test_borda_empty_votes()
+    test_approval_voting_fast_matches_approval_voting()
+    test_borda_count_fast_matches_borda_count()
+    test_rcv_first_round_majority()
+    test_rcv_eliminates_and_transfers_votes()
+    test_rcv_exhausted_ballots_drop_out_of_the_count()
+    test_rcv_elimination_ties_go_to_lowest_id()
+    test_rcv_empty_candidates_returns_none()
+    test_cordorcet_clear_winner()
+    test_cordorcet_cycle_has_no_winner()
+    test_cordorcet_pairwise_tie_goes_to_first_candidate()
+    test_cordorcet_skips_unranked_unknown_and_repeated_names()
+    test_cordorcet_empty_inputs()
+    test_pairwise_matrix_agrees_with_wins()
+    test_cordorcet_returns_none_once_every_candidate_is_pruned()
+    test_cordorcet_winner_is_last_candidate_scanned()
+    test_cordorcet_pairwise_tie_does_not_prune()
+    print("All voting tests passed!")
@@ -1,15 +1,9 @@
 import pytest
-import sys
-import os
 import asyncio
 import datetime
 import time
 from collections import deque
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if ROOT_DIR not in sys.path:
-    sys.path.insert(0, ROOT_DIR)
-
 from engine.TaskQueue.TaskQueue import TaskQueue, TaskResult
 from engine.TaskQueue.Worker import Worker
 
@@ -865,3 +859,47 @@ async def test_lambda_task_execution():
     if len(worker.results) > 0:
         assert worker.results[0].result == 42
 
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_wakes_on_enqueue_and_stops_promptly():
+    tq = TaskQueue()
+    worker = Worker(task_queue=tq, max_results=10, max_retries=3)
+
+    task_obj = asyncio.create_task(worker.execute_tasks())
+    await asyncio.sleep(0.05)
+
+    # enqueue from another thread while the worker is idle
+    await asyncio.to_thread(tq.enqueue, 0, lambda: "woken")
+    await asyncio.sleep(0.1)
+    assert len(worker.results) == 1
+    assert worker.results[0].result == "woken"
+
+    worker.stop()
+    await asyncio.wait_for(task_obj, timeout=1.0)
+    assert task_obj.done()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_slots_run_tasks_in_parallel():
+    tq = TaskQueue()
+    worker = Worker(task_queue=tq, max_results=10, max_retries=3, concurrency=4)
+
+    def slow(n):
+        time.sleep(0.2)
+        return n
+
+    for i in range(4):
+        tq.enqueue(0, slow, i)
+
+    task_obj = asyncio.create_task(worker.execute_tasks())
+    await asyncio.sleep(0.35)
+    assert sorted(r.result for r in worker.results) == [0, 1, 2, 3]
+    worker.stop()
+    await asyncio.wait_for(task_obj, timeout=1.0)
+
+
+def test_worker_initialization_with_zero_concurrency():
+    tq = TaskQueue()
+    with pytest.raises(AssertionError):
+        Worker(task_queue=tq, max_results=10, max_retries=3, concurrency=0)